@@ -1,5 +1,6 @@
 import streamlit as st
 from src.viz.diagrams import build_architecture_diagram
+from src.viz.render_cache import show_diagram
 
 st.set_page_config(page_title="Architecture", page_icon="🌐", layout="wide", initial_sidebar_state="collapsed")
 
@@ -21,7 +22,7 @@ st.link_button("← Back to home", "/")
 st.title("Architecture walkthrough")
 st.caption("Click through each stage to see what happens from code commit to scheduled runs.")
 
-st.graphviz_chart(build_architecture_diagram())
+show_diagram(build_architecture_diagram)
 
 st.subheader("Stages (click to expand)")
 
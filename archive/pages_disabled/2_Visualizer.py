@@ -1,45 +1,138 @@
+import io
+
 import streamlit as st
-from src.pipelines.definitions import PIPELINES
-from src.viz.graphviz_dag import build_graph
-from src.utils.text import MAPPING_MARKDOWN
+from src.models import PipelineDef
+from src.pipelines.catalog import default_catalog
+from src.pipelines.diff import diff_pipelines
+from src.pipelines.timing import critical_path, load_step_metrics
+from src.pipelines.kfp_spec import load_pipeline_spec
+from src.pipelines.search import default_index
+from src.pipelines.validate import validate_pipeline
+from src.viz.graphviz_dag import build_diff_graph, build_graph, pipeline_svg, timing_overlay
+from src.viz.lod import LodRenderer, build_lod_graph
+from src.viz.render_cache import show_diagram
+from src.utils.text import MAPPING_MARKDOWN, spec_tables
+
+
+def _named(upload_name: str, upload: bytes) -> io.BytesIO:
+    source = io.BytesIO(upload)
+    source.name = upload_name
+    return source
+
+
+@st.cache_data(max_entries=16, show_spinner="Parsing the pipeline spec…")
+def parse_spec(upload_name: str, upload: bytes) -> PipelineDef:
+    """``load_pipeline_spec`` of an upload, parsed once per file content rather than on every rerun."""
+    return load_pipeline_spec(_named(upload_name, upload))
+
+
+@st.cache_data(max_entries=16, show_spinner="Reading the run history…")
+def step_metrics(upload_name: str, upload: bytes, pipeline: str) -> dict:
+    return load_step_metrics(_named(upload_name, upload), pipeline=pipeline)
+
 
 st.title("Pipeline Visualizer")
 st.caption("Explore pipeline shapes and map steps to real execution concepts.")
 st.markdown(MAPPING_MARKDOWN)
 
-st.sidebar.header("Pipeline")
-pattern = st.sidebar.selectbox("Pattern", list(PIPELINES.keys()), index=0)
+catalog = default_catalog()
 
-PATTERN_SUMMARIES = {
-    "Simple ETL": "Baseline extract → validate → transform → load flow.",
-    "Incremental Load": "Watermark-driven delta processing with idempotent merges.",
-    "Backfill": "Partitioned reprocessing with metrics at the end.",
-    "CDC Merge": "Change feed plus de-duplication before merge.",
-    "Snapshot Diff": "Full snapshot compare with applied deltas.",
-}
+st.sidebar.header("Pipeline")
+query = st.sidebar.text_input("Search by name, annotation or image", "")
+matches = catalog.search(query)
+if not matches:
+    st.sidebar.info(f"No pipelines match {query.strip()!r}.")
+pattern = st.sidebar.selectbox("Pattern", matches, index=0)
+for path, reason in catalog.skipped:
+    st.sidebar.warning(f"Skipped catalog file {path.name}: {reason}")
 
-st.sidebar.subheader("Pattern summary")
-st.sidebar.markdown(PATTERN_SUMMARIES.get(pattern, "Pipeline pattern overview."))
+if pattern is not None:
+    st.sidebar.subheader("Pattern summary")
+    st.sidebar.markdown(catalog.entry(pattern).summary or "Pipeline pattern overview.")
 
 st.sidebar.header("View")
 view = st.sidebar.selectbox("Diagram view", ["Basic", "Annotated"], index=0)
 annotated = view == "Annotated"
+engine = st.sidebar.selectbox("Layout engine", ["auto", "dot", "layered"], index=0)
 
-p = PIPELINES[pattern]
+st.sidebar.header("Compiled spec")
+uploaded = st.sidebar.file_uploader("Load a KFP v2 pipeline spec", type=["yaml", "yml", "json"])
 
-tab_dag, tab_spec = st.tabs(["DAG", "Spec (V0)"])
+st.sidebar.header("Run history")
+history = st.sidebar.file_uploader("Per-step durations/costs", type=["csv", "jsonl", "parquet"])
 
-@st.cache_data
-def get_graph(name: str, annotated_flag: bool):
-    return build_graph(PIPELINES[name], annotated_flag)
+if uploaded is None and pattern is None:
+    st.info("No pipeline selected: change the search or load a compiled spec.")
+    st.stop()
+p = parse_spec(uploaded.name, uploaded.getvalue()) if uploaded is not None else catalog[pattern]
+
+tab_dag, tab_spec, tab_diff, tab_search = st.tabs(["DAG", "Spec (V0)", "Diff", "Search"])
 
 with tab_dag:
-    st.graphviz_chart(get_graph(pattern, annotated))
+    report = validate_pipeline(p)
+    if report.diagnostics:
+        summary = f"{len(report.errors)} error(s), {len(report.warnings)} warning(s) in this pipeline"
+        (st.error if report.errors else st.warning)(summary)
+        with st.expander("Validation details"):
+            st.dataframe(report.records(), use_container_width=True)
+    if any(s.group for s in p.steps):
+        # Grouped pipelines (sub-DAGs, ParallelFor) render with collapsible groups.
+        if history is not None:
+            st.info("The run-history timing overlay is not drawn for pipelines with groups.")
+        lod = st.session_state.get("lod")
+        if lod is None or lod.annotated != annotated or lod.p.content_hash != p.content_hash:
+            lod = LodRenderer(p, annotated)
+            st.session_state["lod"] = lod
+        expanded = st.multiselect("Expand groups", sorted(lod.groups))
+        open_groups = sorted(lod.effective_expanded(expanded))
+        show_diagram(build_lod_graph, lod, open_groups)
+    elif history is not None:
+        metrics = step_metrics(history.name, history.getvalue(), p.name)
+        try:
+            cp = critical_path(p, {step_id: m.duration_s for step_id, m in metrics.items()})
+        except ValueError as exc:
+            cycles = [d.message for d in report.errors if d.code == "cycle"]
+            st.error("No timing overlay: " + ("; ".join(cycles) or str(exc)))
+            st.image(pipeline_svg(p, annotated, engine=engine).decode("utf-8"))
+        else:
+            node_attrs, edge_attrs = timing_overlay(metrics, cp)
+            st.caption(f"Critical path ({cp.makespan_s:.0f}s): " + " → ".join(cp.path))
+            show_diagram(build_graph, p, annotated, node_attrs, edge_attrs)
+    else:
+        st.image(pipeline_svg(p, annotated, engine=engine).decode("utf-8"))
 
 with tab_spec:
+    rows, edges_text = spec_tables(p)
     st.subheader("Steps")
-    st.table(
-        [{"step": s.id, "description": s.description, "annotation": s.annotation or ""} for s in p.steps]
-    )
+    st.table(rows)
     st.subheader("Edges")
-    st.code("\n".join([f"{a} -> {b}" for a, b in p.edges]))
+    st.code(edges_text)
+
+with tab_diff:
+    base_name = st.selectbox("Compare against", catalog.names(), index=0)
+    base_upload = st.file_uploader("…or a previous compiled spec", type=["yaml", "yml", "json"], key="diff_base")
+    base = parse_spec(base_upload.name, base_upload.getvalue()) if base_upload is not None else catalog[base_name]
+    diff = diff_pipelines(base, p)
+    st.write(", ".join(f"{count} {what}" for what, count in diff.summary().items()))
+    show_diagram(build_diff_graph, diff, annotated)
+
+with tab_search:
+    search = st.text_input(
+        "Find steps or paths",
+        "",
+        help="Words match step ids, descriptions, annotations and images (e.g. `annotation:bigquery`). "
+        "Chain terms with `->` (direct edge) or `->>` (anywhere downstream); `*` is any step, "
+        "e.g. `Validate ->> annotation:bigquery`.",
+    )
+    if search.strip():
+        index = default_index()
+        try:
+            if "->" in search:
+                rows = [{"pipeline": m.pipeline, "path": " → ".join(m.steps)} for m in index.query(search, limit=500)]
+            else:
+                rows = [{"pipeline": name, "step": step} for name, step in index.steps(search)]
+        except ValueError as exc:
+            st.error(str(exc))
+        else:
+            st.caption(f"{len(rows)} match(es)")
+            st.dataframe(rows, use_container_width=True)
@@ -1,6 +1,7 @@
-from pathlib import Path
 import streamlit as st
+from src.utils.content import content_markdown
 from src.viz.diagrams import build_cicd_cycle_diagram
+from src.viz.render_cache import show_diagram
 
 st.title("CI/CD Flow (GitHub → Cloud Build → Vertex Pipelines)")
 st.caption("A branch-driven build loop that compiles, deploys, and schedules pipelines.")
@@ -10,16 +11,14 @@ include_gates = st.sidebar.checkbox("Show quality gates", value=True)
 include_docker = st.sidebar.checkbox("Show Docker lane", value=True)
 include_ops = st.sidebar.checkbox("Show ops loop", value=True)
 
-st.graphviz_chart(
-    build_cicd_cycle_diagram(
-        include_docker_lane=include_docker,
-        include_quality_gates=include_gates,
-        include_observability=include_ops,
-    )
+show_diagram(
+    build_cicd_cycle_diagram,
+    include_docker_lane=include_docker,
+    include_quality_gates=include_gates,
+    include_observability=include_ops,
 )
 
-md = Path("src/content/cicd_flow.md").read_text(encoding="utf-8")
-st.markdown(md)
+st.markdown(content_markdown("cicd_flow"))
 
 st.subheader("Example build steps (pseudo)")
 st.code(
@@ -1,6 +1,7 @@
-from pathlib import Path
 import streamlit as st
+from src.utils.content import content_markdown
 from src.viz.diagrams import build_docker_flow_diagram
+from src.viz.render_cache import show_diagram
 
 st.title("Why Docker shows up in the YAML")
 
@@ -8,15 +9,13 @@ st.sidebar.header("Diagram toggles")
 include_base = st.sidebar.checkbox("Include base image", value=True)
 include_cache = st.sidebar.checkbox("Include build cache", value=True)
 
-st.graphviz_chart(
-    build_docker_flow_diagram(
-        include_base_image=include_base,
-        include_build_cache=include_cache,
-    )
+show_diagram(
+    build_docker_flow_diagram,
+    include_base_image=include_base,
+    include_build_cache=include_cache,
 )
 
-md = Path("src/content/docker.md").read_text(encoding="utf-8")
-st.markdown(md)
+st.markdown(content_markdown("docker"))
 
 st.subheader("Rule of thumb")
 st.markdown(
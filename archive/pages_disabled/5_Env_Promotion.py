@@ -1,6 +1,7 @@
-from pathlib import Path
 import streamlit as st
+from src.utils.content import content_markdown
 from src.viz.diagrams import build_env_promotion_diagram
+from src.viz.render_cache import show_diagram
 
 st.title("Environment promotion (dev → test → prod)")
 
@@ -9,16 +10,14 @@ include_approval = st.sidebar.checkbox("Manual approval between test/prod", valu
 include_projects = st.sidebar.checkbox("Separate projects per env", value=True)
 include_rebuild = st.sidebar.checkbox("Rebuild per environment", value=False)
 
-st.graphviz_chart(
-    build_env_promotion_diagram(
-        include_manual_approval=include_approval,
-        include_project_split=include_projects,
-        include_rebuild_per_env=include_rebuild,
-    )
+show_diagram(
+    build_env_promotion_diagram,
+    include_manual_approval=include_approval,
+    include_project_split=include_projects,
+    include_rebuild_per_env=include_rebuild,
 )
 
-md = Path("src/content/env_promotion.md").read_text(encoding="utf-8")
-st.markdown(md)
+st.markdown(content_markdown("env_promotion"))
 
 st.subheader("Quick checklist")
 st.markdown(
@@ -1,10 +1,16 @@
-from pathlib import Path
 import streamlit as st
+from src.utils.content import content_markdown
+from src.ops.run_history import run_stats
 
 st.title("Ops & Observability")
 
-md = Path("src/content/ops.md").read_text(encoding="utf-8")
-st.markdown(md)
+st.markdown(content_markdown("ops"))
+
+st.subheader("Run history")
+history = st.file_uploader("Pipeline run export (CSV, JSONL or Parquet)", type=["csv", "jsonl", "parquet"])
+if history is not None:
+    # Cached per file fingerprint, so reruns only re-measure freshness.
+    st.dataframe(run_stats(history).records(), use_container_width=True)
 
 st.subheader("Ops checklist")
 st.markdown(
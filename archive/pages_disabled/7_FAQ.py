@@ -1,7 +1,6 @@
-from pathlib import Path
 import streamlit as st
+from src.utils.content import content_markdown
 
 st.title("FAQ")
 
-md = Path("src/content/faq.md").read_text(encoding="utf-8")
-st.markdown(md)
+st.markdown(content_markdown("faq"))
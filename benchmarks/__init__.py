@@ -0,0 +1 @@
+"""Benchmarks for diagram construction and layout (run as ``python -m benchmarks.<name>``)."""
@@ -0,0 +1,137 @@
+"""Time diagram construction, Graphviz layout and SVG size; compare against a baseline.
+
+    python -m benchmarks.diagrams --out bench.json
+    python -m benchmarks.diagrams --baseline bench.json --tolerance 0.25
+
+Each case reports three numbers separately:
+
+- ``build_s``: building the ``Digraph`` and generating its DOT source;
+- ``layout_s``: running ``dot -Tsvg`` on that source (skipped without ``dot``);
+- ``svg_bytes``: size of the rendered SVG.
+
+A ``home_rerun`` case times a full Home.py script run through Streamlit's
+``AppTest`` harness. With ``--baseline``, any timing more than ``tolerance``
+slower than the baseline (or SVG more than ``tolerance`` larger) is reported and
+the process exits with status 1.
+"""
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.synthetic import SHAPES
+from src.pipelines.catalog import default_catalog
+from src.viz.diagrams import build_architecture_diagram, build_pattern_diagram
+from src.viz.graphviz_dag import build_graph
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SIZES = (10, 100, 1000)
+# Timings below this are dominated by noise and never count as regressions.
+MIN_COMPARABLE_S = 0.002
+
+
+def _median_time(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _layout(source: str, timeout: float) -> Dict[str, float]:
+    start = time.perf_counter()
+    proc = subprocess.run(["dot", "-Tsvg"], input=source.encode("utf-8"), capture_output=True, check=True, timeout=timeout)
+    return {"layout_s": time.perf_counter() - start, "svg_bytes": len(proc.stdout)}
+
+
+def bench_case(build: Callable[[], object], repeat: int, with_layout: bool, timeout: float) -> Dict[str, float]:
+    result = {"build_s": _median_time(lambda: build().source, repeat)}
+    if with_layout:
+        try:
+            result.update(_layout(build().source, timeout))
+        except subprocess.TimeoutExpired:
+            result["layout_s"] = float("inf")
+    return result
+
+
+def bench_home_rerun(repeat: int) -> Optional[Dict[str, float]]:
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return None
+    app = AppTest.from_file(str(REPO_ROOT / "Home.py"), default_timeout=60)
+    start = time.perf_counter()
+    app.run()
+    cold = time.perf_counter() - start
+    return {"cold_s": cold, "rerun_s": _median_time(app.run, repeat)}
+
+
+def run(sizes: List[int], repeat: int, timeout: float) -> Dict[str, Dict[str, float]]:
+    with_layout = shutil.which("dot") is not None
+    results: Dict[str, Dict[str, float]] = {}
+    results["architecture"] = bench_case(build_architecture_diagram, repeat, with_layout, timeout)
+    for pattern in default_catalog().patterns():
+        results[f"pattern[{pattern}]"] = bench_case(lambda: build_pattern_diagram(pattern), repeat, with_layout, timeout)
+    for shape, make in SHAPES.items():
+        for n in sizes:
+            p = make(n)
+            results[f"build_graph[{shape}-{n}]"] = bench_case(lambda: build_graph(p, True), repeat, with_layout, timeout)
+    home = bench_home_rerun(repeat)
+    if home is not None:
+        results["home_rerun"] = home
+    return results
+
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    """Return one message per metric that regressed beyond ``tolerance``."""
+    regressions = []
+    for case, metrics in current.items():
+        base = baseline.get(case, {})
+        for metric, value in metrics.items():
+            old = base.get(metric)
+            if old is None:
+                continue
+            if metric.endswith("_s") and max(value, old) < MIN_COMPARABLE_S:
+                continue
+            if value > old * (1 + tolerance):
+                regressions.append(f"{case} {metric}: {old:.4g} -> {value:.4g}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark diagram construction and rendering.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--dot-timeout", type=float, default=120.0)
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed fractional slowdown")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.dot_timeout)
+    for case, metrics in results.items():
+        print(f"{case:<40} " + "  ".join(f"{k}={v:.4g}" for k, v in metrics.items()))
+
+    if args.out:
+        payload = {"python": platform.python_version(), "results": results}
+        args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
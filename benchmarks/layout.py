@@ -0,0 +1,49 @@
+"""Compare Graphviz ``dot`` against the in-process layered layout.
+
+    python -m benchmarks.layout --sizes 100 1000 10000 --dot-timeout 60
+"""
+import argparse
+import shutil
+import subprocess
+import time
+
+from benchmarks.synthetic import random_dag
+from src.viz.graphviz_dag import build_graph
+from src.viz.layered import layered_svg
+
+
+def time_dot(source: str, timeout: float) -> float:
+    start = time.perf_counter()
+    subprocess.run(["dot", "-Tsvg"], input=source.encode("utf-8"), capture_output=True, check=True, timeout=timeout)
+    return time.perf_counter() - start
+
+
+def time_layered(p) -> float:
+    start = time.perf_counter()
+    layered_svg(p, annotated=True)
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--dot-timeout", type=float, default=60.0, help="seconds before a dot run is abandoned")
+    args = parser.parse_args(argv)
+
+    has_dot = shutil.which("dot") is not None
+    print(f"{'nodes':>7} {'edges':>7} {'layered s':>10} {'dot s':>10}")
+    for n in args.sizes:
+        p = random_dag(n)
+        layered = time_layered(p)
+        if not has_dot:
+            dot = "n/a"
+        else:
+            try:
+                dot = f"{time_dot(build_graph(p, annotated=True).source, args.dot_timeout):.3f}"
+            except subprocess.TimeoutExpired:
+                dot = f">{args.dot_timeout:.0f}"
+        print(f"{n:>7} {len(p.edges):>7} {layered:>10.3f} {dot:>10}")
+
+
+if __name__ == "__main__":
+    main()
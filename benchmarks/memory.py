@@ -0,0 +1,90 @@
+"""Per-step memory footprint of loaded pipelines, plain vs compact storage.
+
+    python -m benchmarks.memory --pipelines 1000 --steps 200
+
+Pipelines are round-tripped through JSON first so every string is a fresh
+object, as when a catalog directory is loaded. ``dict`` mirrors the previous
+layout (a ``Step`` with an instance ``__dict__``); ``plain`` is today's slotted,
+interned ``Step`` with edges as a list of tuples; ``compact`` adds
+``PipelineDef.compact`` (edges as two ``array('I')`` columns).
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.synthetic import random_dag
+from src.models import PipelineDef, Step
+
+
+@dataclass(frozen=True)
+class DictStep:
+    id: str
+    description: str = ""
+    annotation: Optional[str] = None
+    image: Optional[str] = None
+    group: Optional[str] = None
+
+
+def _catalog_json(pipelines: int, steps: int) -> str:
+    data = []
+    for i in range(pipelines):
+        p = random_dag(steps, seed=i)
+        data.append(
+            {
+                "name": f"pipeline-{i}",
+                "steps": [{"id": s.id, "annotation": s.annotation, "image": "gcr.io/acme/worker:1.0"} for s in p.steps],
+                "edges": [list(e) for e in p.edges],
+            }
+        )
+    return json.dumps(data)
+
+
+def _load(text: str, step_type, compact: bool) -> List[PipelineDef]:
+    pipelines = []
+    for d in json.loads(text):
+        steps = [step_type(s["id"], annotation=s["annotation"], image=s["image"]) for s in d["steps"]]
+        p = PipelineDef(d["name"], steps, [(a, b) for a, b in d["edges"]])
+        pipelines.append(p.compact() if compact else p)
+    return pipelines
+
+
+MODES: Dict[str, Callable[[str], List[PipelineDef]]] = {
+    "dict": lambda text: _load(text, DictStep, compact=False),
+    "plain": lambda text: _load(text, Step, compact=False),
+    "compact": lambda text: _load(text, Step, compact=True),
+}
+
+
+def measure(load: Callable[[str], List[PipelineDef]], text: str):
+    """``(pipelines, bytes still allocated once loading is done)``."""
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    pipelines = load(text)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return pipelines, used
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pipelines", type=int, default=1000)
+    parser.add_argument("--steps", type=int, default=200, help="steps per pipeline")
+    args = parser.parse_args(argv)
+
+    text = _catalog_json(args.pipelines, args.steps)
+    print(f"{'mode':>8} {'steps':>9} {'edges':>9} {'MiB':>8} {'B/step':>7}")
+    for mode, load in MODES.items():
+        pipelines, used = measure(load, text)
+        steps = sum(len(p.steps) for p in pipelines)
+        edges = sum(len(p.edges) for p in pipelines)
+        print(f"{mode:>8} {steps:>9} {edges:>9} {used / 2**20:>8.1f} {used / steps:>7.0f}")
+        del pipelines
+
+
+if __name__ == "__main__":
+    main()
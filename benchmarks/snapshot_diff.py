@@ -0,0 +1,95 @@
+"""Throughput and peak memory of ``diff_snapshots`` on synthetic Parquet snapshots.
+
+    python -m benchmarks.snapshot_diff --sizes 1000000 10000000 50000000 --workers 8
+
+For each size an old snapshot (``id``, three payload columns) and a new one
+with ``--change-rate`` of rows updated, deleted and inserted (a third each)
+are written in chunks, then diffed in a fresh interpreter so that peak RSS
+(``ru_maxrss`` of the diff process and, separately, its largest pool worker)
+reflects the diff alone.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.pipelines.snapshot_diff import DEFAULT_CHUNK_ROWS, DEFAULT_PARTITIONS, synthetic_snapshots
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+_CHILD = """
+import json, resource, sys
+from src.pipelines.snapshot_diff import diff_snapshots
+
+old, new, out, partitions, workers = sys.argv[1:6]
+d = diff_snapshots(old, new, "id", out, partitions=int(partitions), workers=int(workers))
+print(json.dumps({
+    "inserts": d.inserts, "updates": d.updates, "deletes": d.deletes,
+    "partition_s": d.partition_s, "diff_s": d.diff_s, "rows_per_s": d.rows_per_s,
+    "peak_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "worker_peak_mib": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+}))
+"""
+
+
+def write_snapshots(rows: int, change_rate: float, out_dir: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+    """Write ``old.parquet``/``new.parquet`` under ``out_dir`` chunk by chunk; return their paths."""
+    old_path, new_path = out_dir / "old.parquet", out_dir / "new.parquet"
+    old_writer = new_writer = None
+    try:
+        for i, start in enumerate(range(0, rows, chunk_rows)):
+            old, new = synthetic_snapshots(min(chunk_rows, rows - start), change_rate, seed=i, start=start, insert_start=rows + start)
+            old_table = pa.Table.from_pandas(old, preserve_index=False)
+            new_table = pa.Table.from_pandas(new, preserve_index=False)
+            old_writer = old_writer or pq.ParquetWriter(old_path, old_table.schema)
+            new_writer = new_writer or pq.ParquetWriter(new_path, new_table.schema)
+            old_writer.write_table(old_table)
+            new_writer.write_table(new_table)
+    finally:
+        for writer in (old_writer, new_writer):
+            if writer is not None:
+                writer.close()
+    return old_path, new_path
+
+
+def measure(old_path: Path, new_path: Path, out_dir: Path, partitions: int, workers: int) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD, str(old_path), str(new_path), str(out_dir), str(partitions), str(workers)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    parser.add_argument("--change-rate", type=float, default=0.03)
+    parser.add_argument("--partitions", type=int, default=DEFAULT_PARTITIONS)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'rows':>10} {'inserts':>9} {'updates':>9} {'deletes':>9} {'split s':>8} {'diff s':>8} {'rows/s':>10} {'peak MiB':>9} {'worker MiB':>10}")
+    for rows in args.sizes:
+        with tempfile.TemporaryDirectory(prefix="snapshot-bench-") as tmp:
+            old_path, new_path = write_snapshots(rows, args.change_rate, Path(tmp))
+            r = results[rows] = measure(old_path, new_path, Path(tmp) / "diff", args.partitions, args.workers)
+        print(
+            f"{rows:>10} {r['inserts']:>9} {r['updates']:>9} {r['deletes']:>9} {r['partition_s']:>8.2f} "
+            f"{r['diff_s']:>8.2f} {r['rows_per_s']:>10,.0f} {r['peak_mib']:>9.0f} {r['worker_peak_mib']:>10.0f}"
+        )
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Cold-start and rerun time of Home.py per sidebar section, checked against a budget.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --cold-budget 0.5 --rerun-budget 0.05
+
+Each section is measured in a fresh interpreter: ``cold_s`` is the first
+``AppTest`` run of Home.py with that section preselected through the sidebar
+radio's session-state key (the section module and everything it imports are
+loaded during it), ``rerun_s`` the median of later runs. ``graphviz`` reports whether the run imported Graphviz, which only the
+diagram sections should. The process exits with status 1 if any section is
+over budget.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from src.sections import SECTIONS
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+COLD_BUDGET_S = 1.0
+RERUN_BUDGET_S = 0.1
+
+_CHILD = """
+import json, statistics, sys, time
+from streamlit.testing.v1 import AppTest
+
+label, repeat = sys.argv[1], int(sys.argv[2])
+app = AppTest.from_file("Home.py", default_timeout=60)
+app.session_state["section"] = label
+start = time.perf_counter()
+app.run()
+cold = time.perf_counter() - start
+samples = []
+for _ in range(repeat):
+    start = time.perf_counter()
+    app.run()
+    samples.append(time.perf_counter() - start)
+print(json.dumps({"cold_s": cold, "rerun_s": statistics.median(samples), "graphviz": "graphviz" in sys.modules}))
+"""
+
+
+def measure(label: str, repeat: int) -> Dict[str, float]:
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD, label, str(repeat)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def over_budget(results: Dict[str, Dict[str, float]], cold_budget: float, rerun_budget: float) -> List[str]:
+    problems = []
+    for label, metrics in results.items():
+        if metrics["cold_s"] > cold_budget:
+            problems.append(f"{label} cold_s: {metrics['cold_s']:.3f} > {cold_budget}")
+        if metrics["rerun_s"] > rerun_budget:
+            problems.append(f"{label} rerun_s: {metrics['rerun_s']:.3f} > {rerun_budget}")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure Home.py cold-start and rerun time per section.")
+    parser.add_argument("--sections", nargs="+", default=list(SECTIONS), choices=list(SECTIONS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cold-budget", type=float, default=COLD_BUDGET_S)
+    parser.add_argument("--rerun-budget", type=float, default=RERUN_BUDGET_S)
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    args = parser.parse_args(argv)
+
+    results = {label: measure(label, args.repeat) for label in args.sections}
+    for label, metrics in results.items():
+        print(f"{label:<30} cold_s={metrics['cold_s']:.3f}  rerun_s={metrics['rerun_s']:.3f}  graphviz={metrics['graphviz']}")
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    problems = over_budget(results, args.cold_budget, args.rerun_budget)
+    for line in problems:
+        print(f"OVER BUDGET {line}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
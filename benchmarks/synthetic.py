@@ -0,0 +1,59 @@
+"""Synthetic ``PipelineDef`` generators for benchmarks.
+
+All generators are deterministic for a given size (and seed) so results are
+comparable across runs.
+"""
+import random
+from typing import Callable, Dict, List, Tuple
+
+from src.models import PipelineDef, Step
+
+
+def _steps(n: int) -> Tuple[List[str], List[Step]]:
+    ids = [f"step-{i}" for i in range(n)]
+    return ids, [Step(step_id, annotation="CustomJob") for step_id in ids]
+
+
+def chain(n: int) -> PipelineDef:
+    """``step-0 -> step-1 -> ... -> step-(n-1)``."""
+    ids, steps = _steps(n)
+    return PipelineDef(name=f"chain-{n}", steps=steps, edges=list(zip(ids, ids[1:])))
+
+
+def fan_out(n: int) -> PipelineDef:
+    """One source fanning out to ``n - 2`` parallel steps that join into one sink."""
+    ids, steps = _steps(max(n, 3))
+    source, sink, middle = ids[0], ids[-1], ids[1:-1]
+    edges = [(source, m) for m in middle] + [(m, sink) for m in middle]
+    return PipelineDef(name=f"fan-out-{n}", steps=steps, edges=edges)
+
+
+def diamonds(n: int) -> PipelineDef:
+    """A chain of diamonds (``a -> b, a -> c, b -> d, c -> d``) sharing their end nodes."""
+    ids, steps = _steps(max(n, 1))
+    edges = []
+    for i in range(0, len(ids) - 3, 3):
+        a, b, c, d = ids[i:i + 4]
+        edges += [(a, b), (a, c), (b, d), (c, d)]
+    return PipelineDef(name=f"diamonds-{n}", steps=steps, edges=edges)
+
+
+def random_dag(n: int, avg_out_degree: float = 1.5, seed: int = 0) -> PipelineDef:
+    """Random DAG over ``n`` steps; edges only point from lower to higher step numbers."""
+    rng = random.Random(seed)
+    ids, steps = _steps(n)
+    edges = []
+    for i in range(1, n):
+        # Every step gets at least one parent so the DAG stays connected.
+        for _ in range(max(1, round(rng.expovariate(1 / avg_out_degree)))):
+            parent = rng.randrange(max(0, i - 50), i)
+            edges.append((ids[parent], ids[i]))
+    return PipelineDef(name=f"random-{n}", steps=steps, edges=list(dict.fromkeys(edges)))
+
+
+SHAPES: Dict[str, Callable[[int], PipelineDef]] = {
+    "chain": chain,
+    "fan_out": fan_out,
+    "diamonds": diamonds,
+    "random": random_dag,
+}
@@ -0,0 +1,4 @@
+"""Makes ``src`` and ``benchmarks`` importable when pytest is run as plain ``pytest``.
+
+pytest puts the directory of a root-level ``conftest.py`` on ``sys.path``.
+"""
@@ -1,20 +1,235 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import hashlib
+import sys
+from array import array
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 
-@dataclass(frozen=True)
+def _intern(value: object) -> Optional[str]:
+    """Interned ``str(value)``; ``None`` stays ``None`` (YAML catalogs can yield e.g. ``annotation: 5``)."""
+    if value is None:
+        return None
+    return sys.intern(value if isinstance(value, str) else str(value))
+
+
+@dataclass(frozen=True, slots=True)
 class Step:
     id: str
     description: str = ""
     annotation: Optional[str] = None  # e.g. "CustomJob", "BigQuery"
-    
+    image: Optional[str] = None  # container image URI, when known
+    group: Optional[str] = None  # id of the enclosing sub-DAG / ParallelFor step
+
+    def __post_init__(self):
+        # Ids, annotations and images repeat across steps, edges and pipelines; share one copy.
+        for name in ("id", "annotation", "image", "group"):
+            object.__setattr__(self, name, _intern(getattr(self, name)))
+
+
+class EdgeList(Sequence[Tuple[str, str]]):
+    """Read-only ``(from, to)`` sequence stored as two ``array('I')`` columns.
+
+    ``src[k]``/``dst[k]`` index into ``names``, which starts with the pipeline's
+    step ids in step order (so the columns double as ``DagIndex`` node ids) and
+    is followed by any undeclared endpoints. Compares equal to a list of the
+    same tuples and has the same ``repr``.
+    """
+
+    __slots__ = ("names", "src", "dst")
+
+    def __init__(self, edges: Iterable[Tuple[str, str]], names: Iterable[str] = ()):
+        self.names: List[str] = []
+        pos: Dict[str, int] = {}
+        for name in names:
+            if name not in pos:
+                pos[name] = len(self.names)
+                self.names.append(name)
+        self.src = array("I")
+        self.dst = array("I")
+        for a, b in edges:
+            for name, column in ((a, self.src), (b, self.dst)):
+                i = pos.get(name)
+                if i is None:
+                    i = pos[name] = len(self.names)
+                    self.names.append(sys.intern(name))
+                column.append(i)
+
+    def __len__(self) -> int:
+        return len(self.src)
+
+    def __getitem__(self, k: Union[int, slice]):
+        if isinstance(k, slice):
+            return [(self.names[a], self.names[b]) for a, b in zip(self.src[k], self.dst[k])]
+        return self.names[self.src[k]], self.names[self.dst[k]]
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        names = self.names
+        return ((names[a], names[b]) for a, b in zip(self.src, self.dst))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (EdgeList, list, tuple)):
+            return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class DagIndex:
+    """Compact adjacency index over a pipeline's steps and edges.
+
+    Step IDs are interned to dense integers (in step order) and edges are stored
+    CSR-style: ``fwd_targets[fwd_offsets[i]:fwd_offsets[i + 1]]`` are the
+    successors of node ``i``, and likewise ``rev_*`` for predecessors. Edges
+    whose endpoints are not declared steps are kept aside in ``dangling``.
+    """
+
+    def __init__(self, steps: Sequence[Step], edges: Sequence[Tuple[str, str]]):
+        self.ids: List[str] = []
+        self.pos: Dict[str, int] = {}
+        for step in steps:
+            if step.id not in self.pos:
+                self.pos[step.id] = len(self.ids)
+                self.ids.append(step.id)
+
+        n = len(self.ids)
+        src = array("I")
+        dst = array("I")
+        dangling = []
+        pos = self.pos
+        if isinstance(edges, EdgeList) and edges.names[:n] == self.ids:
+            # Compact edges are already numbered in step order; only filter undeclared endpoints.
+            if len(edges.names) == n:
+                src, dst = edges.src, edges.dst
+            else:
+                for a, b in zip(edges.src, edges.dst):
+                    if a < n and b < n:
+                        src.append(a)
+                        dst.append(b)
+                    else:
+                        dangling.append((edges.names[a], edges.names[b]))
+            edges = ()
+        for a, b in edges:
+            ia = pos.get(a)
+            ib = pos.get(b)
+            if ia is None or ib is None:
+                dangling.append((a, b))
+                continue
+            src.append(ia)
+            dst.append(ib)
+        self.dangling: List[Tuple[str, str]] = dangling
+        self.fwd_offsets, self.fwd_targets = _csr(n, src, dst)
+        self.rev_offsets, self.rev_targets = _csr(n, dst, src)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.fwd_targets)
+
+    def out_degree(self, i: int) -> int:
+        return self.fwd_offsets[i + 1] - self.fwd_offsets[i]
+
+    def in_degree(self, i: int) -> int:
+        return self.rev_offsets[i + 1] - self.rev_offsets[i]
+
+    def successor_ids(self, i: int) -> array:
+        return self.fwd_targets[self.fwd_offsets[i]:self.fwd_offsets[i + 1]]
+
+    def predecessor_ids(self, i: int) -> array:
+        return self.rev_targets[self.rev_offsets[i]:self.rev_offsets[i + 1]]
+
+    def topological_order(self) -> List[int]:
+        """Node ids in topological order (Kahn); raises ``ValueError`` on cycles."""
+        indeg = [self.in_degree(i) for i in range(len(self.ids))]
+        ready = [i for i, d in enumerate(indeg) if d == 0]
+        order: List[int] = []
+        offsets, targets = self.fwd_offsets, self.fwd_targets
+        while ready:
+            i = ready.pop()
+            order.append(i)
+            for k in range(offsets[i], offsets[i + 1]):
+                j = targets[k]
+                indeg[j] -= 1
+                if indeg[j] == 0:
+                    ready.append(j)
+        if len(order) != len(self.ids):
+            raise ValueError("Pipeline graph contains a cycle")
+        return order
+
+    def successors(self, step_id: str) -> List[str]:
+        ids = self.ids
+        return [ids[j] for j in self.successor_ids(self.pos[step_id])]
+
+    def predecessors(self, step_id: str) -> List[str]:
+        ids = self.ids
+        return [ids[j] for j in self.predecessor_ids(self.pos[step_id])]
+
+
+def _csr(n: int, src: array, dst: array) -> Tuple[array, array]:
+    """Counting-sort ``(src, dst)`` pairs into offset/target arrays."""
+    offsets = array("I", bytes(4 * (n + 1)))
+    for s in src:
+        offsets[s + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    targets = array("I", bytes(4 * len(dst)))
+    fill = offsets[:-1]
+    for s, d in zip(src, dst):
+        targets[fill[s]] = d
+        fill[s] += 1
+    return offsets, targets
+
 
 @dataclass(frozen=True)
 class PipelineDef:
     name: str
     steps: List[Step]
-    edges: List[Tuple[str, str]]  # (from, to)
+    edges: Sequence[Tuple[str, str]]  # (from, to); a list, or an ``EdgeList`` once compacted
+
+    # Derived indexes are built on first use and cached on the instance; the
+    # definition is treated as immutable once constructed.
+    @cached_property
+    def content_hash(self) -> str:
+        """sha256 over the steps and edges (not the name); stable across processes."""
+        digest = hashlib.sha256()
+        for s in self.steps:
+            digest.update(repr((s.id, s.description, s.annotation, s.image, s.group)).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(repr(self.edges).encode("utf-8"))
+        return digest.hexdigest()
+
+    def __hash__(self) -> int:
+        # ``steps``/``edges`` are lists, so the generated field hash would fail.
+        return hash((self.name, self.content_hash))
+
+    @cached_property
+    def index(self) -> DagIndex:
+        return DagIndex(self.steps, self.edges)
+
+    @cached_property
+    def by_id(self) -> Dict[str, Step]:
+        return steps_index(self.steps)
+
+    def compact(self) -> "PipelineDef":
+        """Same pipeline with edges as an ``EdgeList`` of integer columns, for large catalogs.
+
+        Derived caches are not carried over; an already compact pipeline is returned as is.
+        """
+        if isinstance(self.edges, EdgeList):
+            return self
+        return replace(self, steps=list(self.steps), edges=EdgeList(self.edges, (s.id for s in self.steps)))
+
+    def successors(self, step_id: str) -> List[str]:
+        return self.index.successors(step_id)
+
+    def predecessors(self, step_id: str) -> List[str]:
+        return self.index.predecessors(step_id)
 
 
-def steps_index(steps: List[Step]) -> Dict[str, Step]:
+def steps_index(steps: Sequence[Step]) -> Dict[str, Step]:
     return {s.id: s for s in steps}
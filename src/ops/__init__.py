@@ -0,0 +1 @@
+"""Operational analytics over pipeline run history."""
@@ -0,0 +1,235 @@
+"""Columnar, memory-mapped analytics over pipeline run records.
+
+A run-history export (CSV, JSONL or Parquet) is parsed once into a column
+cache -- one ``.npy`` file per column plus ``names.json`` -- under a directory
+named after the source's fingerprint. Later loads memory-map those arrays, so
+even 10M-row histories are opened without copying, and a new export (different
+size/mtime or content) gets a fresh cache automatically.
+
+Expected columns: ``pipeline``, ``status`` and either ``duration_s`` or both
+``start_time``/``end_time``; ``end_time`` is also used for freshness.
+Statuses ``SUCCEEDED``/``SUCCESS`` count as successful runs.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Dict, List, Optional, Union
+
+import numpy as np
+
+CACHE_DIR_ENV = "KFP_VIZ_RUN_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "kfp-viz-runs"
+SUCCESS_STATUSES = ("SUCCEEDED", "SUCCESS", "SUCCESSFUL")
+QUANTILES = (0.50, 0.95, 0.99)
+STATS_CACHE_SIZE = 32  # RunStats kept per process, most recently used first
+
+Source = Union[str, Path, IO]
+
+
+@dataclass(frozen=True)
+class RunTable:
+    """Run records as parallel (usually memory-mapped) columns."""
+
+    names: List[str]  # pipeline code -> name
+    pipeline: np.ndarray  # int32 codes
+    duration_s: np.ndarray  # float64
+    end_ts: np.ndarray  # float64 epoch seconds, NaN when unknown
+    succeeded: np.ndarray  # bool
+
+    def __len__(self) -> int:
+        return len(self.pipeline)
+
+
+@dataclass(frozen=True)
+class RunStats:
+    names: List[str]
+    runs: np.ndarray
+    p50_s: np.ndarray
+    p95_s: np.ndarray
+    p99_s: np.ndarray
+    failure_rate: np.ndarray
+    last_success_ts: np.ndarray
+
+    def freshness_s(self, now: Optional[float] = None) -> np.ndarray:
+        """Seconds since each pipeline's last successful run (NaN if it never succeeded)."""
+        return (time.time() if now is None else now) - self.last_success_ts
+
+    def records(self, now: Optional[float] = None) -> List[Dict[str, object]]:
+        """One row per pipeline, for ``st.dataframe``/``st.table``."""
+        freshness = self.freshness_s(now)
+        return [
+            {
+                "pipeline": name,
+                "runs": int(self.runs[i]),
+                "p50 (s)": round(float(self.p50_s[i]), 1),
+                "p95 (s)": round(float(self.p95_s[i]), 1),
+                "p99 (s)": round(float(self.p99_s[i]), 1),
+                "failure rate": round(float(self.failure_rate[i]), 4),
+                "freshness (h)": round(float(freshness[i]) / 3600, 2),
+            }
+            for i, name in enumerate(self.names)
+        ]
+
+
+def fingerprint(source: Source) -> str:
+    """Cheap identity of a run-history source: path/size/mtime for files, content hash for streams."""
+    if isinstance(source, (str, Path)):
+        st = os.stat(source)
+        ident = f"{Path(source).resolve()}:{st.st_size}:{st.st_mtime_ns}"
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+    source.seek(0)
+    digest = hashlib.sha1()
+    for chunk in iter(lambda: source.read(1 << 20), b""):
+        digest.update(chunk)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+def _read_frame(source: Source):
+    import pandas as pd
+
+    if isinstance(source, (str, Path)):
+        name = str(source)
+    else:
+        name = getattr(source, "name", "")
+        source.seek(0)
+    suffix = Path(name).suffix.lower()
+    if suffix == ".parquet":
+        return pd.read_parquet(source)
+    if suffix in (".jsonl", ".ndjson"):
+        return pd.read_json(source, lines=True)
+    return pd.read_csv(source)
+
+
+def _to_epoch(values) -> np.ndarray:
+    import pandas as pd
+
+    ts = pd.to_datetime(values, utc=True, errors="coerce")
+    # Timedelta division yields float seconds (NaN for NaT) whatever the datetime unit.
+    return ((ts - pd.Timestamp(0, tz="UTC")) / pd.Timedelta(seconds=1)).to_numpy(dtype=np.float64)
+
+
+def _columns_from_frame(df) -> Dict[str, np.ndarray]:
+    names, codes = np.unique(df["pipeline"].astype(str).to_numpy(), return_inverse=True)
+    end = _to_epoch(df["end_time"]) if "end_time" in df else np.full(len(df), np.nan)
+    if "duration_s" in df:
+        duration = df["duration_s"].to_numpy(dtype=np.float64)
+    else:
+        duration = end - _to_epoch(df["start_time"])
+    status = df["status"].astype(str).str.upper().to_numpy()
+    return {
+        "names": names.tolist(),
+        "pipeline": codes.astype(np.int32),
+        "duration_s": duration.astype(np.float64),
+        "end_ts": end.astype(np.float64),
+        "succeeded": np.isin(status, SUCCESS_STATUSES),
+    }
+
+
+def load_runs(source: Source, cache_dir: Optional[Path] = None) -> RunTable:
+    """Open ``source`` as a memory-mapped ``RunTable``, building its column cache on first use."""
+    return _load_runs(source, fingerprint(source), cache_dir)
+
+
+def _load_runs(source: Source, key: str, cache_dir: Optional[Path]) -> RunTable:
+    cache_root = Path(cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+    target = cache_root / key
+    if not (target / "names.json").is_file():
+        columns = _columns_from_frame(_read_frame(source))
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.mkdir(parents=True, exist_ok=True)
+        for name, values in columns.items():
+            if name != "names":
+                np.save(tmp / f"{name}.npy", values)
+        (tmp / "names.json").write_text(json.dumps(columns["names"]), encoding="utf-8")
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            # Another process built the same cache first; use theirs.
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    names = json.loads((target / "names.json").read_text(encoding="utf-8"))
+    arrays = {key: np.load(target / f"{key}.npy", mmap_mode="r") for key in ("pipeline", "duration_s", "end_ts", "succeeded")}
+    return RunTable(names=names, **arrays)
+
+
+def _grouped_quantiles(codes: np.ndarray, values: np.ndarray, k: int, qs) -> List[np.ndarray]:
+    """Per-group quantiles (``np.quantile``'s linear interpolation) with no per-group loop.
+
+    Values are sorted by (group code, value) once -- by value, then stably by
+    code -- and every group's quantile positions are read at its offset into
+    that order, so the cost does not grow with the number of pipelines.
+    """
+    counts = np.bincount(codes, minlength=k)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    order = np.argsort(values)
+    order = order[np.argsort(codes[order], kind="stable")]
+    ordered = values[order]
+    present = counts > 0
+    n, start = counts[present], starts[present]
+    out = np.full((len(qs), k), np.nan)
+    for row, q in enumerate(qs):
+        pos = (n - 1) * q
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.minimum(lo + 1, n - 1)
+        below, above = ordered[start + lo], ordered[start + hi]
+        out[row, present] = below + (pos - lo) * (above - below)
+    return list(out)
+
+
+def compute_stats(table: RunTable) -> RunStats:
+    """Per-pipeline duration quantiles (successful runs), failure rate and freshness."""
+    k = len(table.names)
+    codes = np.asarray(table.pipeline)
+    ok = np.asarray(table.succeeded)
+    duration = np.asarray(table.duration_s)
+
+    runs = np.bincount(codes, minlength=k)
+    failures = np.bincount(codes, weights=~ok, minlength=k)
+    ok_codes = codes[ok]
+    ok_duration = duration[ok]
+    valid = ~np.isnan(ok_duration)
+    p50, p95, p99 = _grouped_quantiles(ok_codes[valid], ok_duration[valid], k, QUANTILES)
+
+    last_success = np.full(k, -np.inf)
+    ok_end = np.asarray(table.end_ts)[ok]
+    known = ~np.isnan(ok_end)
+    np.maximum.at(last_success, ok_codes[known], ok_end[known])
+    last_success[np.isinf(last_success)] = np.nan
+
+    return RunStats(
+        names=list(table.names),
+        runs=runs,
+        p50_s=p50,
+        p95_s=p95,
+        p99_s=p99,
+        failure_rate=np.divide(failures, runs, out=np.zeros(k), where=runs > 0),
+        last_success_ts=last_success,
+    )
+
+
+_STATS_CACHE: "OrderedDict[str, RunStats]" = OrderedDict()
+_STATS_LOCK = threading.Lock()
+
+
+def run_stats(source: Source, cache_dir: Optional[Path] = None) -> RunStats:
+    """``compute_stats(load_runs(source))``, memoised per source fingerprint (LRU of ``STATS_CACHE_SIZE``)."""
+    key = fingerprint(source)
+    with _STATS_LOCK:
+        stats = _STATS_CACHE.get(key)
+        if stats is not None:
+            _STATS_CACHE.move_to_end(key)
+            return stats
+    stats = compute_stats(_load_runs(source, key, cache_dir))
+    with _STATS_LOCK:
+        _STATS_CACHE[key] = stats
+        while len(_STATS_CACHE) > STATS_CACHE_SIZE:
+            _STATS_CACHE.popitem(last=False)
+    return stats
@@ -0,0 +1,229 @@
+"""One indexed catalog of every pipeline the app can show.
+
+The catalog holds the built-in pipelines from ``src.pipelines.definitions``
+plus any pipelines found in a catalog directory (``KFP_VIZ_CATALOG_DIR``).
+A directory entry is either a compiled KFP spec (``.yaml``/``.yml``/``.json``,
+streamed through ``load_pipeline_spec``) or a small catalog file named
+``*.catalog.yaml`` (or ``.catalog.yml``/``.catalog.json``)::
+
+    name: Nightly orders
+    summary: Orders snapshot into the warehouse.
+    anchors: {quality: Validate, metrics: Load, metadata: Extract}
+    steps:
+      - {id: Extract, description: Pull orders, annotation: CustomJob}
+      - {id: Validate, annotation: Pipeline component}
+      - {id: Load, annotation: BigQuery MERGE, image: gcr.io/acme/loader:1.4}
+    edges: [[Extract, Validate], [Validate, Load]]
+
+A directory file that cannot be loaded (a parse error, a malformed step, a
+pipeline name already in the catalog) is skipped with a warning and listed in
+``PipelineCatalog.skipped``, so one bad file does not take the catalog down.
+
+Name, annotation and image indexes are built once when the catalog is created,
+so lookups are dictionary hits. Directory pipelines are stored compactly (see
+``PipelineDef.compact``). ``search`` narrows candidates with a trigram
+index over the case-folded names, annotations and images before checking
+substrings, which keeps it well under a millisecond for a thousand pipelines.
+"""
+import json
+import os
+import warnings
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+import yaml
+
+from src.models import PipelineDef, Step
+from src.pipelines.definitions import ANCHORS, PIPELINES, SUMMARIES
+from src.pipelines.kfp_spec import load_pipeline_spec
+
+CATALOG_DIR_ENV = "KFP_VIZ_CATALOG_DIR"
+CATALOG_SUFFIXES = (".yaml", ".yml", ".json")
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+StepRef = Tuple[str, str]  # (pipeline name, step id)
+_EMPTY: Set[int] = set()
+# What a malformed catalog file can raise while being read, parsed or turned into a PipelineDef.
+_LOAD_ERRORS = (OSError, ValueError, KeyError, TypeError, AttributeError, yaml.YAMLError)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    pipeline: PipelineDef
+    summary: str = ""
+    anchors: Mapping[str, str] = field(default_factory=dict)  # overlay -> step id
+    source: Optional[Path] = None
+
+    @property
+    def name(self) -> str:
+        return self.pipeline.name
+
+
+def _keys(value: Optional[str]) -> List[str]:
+    """Index keys for an annotation/image: the whole value and each ``a / b`` part, case-folded."""
+    if not value:
+        return []
+    whole = value.strip().casefold()
+    parts = [part.strip() for part in whole.split("/")] if " / " in whole else []
+    return list(dict.fromkeys([whole] + [part for part in parts if part]))
+
+
+def _content_key(p: PipelineDef) -> str:
+    values = dict.fromkeys(v for s in p.steps for v in (s.annotation, s.image) if v)
+    return "\n".join(values).casefold()
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class PipelineCatalog:
+    def __init__(self, entries: Iterable[CatalogEntry], skipped: Iterable[Tuple[Path, str]] = ()):
+        self.skipped: List[Tuple[Path, str]] = list(skipped)  # (file, reason) for directory files not loaded
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._by_annotation: Dict[str, List[StepRef]] = {}
+        self._by_image: Dict[str, List[StepRef]] = {}
+        for entry in entries:
+            if entry.name in self._entries:
+                raise ValueError(f"Duplicate pipeline name in catalog: {entry.name!r}")
+            self._entries[entry.name] = entry
+            for step in entry.pipeline.steps:
+                ref = (entry.name, step.id)
+                for key in _keys(step.annotation):
+                    self._by_annotation.setdefault(key, []).append(ref)
+                if step.image:
+                    self._by_image.setdefault(step.image, []).append(ref)
+        self._names = list(self._entries)
+        self._name_keys = [name.casefold() for name in self._names]
+        self._full_keys = [
+            f"{name_key}\n{_content_key(entry.pipeline)}" for name_key, entry in zip(self._name_keys, self._entries.values())
+        ]
+        self._trigram_index: Dict[str, Set[int]] = {}
+        for i, key in enumerate(self._full_keys):
+            for gram in _trigrams(key):
+                self._trigram_index.setdefault(gram, set()).add(i)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __getitem__(self, name: str) -> PipelineDef:
+        return self._entries[name].pipeline
+
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def entry(self, name: str) -> CatalogEntry:
+        return self._entries[name]
+
+    def patterns(self) -> List[str]:
+        """Pipelines with overlay anchors, i.e. those the pattern explorer can draw."""
+        return [name for name, entry in self._entries.items() if entry.anchors]
+
+    def steps_with_annotation(self, annotation: str) -> List[StepRef]:
+        """``(pipeline, step)`` pairs whose annotation is, or has a ``/``-separated part equal to, ``annotation``."""
+        return list(self._by_annotation.get(annotation.strip().casefold(), ()))
+
+    def steps_with_image(self, image: str) -> List[StepRef]:
+        return list(self._by_image.get(image, ()))
+
+    def annotations(self) -> List[str]:
+        return sorted(self._by_annotation)
+
+    def images(self) -> List[str]:
+        return sorted(self._by_image)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Pipeline names matching every word of ``query`` in name, annotations or images.
+
+        Pipelines matching on name alone come first.
+        """
+        words = query.casefold().split()
+        if not words:
+            return self.names()[:limit]
+        grams = set().union(*(_trigrams(w) for w in words))
+        if grams:
+            postings = sorted((self._trigram_index.get(g, _EMPTY) for g in grams), key=len)
+            order = sorted(postings[0].intersection(*postings[1:]))
+        else:
+            # Words shorter than three characters have no trigrams; check every pipeline.
+            order = range(len(self._names))
+        full_keys, name_keys = self._full_keys, self._name_keys
+        for w in words:
+            order = [i for i in order if w in full_keys[i]]
+        by_name = order
+        for w in words:
+            by_name = [i for i in by_name if w in name_keys[i]]
+        in_name = set(by_name)
+        ranked = by_name + [i for i in order if i not in in_name]
+        return [self._names[i] for i in ranked[:limit]]
+
+    @classmethod
+    def from_dir(cls, root: Path, builtins: Iterable[CatalogEntry] = (), compact: bool = True) -> "PipelineCatalog":
+        """Catalog of ``builtins`` plus every loadable entry in ``root``; directory pipelines are compacted by default."""
+        entries = list(builtins)
+        names = {entry.name for entry in entries}
+        skipped: List[Tuple[Path, str]] = []
+        for path in sorted(Path(root).iterdir()):
+            if path.suffix not in CATALOG_SUFFIXES:
+                continue
+            try:
+                entry = load_entry(path)
+                if entry.name in names:
+                    raise ValueError(f"Duplicate pipeline name in catalog: {entry.name!r}")
+                if compact:
+                    entry = replace(entry, pipeline=entry.pipeline.compact())
+            except _LOAD_ERRORS as exc:
+                reason = f"{type(exc).__name__}: {exc}"
+                warnings.warn(f"Skipping catalog file {path.name}: {reason}", stacklevel=2)
+                skipped.append((path, reason))
+                continue
+            names.add(entry.name)
+            entries.append(entry)
+        return cls(entries, skipped)
+
+
+def _entry_from_mapping(data: Mapping, source: Path) -> CatalogEntry:
+    steps = [
+        Step(
+            str(s["id"]),
+            s.get("description", ""),
+            annotation=s.get("annotation"),
+            image=s.get("image"),
+            group=s.get("group"),
+        )
+        for s in data["steps"]
+    ]
+    pipeline = PipelineDef(
+        name=str(data.get("name") or source.stem[: -len(".catalog")]),
+        steps=steps,
+        edges=[(str(a), str(b)) for a, b in data.get("edges", ())],
+    )
+    return CatalogEntry(pipeline, data.get("summary", ""), dict(data.get("anchors") or {}), source)
+
+
+def load_entry(path: Path) -> CatalogEntry:
+    """Load one catalog directory file: a ``*.catalog.*`` mapping or a compiled KFP spec."""
+    if path.stem.endswith(".catalog"):
+        text = path.read_text(encoding="utf-8")
+        data = json.loads(text) if path.suffix == ".json" else yaml.load(text, Loader=_Loader)
+        return _entry_from_mapping(data, path)
+    return CatalogEntry(load_pipeline_spec(path), source=path)
+
+
+def builtin_entries() -> List[CatalogEntry]:
+    return [CatalogEntry(p, SUMMARIES.get(name, ""), ANCHORS.get(name, {})) for name, p in PIPELINES.items()]
+
+
+@lru_cache(maxsize=1)
+def default_catalog() -> PipelineCatalog:
+    """Built-in pipelines plus ``$KFP_VIZ_CATALOG_DIR``, built once per process."""
+    root = os.environ.get(CATALOG_DIR_ENV)
+    if root and Path(root).is_dir():
+        return PipelineCatalog.from_dir(Path(root), builtin_entries())
+    return PipelineCatalog(builtin_entries())
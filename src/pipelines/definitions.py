@@ -86,3 +86,20 @@ PIPELINES = {
     CDC_MERGE.name: CDC_MERGE,
     SNAPSHOT_DIFF.name: SNAPSHOT_DIFF,
 }
+
+SUMMARIES = {
+    SIMPLE_ETL.name: "Baseline extract → validate → transform → load flow.",
+    INCREMENTAL_LOAD.name: "Watermark-driven delta processing with idempotent merges.",
+    BACKFILL.name: "Partitioned reprocessing with metrics at the end.",
+    CDC_MERGE.name: "Change feed plus de-duplication before merge.",
+    SNAPSHOT_DIFF.name: "Full snapshot compare with applied deltas.",
+}
+
+# Step each optional pattern overlay (quality checks, metrics, lineage) attaches to.
+ANCHORS = {
+    SIMPLE_ETL.name: {"quality": "Validate", "metrics": "Load", "metadata": "Extract"},
+    INCREMENTAL_LOAD.name: {"quality": "Validate", "metrics": "Upsert", "metadata": "Update Watermark"},
+    BACKFILL.name: {"quality": "Transform", "metrics": "Publish Metrics", "metadata": "Plan Partitions"},
+    CDC_MERGE.name: {"quality": "Deduplicate", "metrics": "Audit Log", "metadata": "Merge Upsert"},
+    SNAPSHOT_DIFF.name: {"quality": "Compare Snapshots", "metrics": "Publish Metrics", "metadata": "Extract Snapshot"},
+}
@@ -0,0 +1,95 @@
+"""Structural diff between two versions of a pipeline.
+
+Steps are matched by id; a step whose id matches but whose signature
+(description, annotation, image, group) differs is reported as changed.
+Removed and added steps that share a signature unique on both sides are
+treated as renames, and edges are compared after applying those renames, so a
+renamed step does not show up as a pile of removed/added edges.
+
+Everything is dictionary/set based (no pairwise step comparison), so the diff
+is linear in the size of both pipelines.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src.models import PipelineDef, Step
+
+
+Signature = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
+def step_signature(step: Step) -> Signature:
+    """The compared fields themselves: no hash collisions, and stable across processes."""
+    return step.description, step.annotation, step.image, step.group
+
+
+@dataclass(frozen=True)
+class PipelineDiff:
+    old: PipelineDef
+    new: PipelineDef
+    added_steps: List[str] = field(default_factory=list)
+    removed_steps: List[str] = field(default_factory=list)
+    changed_steps: List[str] = field(default_factory=list)
+    renamed_steps: List[Tuple[str, str]] = field(default_factory=list)  # (old id, new id)
+    added_edges: List[Tuple[str, str]] = field(default_factory=list)
+    removed_edges: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return any(
+            (self.added_steps, self.removed_steps, self.changed_steps, self.renamed_steps, self.added_edges, self.removed_edges)
+        )
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "added steps": len(self.added_steps),
+            "removed steps": len(self.removed_steps),
+            "changed steps": len(self.changed_steps),
+            "renamed steps": len(self.renamed_steps),
+            "added edges": len(self.added_edges),
+            "removed edges": len(self.removed_edges),
+        }
+
+
+def _unique_by_signature(steps: List[Step]) -> Dict[Signature, str]:
+    seen: Dict[Signature, str] = {}
+    duplicated = set()
+    for step in steps:
+        sig = step_signature(step)
+        if sig in seen:
+            duplicated.add(sig)
+        seen[sig] = step.id
+    return {sig: step_id for sig, step_id in seen.items() if sig not in duplicated}
+
+
+def diff_pipelines(old: PipelineDef, new: PipelineDef) -> PipelineDiff:
+    old_steps = old.by_id
+    new_steps = new.by_id
+
+    added = [s for s in new_steps.values() if s.id not in old_steps]
+    removed = [s for s in old_steps.values() if s.id not in new_steps]
+    changed = [
+        step_id
+        for step_id, step in new_steps.items()
+        if step_id in old_steps and step_signature(old_steps[step_id]) != step_signature(step)
+    ]
+
+    added_sigs = _unique_by_signature(added)
+    removed_sigs = _unique_by_signature(removed)
+    renames = {removed_sigs[sig]: new_id for sig, new_id in added_sigs.items() if sig in removed_sigs}
+    renamed_new = set(renames.values())
+
+    old_edges = {(renames.get(a, a), renames.get(b, b)) for a, b in old.edges}
+    new_edges = set(new.edges)
+
+    return PipelineDiff(
+        old=old,
+        new=new,
+        added_steps=[s.id for s in added if s.id not in renamed_new],
+        removed_steps=[s.id for s in removed if s.id not in renames],
+        changed_steps=changed,
+        renamed_steps=list(renames.items()),
+        added_edges=[e for e in dict.fromkeys(new.edges) if e not in old_edges],
+        # Report removed edges with their original (pre-rename) endpoints.
+        removed_edges=[e for e in dict.fromkeys(old.edges) if (renames.get(e[0], e[0]), renames.get(e[1], e[1])) not in new_edges],
+    )
@@ -0,0 +1,208 @@
+"""Load compiled KFP v2 pipeline specs (IR YAML or JSON) into ``PipelineDef``.
+
+The document is read as a stream of YAML parse events (JSON is a subset of
+YAML, so one parser covers both). Only the subtrees the visualizer needs are
+materialised -- task graphs, executor labels and container images -- and
+everything else (embedded command scripts, input definitions, platform specs)
+is skipped event by event, so multi-megabyte templates are never held in
+memory as a full object tree.
+
+Mapping onto the model:
+
+- every task in ``root.dag.tasks`` becomes a ``Step``;
+- tasks whose component has its own ``dag`` (sub-pipelines, ParallelFor loops)
+  become a group step, and their inner tasks become steps with ids
+  ``"<group>/<task>"`` and ``Step.group`` set to the group step;
+- ``dependentTasks`` become edges. A dependency on a group is wired from the
+  group's inner sink steps, and a group fans out to its inner root steps;
+- the component's executor label (e.g. ``exec-train``) becomes
+  ``Step.annotation`` and the executor's container image is stored on
+  ``Step.image``.
+
+A component whose ``dag`` reaches itself again raises ``ValueError``.
+"""
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Set, Tuple, Union
+
+import yaml
+from yaml.events import (
+    AliasEvent,
+    CollectionEndEvent,
+    CollectionStartEvent,
+    DocumentEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    StreamEndEvent,
+)
+
+from src.models import PipelineDef, Step
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_BUILD = "build"
+_DESCEND = "descend"
+_SKIP = "skip"
+
+# Paths (relative to the pipeline spec) whose values are materialised.
+# "*" matches any single mapping key.
+_WANTED: Tuple[Tuple[str, ...], ...] = (
+    ("pipelineInfo", "name"),
+    ("root", "dag", "tasks"),
+    ("components", "*", "dag", "tasks"),
+    ("components", "*", "executorLabel"),
+    ("deploymentSpec", "executors", "*", "container", "image"),
+)
+
+# Vertex PipelineJob exports wrap the IR in a top-level ``pipelineSpec`` key.
+_WRAPPER_KEYS = ("pipelineSpec",)
+
+
+def _match(path: Tuple[str, ...]) -> str:
+    if path and path[0] in _WRAPPER_KEYS:
+        path = path[1:]
+        if not path:
+            return _DESCEND
+    action = _SKIP
+    for pattern in _WANTED:
+        if len(path) > len(pattern):
+            continue
+        if all(p == "*" or p == k for p, k in zip(pattern, path)):
+            if len(path) == len(pattern):
+                return _BUILD
+            action = _DESCEND
+    return action
+
+
+def _collect(events: Iterator[Any], first: Any) -> Any:
+    """Materialise the node that starts with ``first``."""
+    if isinstance(first, ScalarEvent):
+        return first.value
+    if isinstance(first, AliasEvent):
+        return None
+    if isinstance(first, MappingStartEvent):
+        mapping: Dict[Any, Any] = {}
+        for ev in events:
+            if isinstance(ev, CollectionEndEvent):
+                return mapping
+            key = _collect(events, ev)
+            mapping[key] = _collect(events, next(events))
+    else:
+        sequence: List[Any] = []
+        for ev in events:
+            if isinstance(ev, CollectionEndEvent):
+                return sequence
+            sequence.append(_collect(events, ev))
+    raise ValueError("Truncated pipeline spec")
+
+
+def _skip(events: Iterator[Any], first: Any) -> None:
+    if not isinstance(first, CollectionStartEvent):
+        return
+    depth = 1
+    for ev in events:
+        if isinstance(ev, CollectionStartEvent):
+            depth += 1
+        elif isinstance(ev, CollectionEndEvent):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def _visit(events: Iterator[Any], first: Any, path: Tuple[str, ...], out: Dict[Tuple[str, ...], Any]) -> None:
+    action = _match(path) if path else _DESCEND
+    if action == _BUILD:
+        out[path[1:] if path[0] in _WRAPPER_KEYS else path] = _collect(events, first)
+    elif action == _SKIP or not isinstance(first, MappingStartEvent):
+        _skip(events, first)
+    else:
+        for ev in events:
+            if isinstance(ev, CollectionEndEvent):
+                return
+            key = _collect(events, ev)
+            _visit(events, next(events), path + (str(key),), out)
+
+
+def _read_wanted(source: Union[str, bytes, IO]) -> Dict[Tuple[str, ...], Any]:
+    """Stream the first YAML/JSON document and return the wanted subtrees by path."""
+    out: Dict[Tuple[str, ...], Any] = {}
+    events = yaml.parse(source, Loader=_Loader)
+    for ev in events:
+        if isinstance(ev, (DocumentEndEvent, StreamEndEvent)):
+            break
+        if isinstance(ev, (CollectionStartEvent, ScalarEvent)):
+            _visit(events, ev, (), out)
+    return out
+
+
+class _SpecGraph:
+    def __init__(self, wanted: Dict[Tuple[str, ...], Any]):
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self.images: Dict[str, str] = {}  # executor label -> container image
+        for path, value in wanted.items():
+            if path[0] == "components":
+                comp = self.components.setdefault(path[1], {})
+                if path[2] == "dag":
+                    comp["tasks"] = value or {}
+                else:
+                    comp["executorLabel"] = value
+            elif path[0] == "deploymentSpec":
+                if path[3] == "container":
+                    self.images[path[2]] = value
+        self.steps: List[Step] = []
+        self.edges: List[Tuple[str, str]] = []
+        self._expanding: Set[str] = set()  # sub-DAG components on the current expansion path
+
+    def expand(self, tasks: Dict[str, Any], prefix: str, group: Union[str, None]) -> Dict[str, List[str]]:
+        """Add steps for ``tasks``; return each task's exit step ids (for dependents)."""
+        exits: Dict[str, List[str]] = {}
+        for name, task in tasks.items():
+            task = task or {}
+            sid = f"{prefix}{name}"
+            comp_name = (task.get("componentRef") or {}).get("name", "")
+            comp = self.components.get(comp_name, {})
+            description = comp_name[5:] if comp_name.startswith("comp-") else comp_name
+
+            if "tasks" in comp:
+                is_loop = "parameterIterator" in task or "artifactIterator" in task
+                self.steps.append(Step(sid, description, "ParallelFor" if is_loop else "Sub-DAG", group=group))
+                if comp_name in self._expanding:
+                    raise ValueError(f"Pipeline spec component {comp_name!r} contains itself")
+                inner = comp["tasks"]
+                self._expanding.add(comp_name)
+                inner_exits = self.expand(inner, f"{sid}/", sid)
+                self._expanding.discard(comp_name)
+                inner_roots = [n for n, t in inner.items() if not (t or {}).get("dependentTasks")]
+                for root in inner_roots:
+                    self.edges.append((sid, f"{sid}/{root}"))
+                depended_on = {d for t in inner.values() for d in (t or {}).get("dependentTasks") or []}
+                sinks = [x for n in inner if n not in depended_on for x in inner_exits[n]]
+                exits[name] = sinks or [sid]
+            else:
+                label = comp.get("executorLabel") or None
+                self.steps.append(Step(sid, description, label, image=self.images.get(label or ""), group=group))
+                exits[name] = [sid]
+
+        for name, task in tasks.items():
+            for dep in (task or {}).get("dependentTasks") or []:
+                for src in exits.get(dep, [f"{prefix}{dep}"]):
+                    self.edges.append((src, f"{prefix}{name}"))
+        return exits
+
+
+def load_pipeline_spec(source: Union[str, Path, IO], name: str = "") -> PipelineDef:
+    """Parse a compiled KFP v2 pipeline spec (path or open file) into a ``PipelineDef``."""
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        with path.open("rb") as fh:
+            wanted = _read_wanted(fh)
+        name = name or path.stem
+    else:
+        wanted = _read_wanted(source)
+
+    graph = _SpecGraph(wanted)
+    graph.expand(wanted.get(("root", "dag", "tasks")) or {}, "", None)
+    return PipelineDef(
+        name=wanted.get(("pipelineInfo", "name")) or name or "KFP pipeline",
+        steps=graph.steps,
+        edges=graph.edges,
+    )
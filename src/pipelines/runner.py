@@ -0,0 +1,321 @@
+"""Run a ``PipelineDef`` locally, one bound task per step.
+
+Each step is bound to a ``Task``: a Python callable, called with a dict of its
+predecessors' outputs keyed by step id, or a command, run as a subprocess
+with those outputs as JSON on stdin and its stripped stdout as output. Steps
+with no binding are no-ops that pass ``None`` on and are left out of
+``metrics()`` and the run history.
+
+Steps are dispatched in topological order from a ready queue onto a thread
+or process pool (whose callables must be picklable), so independent branches
+run concurrently. Per task:
+
+- ``retries``: extra attempts after a failure or timeout;
+- ``timeout_s``: counted from the start of each attempt. Subprocesses are
+  killed; a Python callable with a timeout runs in a process of its own
+  (``multiprocessing``, so under the spawn or forkserver start methods the
+  callable, its inputs and its output must be picklable) that is terminated
+  when the timeout expires, freeing its pool worker for the retry;
+- ``cache``: with a ``RunCache``, the output is reused when the task and the
+  hashes of its inputs are unchanged.
+
+Commands are argument sequences; a plain string binding is split with
+``shlex.split``. A step that fails after its retries marks everything downstream as
+``upstream_failed``; other branches keep running. ``RunResult.metrics()``
+returns ``StepMetrics`` for ``timing_overlay``, and ``write_history`` exports
+the same run-history format the Visualizer's uploader reads.
+"""
+import hashlib
+import json
+import multiprocessing
+import pickle
+import shlex
+import subprocess
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.models import PipelineDef
+from src.pipelines.timing import StepMetrics
+
+SUCCEEDED, CACHED, FAILED, UPSTREAM_FAILED = "succeeded", "cached", "failed", "upstream_failed"
+
+
+@dataclass(frozen=True)
+class Task:
+    fn: Optional[Callable[[Dict[str, Any]], Any]] = None
+    cmd: Optional[Sequence[str]] = None
+    retries: int = 0
+    timeout_s: Optional[float] = None
+    cache: bool = True
+
+    def __post_init__(self):
+        if (self.fn is None) == (self.cmd is None):
+            raise ValueError("A Task needs exactly one of fn or cmd")
+        if isinstance(self.cmd, str):
+            raise ValueError(f"Task cmd must be a sequence of arguments, not the string {self.cmd!r}")
+
+    @property
+    def identity(self) -> str:
+        if self.cmd is not None:
+            return json.dumps(list(self.cmd))
+        return f"{getattr(self.fn, '__module__', '')}.{getattr(self.fn, '__qualname__', repr(self.fn))}"
+
+
+Binding = Union[Task, Callable[[Dict[str, Any]], Any], Sequence[str], str]
+
+
+def _task(binding: Binding) -> Task:
+    if isinstance(binding, Task):
+        return binding
+    if callable(binding):
+        return Task(fn=binding)
+    if isinstance(binding, str):
+        return Task(cmd=shlex.split(binding))
+    return Task(cmd=list(binding))
+
+
+def _child(fn: Callable[[Dict[str, Any]], Any], inputs: Dict[str, Any], conn) -> None:
+    try:
+        outcome = (True, fn(inputs))
+    except BaseException as exc:
+        outcome = (False, exc)
+    try:
+        conn.send(outcome)
+    except Exception as exc:  # unpicklable output or exception
+        conn.send((False, RuntimeError(f"{type(exc).__name__}: {exc}")))
+    finally:
+        conn.close()
+
+
+def _call_in_process(task: Task, inputs: Dict[str, Any]) -> Any:
+    """Call ``task.fn`` in a child process, terminated if it outlives ``task.timeout_s``."""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    proc = multiprocessing.Process(target=_child, args=(task.fn, inputs, sender), daemon=True)
+    proc.start()
+    sender.close()
+    try:
+        if not receiver.poll(task.timeout_s):
+            raise TimeoutError(f"timed out after {task.timeout_s}s")
+        try:
+            ok, value = receiver.recv()
+        except EOFError:
+            proc.join()
+            raise RuntimeError(f"task process exited with {proc.exitcode}") from None
+    finally:
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+        receiver.close()
+    if not ok:
+        raise value
+    return value
+
+
+def _call(task: Task, inputs: Dict[str, Any]) -> Any:
+    if task.fn is not None:
+        return _call_in_process(task, inputs) if task.timeout_s else task.fn(inputs)
+    proc = subprocess.run(
+        list(task.cmd),
+        input=json.dumps(inputs, default=str),
+        capture_output=True,
+        text=True,
+        timeout=task.timeout_s,
+    )
+    if proc.returncode:
+        raise RuntimeError(f"{task.cmd[0]} exited with {proc.returncode}: {proc.stderr.strip()[-500:]}")
+    return proc.stdout.strip()
+
+
+def _execute(task: Task, inputs: Dict[str, Any]) -> Tuple[float, Any, float]:
+    """One attempt of ``task`` as ``(start, output, end)`` wall-clock times (module level so process pools can pickle it)."""
+    start = time.time()
+    output = _call(task, inputs)
+    return start, output, time.time()
+
+
+def _digest(value: Any) -> str:
+    try:
+        data = pickle.dumps(value, protocol=4)
+    except Exception:
+        data = repr(value).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class RunCache:
+    """Step outputs keyed by task identity and input hashes; in memory, or pickled under ``directory``."""
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None):
+        self.directory = Path(directory) if directory else None
+        self._entries: Dict[str, Any] = {}
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(step_id: str, task: Task, inputs: Mapping[str, Any]) -> str:
+        parts = [step_id, task.identity] + [f"{name}={_digest(value)}" for name, value in sorted(inputs.items())]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        if key in self._entries:
+            return True, self._entries[key]
+        if self.directory is not None:
+            path = self.directory / f"{key}.pkl"
+            if path.exists():
+                value = self._entries[key] = pickle.loads(path.read_bytes())
+                return True, value
+        return False, None
+
+    def put(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        if self.directory is not None:
+            path = self.directory / f"{key}.pkl"
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(pickle.dumps(value, protocol=4))
+            tmp.replace(path)
+
+
+@dataclass
+class StepRun:
+    status: str = UPSTREAM_FAILED
+    attempts: int = 0
+    start_s: float = 0.0  # seconds since the run started; the successful attempt's window when it ran
+    end_s: float = 0.0
+    output: Any = None
+    error: Optional[str] = None
+
+    @property
+    def duration_s(self) -> float:
+        return self.end_s - self.start_s
+
+
+@dataclass
+class RunResult:
+    pipeline: str
+    steps: Dict[str, StepRun] = field(default_factory=dict)
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(s.status in (SUCCEEDED, CACHED) for s in self.steps.values())
+
+    def metrics(self) -> Dict[str, StepMetrics]:
+        """Wall-clock duration of every step that ran, for ``timing_overlay``/``critical_path``."""
+        return {
+            step_id: StepMetrics(run.duration_s, runs=1)
+            for step_id, run in self.steps.items()
+            if run.attempts
+        }
+
+    def records(self) -> List[Dict[str, Any]]:
+        """One run-history row per step that ran; no-op, cached and skipped steps would skew average durations."""
+        return [
+            {"pipeline": self.pipeline, "step": step_id, "duration_s": run.duration_s, "status": run.status,
+             "attempts": run.attempts, "start_s": run.start_s, "error": run.error or ""}
+            for step_id, run in self.steps.items()
+            if run.attempts  # unbound no-ops, cached and skipped steps made no attempt
+        ]
+
+    def write_history(self, path: Union[str, Path]) -> Path:
+        """Append this run to a JSONL run history (loadable with ``load_step_metrics``)."""
+        path = Path(path)
+        with path.open("a", encoding="utf-8") as fh:
+            for record in self.records():
+                fh.write(json.dumps(record) + "\n")
+        return path
+
+
+def run_pipeline(
+    p: PipelineDef,
+    bindings: Mapping[str, Binding],
+    max_workers: int = 4,
+    processes: bool = False,
+    cache: Optional[RunCache] = None,
+) -> RunResult:
+    """Execute ``p`` with ``bindings[step_id]`` per step; raises ``ValueError`` on cycles."""
+    idx = p.index
+    ids = idx.ids
+    order = idx.topological_order()
+    unknown = set(bindings) - set(ids)
+    if unknown:
+        raise ValueError(f"Bindings for unknown step(s): {', '.join(sorted(unknown))}")
+    tasks = {step_id: _task(binding) for step_id, binding in bindings.items()}
+    result = RunResult(p.name, {ids[i]: StepRun() for i in order})
+    remaining = [idx.in_degree(i) for i in range(len(ids))]
+    ready = deque(i for i in order if remaining[i] == 0)
+    running: Dict[Future, int] = {}  # future -> node
+    started = time.time()
+
+    def now() -> float:
+        return time.time() - started
+
+    def inputs(i: int) -> Dict[str, Any]:
+        return {ids[j]: result.steps[ids[j]].output for j in idx.predecessor_ids(i)}
+
+    def finish(i: int, status: str) -> None:
+        run = result.steps[ids[i]]
+        run.status = status
+        if status != SUCCEEDED:
+            run.end_s = now()
+        if status in (SUCCEEDED, CACHED):
+            for j in idx.successor_ids(i):
+                remaining[j] -= 1
+                if remaining[j] == 0:
+                    ready.append(j)
+
+    pool: Executor = ProcessPoolExecutor(max_workers) if processes else ThreadPoolExecutor(max_workers)
+    try:
+        def submit(i: int) -> None:
+            task = tasks[ids[i]]
+            result.steps[ids[i]].attempts += 1
+            running[pool.submit(_execute, task, inputs(i))] = i
+
+        while ready or running:
+            while ready:
+                i = ready.popleft()
+                run = result.steps[ids[i]]
+                run.start_s = now()
+                task = tasks.get(ids[i])
+                if task is None:
+                    run.end_s = run.start_s
+                    finish(i, SUCCEEDED)
+                    continue
+                if cache is not None and task.cache:
+                    hit, output = cache.get(RunCache.key(ids[i], task, inputs(i)))
+                    if hit:
+                        run.output = output
+                        finish(i, CACHED)
+                        continue
+                submit(i)
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                run, task = result.steps[ids[i]], tasks[ids[i]]
+                if future.exception() is None:
+                    attempt_start, run.output, attempt_end = future.result()
+                    run.start_s, run.end_s = attempt_start - started, attempt_end - started
+                    run.error = None
+                    if cache is not None and task.cache:
+                        cache.put(RunCache.key(ids[i], task, inputs(i)), run.output)
+                    finish(i, SUCCEEDED)
+                    continue
+                exc = future.exception()
+                if isinstance(exc, (subprocess.TimeoutExpired, TimeoutError)):
+                    run.error = f"timed out after {task.timeout_s}s"
+                else:
+                    run.error = f"{type(exc).__name__}: {exc}"
+                if run.attempts <= task.retries:
+                    submit(i)
+                else:
+                    finish(i, FAILED)
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+    result.elapsed_s = now()
+    return result
@@ -0,0 +1,191 @@
+"""Full-text and path search over every step of a set of pipelines.
+
+Steps are numbered globally (pipeline by pipeline, in ``DagIndex`` order) and
+an inverted index maps each lower-cased word of a step's id, description,
+annotation and image to the set of step numbers containing it, both for any
+field and per field (``id:``, ``description:``, ``annotation:``, ``image:``).
+
+Path queries chain step terms with arrows::
+
+    Validate -> Load              Validate directly followed by Load
+    Validate -> * -> Load         exactly one (any) step in between
+    Validate ->> annotation:bigquery   a BigQuery step anywhere downstream
+
+A term is one or more words that must all match the same step; ``*`` matches
+any step. Term matches come from the inverted index and adjacency from each
+pipeline's CSR ``DagIndex``, so no edge list is scanned at query time.
+"""
+import re
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from src.models import PipelineDef
+from src.pipelines.catalog import StepRef, default_catalog
+
+FIELDS = ("id", "description", "annotation", "image")
+_WORD = re.compile(r"\w+")
+_ARROW = re.compile(r"\s*(->>|->)\s*")
+REACHABLE_MEMO_ITEMS = 1_000_000  # step numbers kept in one query's descendant memo
+
+Term = Optional[Tuple[Tuple[Optional[str], str], ...]]  # None is the ``*`` wildcard
+
+
+@dataclass(frozen=True)
+class PathMatch:
+    pipeline: str
+    steps: Tuple[str, ...]  # one step per query term
+
+
+def _words(text: Optional[str]) -> Set[str]:
+    return set(_WORD.findall(text.casefold())) if text else set()
+
+
+def parse_term(text: str) -> Term:
+    text = text.strip()
+    if text == "*":
+        return None
+    parts = []
+    for token in text.split():
+        field, sep, value = token.partition(":")
+        if sep and field.casefold() in FIELDS:
+            parts += [(field.casefold(), word) for word in _words(value)]
+        else:
+            parts += [(None, word) for word in _words(token)]
+    if not parts:
+        raise ValueError(f"Empty search term in {text!r}")
+    return tuple(parts)
+
+
+def parse_query(query: str) -> Tuple[List[Term], List[str]]:
+    """Split ``a -> b ->> c`` into terms ``[a, b, c]`` and operators ``["->", "->>"]``."""
+    pieces = _ARROW.split(query.strip())
+    terms = [parse_term(piece) for piece in pieces[0::2]]
+    return terms, pieces[1::2]
+
+
+class SearchIndex:
+    def __init__(self, pipelines: Iterable[PipelineDef]):
+        self.pipelines: List[PipelineDef] = list(pipelines)
+        self._offsets = array("I")
+        self._pipeline_of = array("I")
+        self._postings: Dict[Tuple[Optional[str], str], Set[int]] = {}
+        g = 0
+        for pi, p in enumerate(self.pipelines):
+            self._offsets.append(g)
+            by_id = p.by_id
+            for step_id in p.index.ids:
+                step = by_id[step_id]
+                self._pipeline_of.append(pi)
+                for field, value in zip(FIELDS, (step.id, step.description, step.annotation, step.image)):
+                    for word in _words(value):
+                        self._postings.setdefault((field, word), set()).add(g)
+                        self._postings.setdefault((None, word), set()).add(g)
+                g += 1
+        self._offsets.append(g)
+
+    def __len__(self) -> int:
+        return len(self._pipeline_of)
+
+    def _ref(self, g: int) -> StepRef:
+        p = self.pipelines[self._pipeline_of[g]]
+        return p.name, p.index.ids[g - self._offsets[self._pipeline_of[g]]]
+
+    def _match(self, term: Term) -> Optional[Set[int]]:
+        if term is None:
+            return None
+        postings = sorted((self._postings.get(key, set()) for key in term), key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def _successors(self, g: int) -> Iterable[int]:
+        pi = self._pipeline_of[g]
+        base = self._offsets[pi]
+        return [base + j for j in self.pipelines[pi].index.successor_ids(g - base)]
+
+    def _reachable(self, g: int) -> FrozenSet[int]:
+        seen: Set[int] = set()
+        stack = list(self._successors(g))
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                stack.extend(self._successors(node))
+        return frozenset(seen)
+
+    def _matching(self, text: str) -> Iterable[int]:
+        """Step numbers matching ``text`` in order; ``*`` matches every step."""
+        matches = self._match(parse_term(text))
+        return range(len(self)) if matches is None else sorted(matches)
+
+    def steps(self, text: str) -> List[StepRef]:
+        """Steps matching every word of ``text`` (field prefixes allowed, e.g. ``annotation:merge``)."""
+        return [self._ref(g) for g in self._matching(text)]
+
+    def pipelines_with(self, text: str) -> List[str]:
+        return [self.pipelines[i].name for i in sorted({self._pipeline_of[g] for g in self._matching(text)})]
+
+    def query(self, query: str, limit: Optional[int] = None) -> List[PathMatch]:
+        """Step paths matching ``query`` (see the module docstring), grouped by pipeline."""
+        terms, ops = parse_query(query)
+        allowed = [self._match(term) for term in terms]
+        if limit == 0 or any(a is not None and not a for a in allowed):
+            return []
+        # Only pipelines containing a match for every non-wildcard term can match.
+        candidate_pipelines: Optional[Set[int]] = None
+        for matches in allowed:
+            if matches is not None:
+                owners = {self._pipeline_of[g] for g in matches}
+                candidate_pipelines = owners if candidate_pipelines is None else candidate_pipelines & owners
+        if allowed[0] is not None:
+            starts: Sequence[int] = sorted(allowed[0])
+        else:
+            pis = sorted(candidate_pipelines) if candidate_pipelines is not None else range(len(self.pipelines))
+            starts = [g for pi in pis for g in range(self._offsets[pi], self._offsets[pi + 1])]
+
+        # Depth-first, so results come out in the same order as a level-by-level
+        # expansion but the search stops as soon as ``limit`` paths are found.
+        memo: Dict[int, FrozenSet[int]] = {}  # descendants, for this query only
+        memo_items = 0
+
+        def reachable(g: int) -> FrozenSet[int]:
+            nonlocal memo_items
+            found = memo.get(g)
+            if found is None:
+                found = self._reachable(g)
+                if memo_items + len(found) <= REACHABLE_MEMO_ITEMS:
+                    memo[g] = found
+                    memo_items += len(found)
+            return found
+
+        def extend(path: Tuple[int, ...]) -> Iterator[Tuple[int, ...]]:
+            depth = len(path) - 1
+            if depth == len(ops):
+                yield path
+                return
+            matches = allowed[depth + 1]
+            if ops[depth] == "->":
+                nexts = [g for g in self._successors(path[-1]) if matches is None or g in matches]
+            else:
+                below = reachable(path[-1])
+                nexts = sorted(below if matches is None else below & matches)
+            for g in nexts:
+                yield from extend(path + (g,))
+
+        results = []
+        for start in starts:
+            if candidate_pipelines is not None and self._pipeline_of[start] not in candidate_pipelines:
+                continue
+            for path in extend((start,)):
+                refs = [self._ref(g) for g in path]
+                results.append(PathMatch(refs[0][0], tuple(step for _, step in refs)))
+                if limit is not None and len(results) >= limit:
+                    return results
+        return results
+
+
+@lru_cache(maxsize=1)
+def default_index() -> SearchIndex:
+    """Search index over ``default_catalog()``, built once per process."""
+    catalog = default_catalog()
+    return SearchIndex(catalog[name] for name in catalog.names())
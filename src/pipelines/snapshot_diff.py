@@ -0,0 +1,253 @@
+"""Hash-partitioned diff of two tabular snapshots (CSV or Parquet).
+
+``diff_snapshots`` runs in two passes so memory stays bounded by one chunk
+and one partition rather than by the snapshots:
+
+1. Each snapshot is streamed in chunks; every row is assigned to one of
+   ``partitions`` buckets by a hash of its key and appended to that bucket's
+   Parquet file, together with a hash of the whole row.
+2. Buckets are diffed independently in a process pool: an outer join on the
+   key of the old and new bucket (key and row hash only) classifies keys as
+   inserted, deleted or updated (same key, different row hash), and the full
+   new rows of inserts and updates, plus the deleted keys, are written to
+   ``<out_dir>/{inserts,updates,deletes}/part-NNNNN.parquet``.
+
+``diff_frames`` is the in-memory version for data that already fits, and is
+what each worker runs on its bucket; keys must be unique within each snapshot.
+Row hashes depend on column dtypes, so compare snapshots written the same way
+(both CSV or both Parquet). CSV dtypes are inferred once, from the first
+chunk of both snapshots and widened per column to a type both fit (an integer
+column with a null on one side is float64 on both), or given with ``dtype=``.
+Every chunk of both files is parsed with that schema; a later chunk that does
+not fit raises rather than hashing differently.
+"""
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+ROW_HASH = "__row_hash"
+KINDS = ("inserts", "updates", "deletes")
+DEFAULT_PARTITIONS = 64
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+Key = Union[str, Sequence[str]]
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    out_dir: Path
+    old_rows: int
+    new_rows: int
+    inserts: int
+    updates: int
+    deletes: int
+    partition_s: float
+    diff_s: float
+
+    @property
+    def rows_per_s(self) -> float:
+        """Rows of both snapshots processed per second, end to end."""
+        total = self.partition_s + self.diff_s
+        return (self.old_rows + self.new_rows) / total if total else float("inf")
+
+    def read(self, kind: str) -> pd.DataFrame:
+        """All ``inserts``, ``updates`` or ``deletes`` as one frame (only for diffs that fit in memory)."""
+        files = sorted((self.out_dir / kind).glob("*.parquet"))
+        return pd.concat([pd.read_parquet(f) for f in files], ignore_index=True) if files else pd.DataFrame()
+
+
+def _keys(key: Key) -> List[str]:
+    return [key] if isinstance(key, str) else list(key)
+
+
+def row_hashes(frame: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def diff_frames(old: pd.DataFrame, new: pd.DataFrame, key: Key) -> Dict[str, pd.DataFrame]:
+    """``{"inserts": new rows, "updates": new rows, "deletes": old keys}`` between two frames."""
+    keys = _keys(key)
+    for name, frame in (("old", old), ("new", new)):
+        duplicated = frame.duplicated(keys)
+        if duplicated.any():
+            sample = frame.loc[duplicated, keys].head(3).to_dict("records")
+            raise ValueError(f"Duplicate key(s) in the {name} snapshot ({int(duplicated.sum())} rows), e.g. {sample}")
+    old_hash = old[keys].assign(**{ROW_HASH: old[ROW_HASH] if ROW_HASH in old else row_hashes(old)})
+    new_hash = new[keys].assign(**{ROW_HASH: new[ROW_HASH] if ROW_HASH in new else row_hashes(new)})
+    joined = old_hash.merge(new_hash, on=keys, how="outer", suffixes=("_old", "_new"), indicator=True)
+    side = joined["_merge"].to_numpy()
+    changed = (side == "both") & (joined[ROW_HASH + "_old"].to_numpy() != joined[ROW_HASH + "_new"].to_numpy())
+
+    payload = new.drop(columns=[ROW_HASH], errors="ignore")
+    inserted = joined.loc[side == "right_only", keys]
+    updated = joined.loc[changed, keys]
+    return {
+        "inserts": payload.merge(inserted, on=keys, how="inner"),
+        "updates": payload.merge(updated, on=keys, how="inner"),
+        "deletes": joined.loc[side == "left_only", keys].reset_index(drop=True),
+    }
+
+
+def synthetic_snapshots(
+    rows: int, change_rate: float = 0.03, seed: int = 0, start: int = 0, insert_start: Optional[int] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Old/new snapshots keyed by ``id`` (``start`` onwards); ``change_rate`` splits evenly into updates, deletes and inserts.
+
+    Inserted ids start at ``insert_start`` (default: just past the old ids).
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(start, start + rows, dtype=np.int64)
+    old = pd.DataFrame(
+        {
+            "id": ids,
+            "amount": rng.integers(0, 1_000_000, rows),
+            "score": rng.random(rows),
+            "status": rng.choice(["new", "active", "closed"], rows),
+        }
+    )
+    roll = rng.random(rows)
+    deleted = roll < change_rate / 3
+    updated = (roll >= change_rate / 3) & (roll < 2 * change_rate / 3)
+    new = old.assign(amount=np.where(updated, old["amount"] + 1, old["amount"]))[~deleted]
+    inserted = int(rows * change_rate / 3)
+    first = start + rows if insert_start is None else insert_start
+    added = pd.DataFrame(
+        {
+            "id": np.arange(first, first + inserted, dtype=np.int64),
+            "amount": rng.integers(0, 1_000_000, inserted),
+            "score": rng.random(inserted),
+            "status": rng.choice(["new", "active", "closed"], inserted),
+        }
+    )
+    return old, pd.concat([new, added], ignore_index=True)
+
+
+def _common_dtype(a, b):
+    if a == b:
+        return a
+    try:
+        return np.result_type(a, b)
+    except TypeError:  # pandas extension dtypes
+        return np.dtype(object)
+
+
+def _csv_schema(paths: Sequence[Path], chunk_rows: int, dtype: Optional[Mapping[str, object]] = None) -> Dict[str, object]:
+    """Column dtypes every chunk of every CSV in ``paths`` is parsed with (see the module docstring)."""
+    schema: Dict[str, object] = {}
+    for path in paths:
+        for name, column_dtype in pd.read_csv(path, nrows=chunk_rows, dtype=dtype).dtypes.items():
+            schema[name] = _common_dtype(schema[name], column_dtype) if name in schema else column_dtype
+    return schema
+
+
+def _chunks(path: Path, chunk_rows: int, schema: Optional[Mapping[str, object]] = None) -> Iterator[pd.DataFrame]:
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    elif suffix == ".csv":
+        # Per-chunk inference could read a column as int64 in one chunk and float64 in the next.
+        yield from pd.read_csv(path, chunksize=chunk_rows, dtype=schema or _csv_schema([path], chunk_rows))
+    else:
+        raise ValueError(f"Unsupported snapshot format: {suffix or '(no extension)'}")
+
+
+def _partition(
+    path: Path, keys: List[str], partitions: int, bucket_dir: Path, chunk_rows: int, schema: Optional[Mapping[str, object]] = None
+) -> int:
+    """Split ``path`` into ``bucket_dir/NNNNN.parquet`` by key hash; return the row count."""
+    bucket_dir.mkdir(parents=True, exist_ok=True)
+    writers: Dict[int, pq.ParquetWriter] = {}
+    rows = 0
+    try:
+        for chunk in _chunks(path, chunk_rows, schema):
+            rows += len(chunk)
+            chunk[ROW_HASH] = row_hashes(chunk)
+            bucket = pd.util.hash_pandas_object(chunk[keys], index=False).to_numpy() % np.uint64(partitions)
+            order = np.argsort(bucket, kind="stable")
+            ends = np.cumsum(np.bincount(bucket.astype(np.int64), minlength=partitions))
+            table = pa.Table.from_pandas(chunk.iloc[order], preserve_index=False)
+            start = 0
+            for b, end in enumerate(ends.tolist()):
+                if end > start:
+                    writer = writers.get(b)
+                    if writer is None:
+                        writer = writers[b] = pq.ParquetWriter(bucket_dir / f"{b:05d}.parquet", table.schema)
+                    writer.write_table(table.slice(start, end - start).cast(writer.schema))
+                start = end
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return rows
+
+
+def _read_bucket(path: Path, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    return pd.read_parquet(path, columns=columns) if path.exists() else None
+
+
+def _diff_bucket(args: Tuple[int, Path, Path, List[str], Path]) -> Tuple[int, int, int]:
+    bucket, old_dir, new_dir, keys, out_dir = args
+    name = f"{bucket:05d}.parquet"
+    old = _read_bucket(old_dir / name, keys + [ROW_HASH])
+    new = _read_bucket(new_dir / name)
+    if old is None and new is None:
+        return 0, 0, 0
+    if old is None:
+        old = new.iloc[:0][keys + [ROW_HASH]]
+    if new is None:
+        new = pd.read_parquet(old_dir / name).iloc[:0]
+    result = diff_frames(old, new, keys)
+    for kind, frame in result.items():
+        if len(frame):
+            frame.to_parquet(out_dir / kind / f"part-{name}", index=False)
+    return tuple(len(result[kind]) for kind in KINDS)
+
+
+def diff_snapshots(
+    old_path: Union[str, Path],
+    new_path: Union[str, Path],
+    key: Key,
+    out_dir: Union[str, Path],
+    partitions: int = DEFAULT_PARTITIONS,
+    workers: Optional[int] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    dtype: Optional[Mapping[str, object]] = None,
+) -> SnapshotDiff:
+    """Diff two snapshot files by ``key`` into ``out_dir``; ``workers=1`` diffs buckets in-process.
+
+    ``dtype`` pins CSV column dtypes (as for ``pandas.read_csv``) in both files.
+    """
+    keys = _keys(key)
+    old_path, new_path, out_dir = Path(old_path), Path(new_path), Path(out_dir)
+    csv_paths = [path for path in (old_path, new_path) if path.suffix.lower() == ".csv"]
+    schema = _csv_schema(csv_paths, chunk_rows, dtype) if csv_paths else None
+    for kind in KINDS:
+        shutil.rmtree(out_dir / kind, ignore_errors=True)
+        (out_dir / kind).mkdir(parents=True)
+    workers = workers or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory(prefix="snapshot-diff-", dir=out_dir) as scratch:
+        start = time.perf_counter()
+        old_rows = _partition(old_path, keys, partitions, Path(scratch) / "old", chunk_rows, schema)
+        new_rows = _partition(new_path, keys, partitions, Path(scratch) / "new", chunk_rows, schema)
+        partitioned = time.perf_counter()
+        jobs = [(b, Path(scratch) / "old", Path(scratch) / "new", keys, out_dir) for b in range(partitions)]
+        if workers == 1:
+            counts = [_diff_bucket(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                counts = list(pool.map(_diff_bucket, jobs))
+        done = time.perf_counter()
+
+    inserts, updates, deletes = (sum(c[i] for c in counts) for i in range(3))
+    return SnapshotDiff(out_dir, old_rows, new_rows, inserts, updates, deletes, partitioned - start, done - partitioned)
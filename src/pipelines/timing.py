@@ -0,0 +1,134 @@
+"""Per-step run metrics and critical-path analysis.
+
+Run history is a local export of per-step records (CSV, JSONL or Parquet) with
+at least a ``step`` and a ``duration_s`` column; ``cost`` and ``pipeline`` are
+optional. Multiple records per step (several runs) are averaged; rows whose
+``status`` says the step did not run (cached, upstream failed) are skipped.
+
+``critical_path`` is the classic forward/backward pass over the DAG in
+topological order, O(V + E) on the pipeline's adjacency index.
+"""
+import csv
+import io
+import json
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, ContextManager, Dict, Iterable, List, Mapping, Optional, Union
+
+from src.models import PipelineDef
+
+STEP_COLUMNS = ("step", "step_id", "task", "task_name")
+DURATION_COLUMNS = ("duration_s", "duration", "duration_seconds")
+SKIPPED_STATUSES = ("cached", "upstream_failed")
+
+
+@dataclass(frozen=True)
+class StepMetrics:
+    duration_s: float
+    cost: float = 0.0
+    runs: int = 1
+
+
+@dataclass(frozen=True)
+class CriticalPath:
+    path: List[str]
+    makespan_s: float
+    earliest_start: Dict[str, float]
+    latest_start: Dict[str, float]
+
+    def slack(self, step_id: str) -> float:
+        return self.latest_start[step_id] - self.earliest_start[step_id]
+
+
+def _pick(row: Mapping[str, object], names: Iterable[str]) -> Optional[object]:
+    for name in names:
+        value = row.get(name)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _open_text(source: Union[Path, IO]) -> ContextManager[IO[str]]:
+    if isinstance(source, Path):
+        return source.open(newline="", encoding="utf-8")
+    # Caller-owned streams (e.g. Streamlit uploads) are left open.
+    if isinstance(source, io.TextIOBase):
+        return nullcontext(source)
+    return nullcontext(io.StringIO(source.read().decode("utf-8"), newline=""))
+
+
+def _read_rows(source: Union[Path, IO]) -> Iterable[Mapping[str, object]]:
+    suffix = Path(source if isinstance(source, Path) else getattr(source, "name", "")).suffix.lower()
+    if suffix == ".csv":
+        with _open_text(source) as fh:
+            yield from csv.DictReader(fh)
+    elif suffix in (".jsonl", ".ndjson"):
+        with _open_text(source) as fh:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+    elif suffix == ".parquet":
+        try:
+            import pandas as pd
+        except ImportError as exc:
+            raise ImportError("Reading Parquet run history requires pandas and pyarrow") from exc
+        yield from pd.read_parquet(source).to_dict("records")
+    else:
+        raise ValueError(f"Unsupported run-history format: {suffix or '(no extension)'}")
+
+
+def load_step_metrics(source: Union[str, Path, IO], pipeline: Optional[str] = None) -> Dict[str, StepMetrics]:
+    """Average duration and cost per step from a run-history export (path or named file object)."""
+    totals: Dict[str, List[float]] = {}
+    for row in _read_rows(Path(source) if isinstance(source, str) else source):
+        if pipeline is not None and row.get("pipeline") not in (None, "", pipeline):
+            continue
+        if str(row.get("status") or "").lower() in SKIPPED_STATUSES:
+            continue
+        step = _pick(row, STEP_COLUMNS)
+        duration = _pick(row, DURATION_COLUMNS)
+        if step is None or duration is None:
+            continue
+        acc = totals.setdefault(str(step), [0.0, 0.0, 0])
+        acc[0] += float(duration)
+        acc[1] += float(row.get("cost") or 0.0)
+        acc[2] += 1
+    return {step: StepMetrics(d / n, c / n, int(n)) for step, (d, c, n) in totals.items()}
+
+
+def critical_path(p: PipelineDef, durations: Mapping[str, float]) -> CriticalPath:
+    """Longest duration-weighted path through ``p``; steps without a duration count as 0."""
+    idx = p.index
+    ids = idx.ids
+    order = idx.topological_order()
+    dur = [float(durations.get(step_id, 0.0)) for step_id in ids]
+
+    earliest = [0.0] * len(ids)
+    via = [-1] * len(ids)
+    for i in order:
+        finish = earliest[i] + dur[i]
+        for j in idx.successor_ids(i):
+            if finish > earliest[j]:
+                earliest[j] = finish
+                via[j] = i
+    makespan = max((earliest[i] + dur[i] for i in range(len(ids))), default=0.0)
+
+    latest_finish = [makespan] * len(ids)
+    for i in reversed(order):
+        for j in idx.successor_ids(i):
+            latest_finish[i] = min(latest_finish[i], latest_finish[j] - dur[j])
+
+    path: List[int] = []
+    if ids:
+        end = max(range(len(ids)), key=lambda i: earliest[i] + dur[i])
+        while end != -1:
+            path.append(end)
+            end = via[end]
+
+    return CriticalPath(
+        path=[ids[i] for i in reversed(path)],
+        makespan_s=makespan,
+        earliest_start={ids[i]: earliest[i] for i in range(len(ids))},
+        latest_start={ids[i]: latest_finish[i] - dur[i] for i in range(len(ids))},
+    )
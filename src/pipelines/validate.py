@@ -0,0 +1,205 @@
+"""Structural validation of a ``PipelineDef``.
+
+``validate_pipeline`` reports, in one linear pass over the pipeline's CSR
+index:
+
+- ``duplicate-step``: a step id declared more than once (later ones are ignored);
+- ``dangling-edge``: an edge whose endpoint is not a declared step (``build_graph``
+  silently skips these);
+- ``duplicate-edge``: the same edge listed more than once;
+- ``cycle``: each strongly connected component with more than one step, and
+  self-loops;
+- ``orphan``: a step with no edges at all, in a pipeline with several steps;
+- ``unreachable``: a step that no source step (in-degree 0) can reach, i.e. one
+  only entered through a cycle.
+
+Strongly connected components use an iterative Tarjan with an explicit stack,
+so 100k-step pipelines do not hit the recursion limit. Reports are cached per
+pipeline content hash.
+"""
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from src.models import DagIndex, PipelineDef
+
+ERROR = "error"
+WARNING = "warning"
+DEFAULT_MAX_ENTRIES = 256
+MAX_NAMED_STEPS = 8  # step ids spelled out in a message; the diagnostic carries all of them
+
+
+@dataclass(frozen=True)
+class Diagnostic:
+    severity: str  # ERROR or WARNING
+    code: str
+    message: str
+    steps: Tuple[str, ...] = ()
+    edges: Tuple[Tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class ValidationReport:
+    pipeline: str
+    diagnostics: List[Diagnostic] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[Diagnostic]:
+        return [d for d in self.diagnostics if d.severity == ERROR]
+
+    @property
+    def warnings(self) -> List[Diagnostic]:
+        return [d for d in self.diagnostics if d.severity == WARNING]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def records(self) -> List[dict]:
+        return [{"severity": d.severity, "code": d.code, "message": d.message} for d in self.diagnostics]
+
+
+def strongly_connected_components(idx: DagIndex) -> List[List[int]]:
+    """Tarjan's SCCs over ``idx`` (node ids), iteratively; components come out in reverse topological order."""
+    n = len(idx)
+    offsets, targets = idx.fwd_offsets, idx.fwd_targets
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        # Each frame is (node, position of the next outgoing edge to visit).
+        work = [(root, offsets[root])]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while work:
+            v, k = work[-1]
+            if k < offsets[v + 1]:
+                work[-1] = (v, k + 1)
+                w = targets[k]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, offsets[w]))
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[v] < low[parent]:
+                    low[parent] = low[v]
+            if low[v] == index[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component.append(w)
+                    if w == v:
+                        break
+                components.append(component)
+    return components
+
+
+def _sample(names: Tuple[str, ...]) -> str:
+    shown = ", ".join(names[:MAX_NAMED_STEPS])
+    return shown if len(names) <= MAX_NAMED_STEPS else f"{shown}, … (+{len(names) - MAX_NAMED_STEPS} more)"
+
+
+def _check(p: PipelineDef) -> ValidationReport:
+    idx = p.index
+    ids = idx.ids
+    diagnostics: List[Diagnostic] = []
+
+    counts = Counter(step.id for step in p.steps)
+    for step_id, count in counts.items():
+        if count > 1:
+            diagnostics.append(
+                Diagnostic(ERROR, "duplicate-step", f"Step {step_id!r} is declared {count} times", (step_id,))
+            )
+
+    for a, b in idx.dangling:
+        missing = [s for s in (a, b) if s not in idx.pos]
+        diagnostics.append(
+            Diagnostic(
+                ERROR,
+                "dangling-edge",
+                f"Edge {a} -> {b} references undeclared step(s) {', '.join(map(repr, missing))}",
+                edges=((a, b),),
+            )
+        )
+
+    for (a, b), count in Counter(p.edges).items():
+        if count > 1:
+            diagnostics.append(Diagnostic(WARNING, "duplicate-edge", f"Edge {a} -> {b} is listed {count} times", edges=((a, b),)))
+
+    in_cycle = [False] * len(ids)
+    for component in strongly_connected_components(idx):
+        v = component[0]
+        if len(component) == 1 and v not in idx.successor_ids(v):
+            continue
+        for w in component:
+            in_cycle[w] = True
+        names = tuple(ids[w] for w in reversed(component))
+        message = f"Step {names[0]!r} depends on itself" if len(names) == 1 else f"Cycle through {len(names)} steps: {_sample(names)}"
+        diagnostics.append(Diagnostic(ERROR, "cycle", message, names))
+
+    if len(ids) > 1:
+        for i, step_id in enumerate(ids):
+            if idx.in_degree(i) == 0 and idx.out_degree(i) == 0:
+                diagnostics.append(Diagnostic(WARNING, "orphan", f"Step {step_id!r} has no edges", (step_id,)))
+
+    # Steps reachable from a source; anything else is only entered through a cycle.
+    if any(in_cycle):
+        reached = [False] * len(ids)
+        frontier = [i for i in range(len(ids)) if idx.in_degree(i) == 0]
+        for i in frontier:
+            reached[i] = True
+        while frontier:
+            i = frontier.pop()
+            for j in idx.successor_ids(i):
+                if not reached[j]:
+                    reached[j] = True
+                    frontier.append(j)
+        unreachable = tuple(ids[i] for i in range(len(ids)) if not reached[i])
+        if unreachable:
+            diagnostics.append(
+                Diagnostic(
+                    WARNING,
+                    "unreachable",
+                    f"{len(unreachable)} step(s) cannot be reached from any source step: {_sample(unreachable)}",
+                    unreachable,
+                )
+            )
+
+    return ValidationReport(p.name, diagnostics)
+
+
+_REPORTS: "OrderedDict[Tuple[str, str], ValidationReport]" = OrderedDict()
+_REPORTS_LOCK = threading.Lock()
+
+
+def validate_pipeline(p: PipelineDef) -> ValidationReport:
+    """Validate ``p``; reports are LRU-cached per pipeline name and content hash."""
+    key = (p.name, p.content_hash)
+    with _REPORTS_LOCK:
+        report = _REPORTS.get(key)
+        if report is not None:
+            _REPORTS.move_to_end(key)
+            return report
+    report = _check(p)
+    with _REPORTS_LOCK:
+        _REPORTS[key] = report
+        while len(_REPORTS) > DEFAULT_MAX_ENTRIES:
+            _REPORTS.popitem(last=False)
+    return report
@@ -0,0 +1,30 @@
+"""Home.py stage pages, one lazily imported module per sidebar section.
+
+Each module declares its copy as module-level constants (with any HTML built
+once at import) and exposes ``render()``. Home.py imports only the module for
+the selected section, so diagram builders and Graphviz are loaded only by the
+sections that draw diagrams.
+"""
+import importlib
+from typing import Dict, Iterable, Tuple
+
+SECTIONS: Dict[str, str] = {
+    "Overview": "overview",
+    "GitHub": "github",
+    "Cloud Build (CI/CD)": "cloud_build",
+    "Artifact Registry (images)": "artifact_registry",
+    "GCS (artifacts & templates)": "gcs",
+    "Vertex AI Pipelines": "vertex_pipelines",
+    "Scheduler": "scheduler",
+    "Monitoring & Alerting": "monitoring",
+}
+
+
+def detail_block(details: Iterable[Tuple[str, str]]) -> str:
+    """``<div class="detail-block">`` with one bold-labelled paragraph per (label, text)."""
+    rows = "".join(f"<p><strong>{label}:</strong> {text}</p>" for label, text in details)
+    return f'<div class="detail-block">{rows}</div>'
+
+
+def render_section(label: str) -> None:
+    importlib.import_module(f"{__name__}.{SECTIONS[label]}").render()
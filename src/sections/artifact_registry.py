@@ -0,0 +1,20 @@
+"""Artifact Registry for runtime images."""
+import streamlit as st
+
+from src.sections import detail_block
+
+SUBHEADER = "Artifact Registry for runtime images"
+INTRO = "Container images make pipeline components reproducible. They capture code + dependencies as a single deployable unit."
+DETAILS = (
+    ("Tagging", "Use git SHA or release tags so the runtime is immutable."),
+    ("Permissions", "Runtime service accounts must have pull access to the registry."),
+    ("Base images", "Standardize images to reduce drift across environments."),
+    ("Security", "Enable scanning and provenance to catch vulnerable builds early."),
+)
+DETAILS_HTML = detail_block(DETAILS)
+
+
+def render() -> None:
+    st.subheader(SUBHEADER)
+    st.write(INTRO)
+    st.markdown(DETAILS_HTML, unsafe_allow_html=True)
@@ -0,0 +1,30 @@
+"""Cloud Build for CI/CD."""
+import streamlit as st
+
+from src.sections import detail_block
+
+SUBHEADER = "Cloud Build for CI/CD"
+INTRO = "Cloud Build is the automation backbone. It validates, packages, and publishes everything the pipeline will need to run."
+DETAILS = (
+    ("Validation", "SQL linting, data contract checks, and tests fail fast."),
+    ("Packaging", "Custom component code becomes a container image with pinned deps."),
+    ("Compilation", "KFP templates are built with explicit image tags and parameters."),
+    ("Publishing", "Artifacts are uploaded to env buckets under the git SHA."),
+    ("Traceability", "Build metadata links commits to templates and images."),
+)
+CLOUDBUILD_YAML = (
+    "steps:\n"
+    "  - name: python\n"
+    "    entrypoint: bash\n"
+    "    args: ['-c', 'pytest && python compile_pipeline.py']\n"
+    "  - name: gcr.io/cloud-builders/gsutil\n"
+    "    args: ['cp', 'dist/template.json', 'gs://$ENV_BUCKET/templates/$SHORT_SHA.json']\n"
+)
+DETAILS_HTML = detail_block(DETAILS)
+
+
+def render() -> None:
+    st.subheader(SUBHEADER)
+    st.write(INTRO)
+    st.markdown(DETAILS_HTML, unsafe_allow_html=True)
+    st.code(CLOUDBUILD_YAML, language="yaml")
@@ -0,0 +1,20 @@
+"""GCS as the artifact store."""
+import streamlit as st
+
+from src.sections import detail_block
+
+SUBHEADER = "GCS as the artifact store"
+INTRO = "GCS buckets hold the versioned artifacts that the pipeline consumes: SQL, configs, and compiled templates."
+DETAILS = (
+    ("Isolation", "One bucket per environment prevents cross-env contamination."),
+    ("Rollback", "Folder structure by git SHA makes rollbacks deterministic."),
+    ("Immutability", "Treat compiled templates and inputs as append-only artifacts."),
+    ("Contracts", "Store schema snapshots or data contracts with the inputs."),
+)
+DETAILS_HTML = detail_block(DETAILS)
+
+
+def render() -> None:
+    st.subheader(SUBHEADER)
+    st.write(INTRO)
+    st.markdown(DETAILS_HTML, unsafe_allow_html=True)
@@ -0,0 +1,23 @@
+"""GitHub as the source of truth."""
+import streamlit as st
+
+from src.sections import detail_block
+
+SUBHEADER = "GitHub as the source of truth"
+INTRO = "Treat GitHub as the control plane for your data platform. Every change to SQL, configs, or pipeline code begins here and is tied to a git SHA."
+DETAILS = (
+    ("Branch strategy", "Align dev/test/prod branches with buckets and runtime identities."),
+    ("Change control", "Pull requests enforce review, tests, and approvals before merge."),
+    ("Versioning", "Tags and releases provide stable references for audits and backfills."),
+    ("Ownership", "CODEOWNERS and branch protections make accountability clear."),
+    ("Infrastructure", "Keep Cloud Build triggers, IAM, and configs in the same repo."),
+)
+INFO = "Good interview hook: show how a single git SHA maps to artifacts, templates, and images."
+DETAILS_HTML = detail_block(DETAILS)
+
+
+def render() -> None:
+    st.subheader(SUBHEADER)
+    st.write(INTRO)
+    st.markdown(DETAILS_HTML, unsafe_allow_html=True)
+    st.info(INFO)
@@ -0,0 +1,20 @@
+"""Monitoring and alerting."""
+import streamlit as st
+
+from src.sections import detail_block
+
+SUBHEADER = "Monitoring and alerting"
+INTRO = "Observability keeps pipelines reliable. This is where you prove the pipeline is healthy and the data is trustworthy."
+DETAILS = (
+    ("Alerts", "Failed runs, data quality checks, and SLA breaches."),
+    ("Dashboards", "Freshness, completeness, duration, and cost."),
+    ("Ownership", "On-call, escalation, and rollback playbooks."),
+    ("Incidents", "Track data issues with the same rigor as app outages."),
+)
+DETAILS_HTML = detail_block(DETAILS)
+
+
+def render() -> None:
+    st.subheader(SUBHEADER)
+    st.write(INTRO)
+    st.markdown(DETAILS_HTML, unsafe_allow_html=True)
@@ -0,0 +1,103 @@
+"""Architecture diagram plus one expandable card per stage."""
+import streamlit as st
+
+from src.viz.diagrams import build_architecture_diagram
+from src.viz.render_cache import show_diagram
+
+STAGES = (
+    {
+        "title": "GitHub",
+        "color": "#e8f5e9",
+        "points": (
+            "Branches map to dev/test/prod so promoting a change is a merge, not a manual copy.",
+            "Pull requests are the checkpoint where reviews, tests, and policy checks happen before anything lands.",
+            "The repo keeps the SQL, configs, pipeline definitions, and Dockerfiles together so the pipeline’s behaviour is versioned as one unit.",
+            "Branch protections and CODEOWNERS make it clear who owns what and who must approve changes.",
+            "Every merge produces a git SHA, which is just a unique ID for that exact commit; it’s the version stamp you can trace across templates, images, and uploaded artifacts.",
+        ),
+    },
+    {
+        "title": "Cloud Build (CI/CD)",
+        "color": "#e3f2fd",
+        "points": (
+            "Branch triggers kick off `cloudbuild.yaml` with env-specific substitutions.",
+            "Validation runs first: SQL linting, schema checks, and unit tests.",
+            "Custom components are built into images and pushed to Artifact Registry.",
+            "Pipeline templates are compiled with pinned image tags and parameters.",
+            "Artifacts are uploaded to GCS under deterministic SHA paths.",
+        ),
+    },
+    {
+        "title": "Artifact Registry (images)",
+        "color": "#e0f7fa",
+        "points": (
+            "Images are immutable and tagged with git SHA or a release version.",
+            "Vertex pulls the exact image referenced in the compiled template.",
+            "Pinned base images keep dependencies stable across environments.",
+            "Build and runtime permissions are split to reduce risk.",
+        ),
+    },
+    {
+        "title": "GCS (artifacts & templates)",
+        "color": "#fff8e1",
+        "points": (
+            "Environment buckets store SQL, configs, and compiled templates.",
+            "Every upload is tied to a git SHA for traceability and rollback.",
+            "Folder structure by SHA makes audits and reproductions simple.",
+            "Schema snapshots or data contracts can live alongside inputs.",
+        ),
+    },
+    {
+        "title": "Vertex AI Pipelines",
+        "color": "#ede7f6",
+        "points": (
+            "Deploys templates built in CI and executes pipeline jobs.",
+            "Components pull images and configs from versioned artifacts.",
+            "Run metadata and lineage make troubleshooting and audits easier.",
+            "Caching, retries, and timeouts are set per component.",
+        ),
+    },
+    {
+        "title": "Scheduler",
+        "color": "#fce4ec",
+        "points": (
+            "Cadence is tied to SLAs, not convenience.",
+            "Concurrency limits prevent overlapping runs on shared tables.",
+            "Backfills run as separate jobs with larger resource profiles.",
+            "Schedules pin template versions to keep runs reproducible.",
+        ),
+    },
+    {
+        "title": "Monitoring & Alerting",
+        "color": "#f3e5f5",
+        "points": (
+            "Alerts fire on failed runs, data quality checks, and SLA breaches.",
+            "Dashboards track freshness, completeness, duration, and cost.",
+            "Runbooks define rollback to a known-good template + image.",
+            "Ownership and on-call rotation keep the pipeline supported.",
+        ),
+    },
+)
+
+
+def _stage_card(stage) -> str:
+    points_html = "".join(f"<p>{p}</p>" for p in stage["points"])
+    return f"""
+    <details style="background:{stage['color']};" class="stage-card">
+        <summary style="font-weight:700; cursor:pointer;">{stage['title']}</summary>
+        <div style="margin-top:8px;">{points_html}</div>
+    </details>
+    """
+
+
+STAGE_CARDS = tuple(_stage_card(stage) for stage in STAGES)
+
+
+def render() -> None:
+    # Laid out once per process; reruns only pay for a cache lookup.
+    show_diagram(build_architecture_diagram, use_container_width=True)
+
+    col_left, col_right = st.columns(2)
+    for idx, card in enumerate(STAGE_CARDS):
+        col = col_left if idx % 2 == 0 else col_right
+        col.markdown(card, unsafe_allow_html=True)
@@ -0,0 +1,61 @@
+"""Scheduler and orchestration cadence."""
+import streamlit as st
+
+from src.sections import detail_block
+
+SUBHEADER = "Scheduler and orchestration cadence"
+INTRO = "Scheduling is where data engineering becomes operations. The scheduler decides when and how often your pipelines run."
+DETAILS = (
+    ("Cadence", "Schedules reflect SLAs (hourly, daily, weekly)."),
+    ("Concurrency", "Limits prevent overlapping runs on shared targets."),
+    ("Backfills", "Separate schedules or one-off jobs with larger resources."),
+    ("Versioning", "Schedulers pin template versions for repeatable runs."),
+)
+DETAILS_HTML = detail_block(DETAILS)
+SIMULATION_INTRO = (
+    "Model a run before scheduling it: each step occupies a worker and a slot of its resource class "
+    "(from its annotation) for its duration."
+)
+DEFAULT_DURATION_S = 60
+
+
+def render() -> None:
+    st.subheader(SUBHEADER)
+    st.write(INTRO)
+    st.markdown(DETAILS_HTML, unsafe_allow_html=True)
+    if st.toggle("Simulate concurrency limits", key="sim_open"):
+        render_simulation()
+
+
+def render_simulation() -> None:
+    # Imported here so the section stays within the startup budget until the simulator is opened.
+    from src.pipelines.catalog import default_catalog
+    from src.pipelines.simulate import Simulator, resource_class
+
+    st.caption(SIMULATION_INTRO)
+    catalog = default_catalog()
+    p = catalog[st.selectbox("Pipeline", catalog.names(), key="sim_pipeline")]
+    classes = list(dict.fromkeys(resource_class(s) for s in p.steps))
+
+    durations, quotas = {}, {}
+    for cls, col in zip(classes, st.columns(len(classes))):
+        with col:
+            durations[cls] = st.number_input(f"{cls} step (s)", 1, 86400, DEFAULT_DURATION_S, key=f"sim_dur_{cls}")
+            quotas[cls] = st.number_input(f"{cls} quota", 1, len(p.steps), len(p.steps), key=f"sim_quota_{cls}")
+    workers = st.slider("Workers", 1, max(2, len(p.steps)), 2, key="sim_workers")
+
+    sim = Simulator(p, {s.id: durations[resource_class(s)] for s in p.steps})
+    result = sim.run(workers, quotas)
+    makespan, utilisation, queued = st.columns(3)
+    makespan.metric("Makespan", f"{result.makespan_s:.0f}s")
+    utilisation.metric("Utilisation", f"{result.utilisation:.0%}")
+    queued.metric("Time queued", f"{result.queued_s:.0f}s")
+    st.dataframe(result.records(), use_container_width=True)
+
+    swept = st.selectbox("Sweep quota of", classes, key="sim_sweep_class")
+    runs = sim.sweep(range(1, len(p.steps) + 1), {**{c: [q] for c, q in quotas.items()}, swept: range(1, len(p.steps) + 1)})
+    chart = {"workers": list(range(1, len(p.steps) + 1))}
+    for run in runs:
+        chart.setdefault(f"quota {run.quotas[swept]}", []).append(run.makespan_s)
+    st.caption(f"Makespan (s) by worker count, one line per {swept} quota")
+    st.line_chart(chart, x="workers")
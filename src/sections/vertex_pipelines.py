@@ -0,0 +1,20 @@
+"""Vertex AI Pipelines execution."""
+import streamlit as st
+
+from src.sections import detail_block
+
+SUBHEADER = "Vertex AI Pipelines execution"
+INTRO = "Vertex AI runs KFP templates as managed pipeline jobs. Think of it as a hosted orchestrator with logs, lineage, and scheduling."
+DETAILS = (
+    ("Templates", "Reference GCS artifacts and container images built in CI."),
+    ("Components", "Map to extract, validate, transform, and load steps."),
+    ("Lineage", "Metadata and run history support auditability."),
+    ("Reliability", "Retries, caching, and timeouts are set per component."),
+)
+DETAILS_HTML = detail_block(DETAILS)
+
+
+def render() -> None:
+    st.subheader(SUBHEADER)
+    st.write(INTRO)
+    st.markdown(DETAILS_HTML, unsafe_allow_html=True)
@@ -0,0 +1,144 @@
+"""In-memory registry of the markdown pages under ``src/content``.
+
+Every ``*.md`` file is read once, when the registry is created, and kept as
+text together with a pre-rendered HTML version. A ``watchdog`` observer marks
+files as stale when they change on disk; stale entries are re-read on their
+next lookup, so an unchanged file costs no filesystem I/O per rerun. If the
+observer cannot be started, lookups fall back to an mtime check.
+
+Paths are resolved relative to this package, not the working directory.
+"""
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
+
+import markdown as md_lib
+
+CONTENT_DIR = Path(__file__).resolve().parents[1] / "content"
+MARKDOWN_EXTENSIONS = ("tables", "fenced_code", "sane_lists")
+
+
+@dataclass(frozen=True)
+class ContentEntry:
+    name: str
+    text: str
+    html: str
+    mtime_ns: int
+
+
+def _load(path: Path) -> ContentEntry:
+    mtime_ns = path.stat().st_mtime_ns
+    text = path.read_text(encoding="utf-8")
+    html = md_lib.markdown(text, extensions=list(MARKDOWN_EXTENSIONS))
+    return ContentEntry(name=path.stem, text=text, html=html, mtime_ns=mtime_ns)
+
+
+class ContentRegistry:
+    """Markdown files of one directory, keyed by file stem (``"ops"`` for ``ops.md``)."""
+
+    def __init__(self, root: Union[str, Path] = CONTENT_DIR, watch: bool = True):
+        self.root = Path(root)
+        self._entries: Dict[str, ContentEntry] = {}
+        self._stale: Set[str] = set()
+        self._lock = threading.Lock()
+        self._observer = None
+        self.reload()
+        if watch:
+            self._start_observer()
+
+    def reload(self) -> None:
+        """Re-read every markdown file under ``root``."""
+        entries = {path.stem: _load(path) for path in sorted(self.root.glob("*.md"))}
+        with self._lock:
+            self._entries = entries
+            self._stale.clear()
+
+    def _start_observer(self) -> None:
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return
+
+        registry = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                for path in (event.src_path, getattr(event, "dest_path", "")):
+                    if path and str(path).endswith(".md"):
+                        registry.invalidate(Path(path).stem)
+
+        observer = Observer()
+        observer.daemon = True
+        try:
+            observer.schedule(_Handler(), str(self.root), recursive=False)
+            observer.start()
+        except OSError:
+            # e.g. inotify watch limit reached; lookups fall back to mtime checks.
+            return
+        self._observer = observer
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    @property
+    def watching(self) -> bool:
+        return self._observer is not None
+
+    def invalidate(self, name: str) -> None:
+        with self._lock:
+            self._stale.add(name)
+
+    def _refresh(self, name: str) -> Optional[ContentEntry]:
+        path = self.root / f"{name}.md"
+        entry = _load(path) if path.is_file() else None
+        with self._lock:
+            self._stale.discard(name)
+            if entry is None:
+                self._entries.pop(name, None)
+            else:
+                self._entries[name] = entry
+        return entry
+
+    def get(self, name: str) -> ContentEntry:
+        with self._lock:
+            entry = self._entries.get(name)
+            stale = name in self._stale
+        if not self.watching and entry is not None:
+            path = self.root / f"{name}.md"
+            stale = not path.is_file() or path.stat().st_mtime_ns != entry.mtime_ns
+        if stale or entry is None:
+            entry = self._refresh(name)
+        if entry is None:
+            raise KeyError(f"No content named {name!r} in {self.root}")
+        return entry
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._entries)
+
+
+_REGISTRY: Optional[ContentRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def registry() -> ContentRegistry:
+    """Process-wide registry for ``src/content``, created on first use."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = ContentRegistry()
+        return _REGISTRY
+
+
+def content_markdown(name: str) -> str:
+    return registry().get(name).text
+
+
+def content_html(name: str) -> str:
+    return registry().get(name).html
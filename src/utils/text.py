@@ -1,4 +1,8 @@
 """Text and small UI helpers for the app."""
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from src.models import PipelineDef
 
 MAPPING_MARKDOWN = """
 - **Extract**: a KFP component (container) — often a Vertex AI CustomJob that pulls data
@@ -16,3 +20,13 @@ def navigation():
     # Streamlit pages will provide site navigation automatically when using the `pages/` folder,
     # but this helper is retained for programmatic selection if needed.
     return "Diagram"
+
+
+@lru_cache(maxsize=64)
+def spec_tables(p: PipelineDef) -> Tuple[List[Dict[str, str]], str]:
+    """Step rows and ``a -> b`` edge text for the Visualizer's spec tab, memoised per pipeline."""
+    rows = [
+        {"step": s.id, "description": s.description, "annotation": s.annotation or "", "image": s.image or ""}
+        for s in p.steps
+    ]
+    return rows, "\n".join(f"{a} -> {b}" for a, b in p.edges)
@@ -0,0 +1,100 @@
+"""Pre-render every diagram toggle combination into a static SVG bundle.
+
+The toggle space of the builders is small and finite, so all of it can be laid
+out at build time::
+
+    python -m src.viz.bundle --out dist/diagrams
+
+The bundle is content addressed: each SVG is stored once as
+``svg/<sha256>.svg`` and ``manifest.json`` maps render-cache keys (see
+``render_cache.cache_key``) to those files. At startup the render cache loads
+the bundle (``KFP_VIZ_BUNDLE_DIR``, default ``dist/diagrams``), so no request
+ever needs the ``dot`` binary. The manifest records the ``RENDERER_VERSION``
+it was built with; after a change to the diagram code the bundle is ignored
+until it is rebuilt.
+"""
+import argparse
+import hashlib
+import itertools
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from src.pipelines.catalog import default_catalog
+from src.viz.diagrams import (
+    build_architecture_diagram,
+    build_cicd_cycle_diagram,
+    build_docker_flow_diagram,
+    build_env_promotion_diagram,
+    build_pattern_diagram,
+)
+from src.viz.graphviz_dag import build_graph
+from src.viz.render_cache import MANIFEST_NAME, MANIFEST_VERSION, RENDERER_VERSION, cache_key
+
+RenderJob = Tuple[Callable, tuple, dict]
+
+
+def _bool_grid(*names: str) -> Iterator[dict]:
+    for values in itertools.product((True, False), repeat=len(names)):
+        yield dict(zip(names, values))
+
+
+def enumerate_renders() -> Iterator[RenderJob]:
+    """Yield ``(builder, args, kwargs)`` for every supported toggle combination."""
+    for kwargs in _bool_grid("include_artifact_registry"):
+        yield build_architecture_diagram, (), kwargs
+    for kwargs in _bool_grid("include_docker_lane", "include_quality_gates", "include_observability"):
+        yield build_cicd_cycle_diagram, (), kwargs
+    catalog = default_catalog()
+    for pattern in catalog.patterns():
+        for kwargs in _bool_grid("include_quality_checks", "include_metrics", "include_metadata"):
+            yield build_pattern_diagram, (pattern,), kwargs
+    for kwargs in _bool_grid("include_base_image", "include_build_cache"):
+        yield build_docker_flow_diagram, (), kwargs
+    for kwargs in _bool_grid("include_manual_approval", "include_project_split", "include_rebuild_per_env"):
+        yield build_env_promotion_diagram, (), kwargs
+    for name in catalog.names():
+        pipeline = catalog[name]
+        for annotated in (True, False):
+            yield build_graph, (pipeline, annotated), {}
+
+
+def _render(job: RenderJob) -> Tuple[str, bytes]:
+    builder, args, kwargs = job
+    return cache_key(builder, *args, **kwargs), builder(*args, **kwargs).pipe(format="svg")
+
+
+def build_bundle(out_dir: Path, workers: int = 0) -> Dict[str, str]:
+    """Render all combinations in a process pool and write the bundle to ``out_dir``."""
+    out_dir = Path(out_dir)
+    svg_dir = out_dir / "svg"
+    svg_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs: List[RenderJob] = list(enumerate_renders())
+    entries: Dict[str, str] = {}
+    with ProcessPoolExecutor(max_workers=workers or None) as pool:
+        for key, svg in pool.map(_render, jobs, chunksize=4):
+            name = f"svg/{hashlib.sha256(svg).hexdigest()}.svg"
+            path = out_dir / name
+            if not path.exists():
+                path.write_bytes(svg)
+            entries[key] = name
+
+    manifest = {"version": MANIFEST_VERSION, "renderer": RENDERER_VERSION, "entries": dict(sorted(entries.items()))}
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return entries
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Pre-render all diagram toggle combinations to SVG.")
+    parser.add_argument("--out", default="dist/diagrams", help="bundle output directory")
+    parser.add_argument("--workers", type=int, default=0, help="process pool size (default: CPU count)")
+    args = parser.parse_args(argv)
+    entries = build_bundle(Path(args.out), workers=args.workers)
+    unique = len(set(entries.values()))
+    print(f"Wrote {len(entries)} diagrams ({unique} unique SVGs) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
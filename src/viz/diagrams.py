@@ -1,5 +1,180 @@
+"""Explainer diagrams, declared as specs (see ``src.viz.specs``) and compiled once.
+
+Each ``build_*`` function keeps its toggle keyword arguments, so render-cache
+keys and the pre-rendered bundle are unaffected; building a diagram only
+filters the precompiled DOT statements by the toggle bitmask.
+"""
+from functools import lru_cache
+from typing import Mapping
+
 from graphviz import Digraph
 
+from src.models import PipelineDef
+from src.pipelines.catalog import default_catalog
+from src.viz.specs import DiagramTemplate, compile_spec
+
+BOX = {"shape": "box"}
+NOTE = {"shape": "note"}
+DASHED = {"style": "dashed"}
+
+ARCHITECTURE_SPEC = {
+    "toggles": ("include_artifact_registry",),
+    "graph": {
+        "rankdir": "TB",
+        "bgcolor": "#f8fafc",
+        "nodesep": "0.2",
+        "ranksep": "0.25",
+        "pad": "0.08",
+        "ratio": "compress",
+        "size": "5.5,6.5!",
+        "dpi": "65",
+    },
+    "node": {
+        "style": "filled",
+        "fontname": "Helvetica",
+        "color": "#0f5fa8",
+        "fontcolor": "#0b1f44",
+        "fillcolor": "#e6f0fb",
+        "penwidth": "1.4",
+        "fontsize": "15",
+        "margin": "0.06,0.04",
+    },
+    "edge": {"color": "#5b7bc6", "penwidth": "1.0", "fontsize": "15"},
+    "nodes": [
+        ("GitHub", "GitHub\n(dev/test/prod)", {"shape": "box", "fillcolor": "#e8f5e9"}, None),
+        ("CB", "Cloud Build\n(CI/CD)", {"shape": "box", "fillcolor": "#e3f2fd"}, None),
+        ("GCS", "GCS Buckets\n(artifacts)", {"shape": "box", "fillcolor": "#fff8e1"}, None),
+        ("Vertex", "Vertex Pipelines\n(KFP Components with ETL/ELT Steps)", {"shape": "box", "fillcolor": "#ede7f6"}, None),
+        ("Sched", "Scheduler", {"shape": "box", "fillcolor": "#fce4ec"}, None),
+        ("Obs", "Monitoring\n(alerts)", {"shape": "box", "fillcolor": "#f3e5f5"}, None),
+        ("AR", "Artifact Registry\n(images)", {"shape": "box", "fillcolor": "#e0f7fa"}, "include_artifact_registry"),
+    ],
+    "edges": [
+        ("GitHub", "CB", {"label": "push/merge"}, None),
+        ("CB", "GCS", {"label": "upload artifacts"}, None),
+        ("CB", "Vertex", {"label": "deploy/update"}, None),
+        ("Sched", "Vertex", {"label": "runs on schedule"}, None),
+        ("Vertex", "Obs", {"label": "logs/metrics"}, None),
+        ("CB", "AR", {"label": "optional: build/push"}, "include_artifact_registry"),
+        ("Vertex", "AR", {"label": "pull images"}, "include_artifact_registry"),
+    ],
+}
+
+CICD_CYCLE_SPEC = {
+    "toggles": ("include_docker_lane", "include_quality_gates", "include_observability"),
+    "engine": "circo",  # circular layout
+    "graph": {"overlap": "false"},
+    "nodes": [
+        ("1", "1) GitHub\npush to branch", BOX, None),
+        ("2", "2) Cloud Build\ntrigger fires", BOX, None),
+        ("3", "3) Cloud Build\nruns cloudbuild.yaml", BOX, None),
+        ("4", "4) Deploy Vertex\npipeline template/job", BOX, None),
+        ("5", "5) Schedule\n(run cadence)", BOX, None),
+        ("6", "6) Iterate\nchange code/config", BOX, None),
+        ("G", "Quality gates\n(lint/test/validate)", NOTE, "include_quality_gates"),
+        ("D", "Optional Docker lane\nbuild/push images", NOTE, "include_docker_lane"),
+        ("O", "Ops loop\nmonitor + alert + rollback", NOTE, "include_observability"),
+    ],
+    "edges": [
+        ("1", "2", None, None),
+        ("2", "3", None, None),
+        ("3", "4", None, None),
+        ("4", "5", None, None),
+        ("5", "6", None, None),
+        ("6", "1", {"label": "next change"}, None),
+        ("2", "G", DASHED, "include_quality_gates"),
+        ("G", "3", DASHED, "include_quality_gates"),
+        ("3", "D", DASHED, "include_docker_lane"),
+        ("D", "4", DASHED, "include_docker_lane"),
+        ("4", "O", DASHED, "include_observability"),
+        ("O", "6", DASHED, "include_observability"),
+    ],
+}
+
+DOCKER_FLOW_SPEC = {
+    "toggles": ("include_base_image", "include_build_cache"),
+    "graph": {"rankdir": "LR"},
+    "nodes": [
+        ("repo", "Repo (components + Dockerfile)", BOX, None),
+        ("build", "Cloud Build\nbuild image", BOX, None),
+        ("ar", "Artifact Registry\nimage tag", BOX, None),
+        ("template", "Pipeline template\n(image refs)", BOX, None),
+        ("vertex", "Vertex Pipeline Job\n(run container)", BOX, None),
+        ("base", "Base image\n(Python/OS)", NOTE, "include_base_image"),
+        ("cache", "Build cache", NOTE, "include_build_cache"),
+    ],
+    "edges": [
+        ("repo", "build", None, None),
+        ("build", "ar", None, None),
+        ("ar", "template", None, None),
+        ("template", "vertex", None, None),
+        ("base", "repo", DASHED, "include_base_image"),
+        ("cache", "build", DASHED, "include_build_cache"),
+    ],
+}
+
+ENV_PROMOTION_SPEC = {
+    "toggles": ("include_manual_approval", "include_project_split", "include_rebuild_per_env"),
+    "graph": {"rankdir": "LR"},
+    "nodes": [
+        ("dev", "Dev\n(branch + bucket)", BOX, None),
+        ("test", "Test\n(branch + bucket)", BOX, None),
+        ("prod", "Prod\n(branch + bucket)", BOX, None),
+        ("artifact", "Versioned artifacts\n(SHA + template)", BOX, None),
+        ("build_test", "Rebuild in test", BOX, "include_rebuild_per_env"),
+        ("build_prod", "Rebuild in prod", BOX, "include_rebuild_per_env"),
+        ("approve", "Manual approval", NOTE, "include_manual_approval"),
+        ("projects", "Separate projects\n(optional)", NOTE, "include_project_split"),
+    ],
+    "edges": [
+        ("dev", "artifact", None, None),
+        ("artifact", "build_test", None, "include_rebuild_per_env"),
+        ("build_test", "test", None, "include_rebuild_per_env"),
+        ("test", "build_prod", None, "include_rebuild_per_env"),
+        ("build_prod", "prod", None, "include_rebuild_per_env"),
+        ("artifact", "test", None, "!include_rebuild_per_env"),
+        ("test", "prod", None, "!include_rebuild_per_env"),
+        ("test", "approve", DASHED, "include_manual_approval"),
+        ("approve", "prod", DASHED, "include_manual_approval"),
+        ("dev", "projects", DASHED, "include_project_split"),
+    ],
+}
+
+PATTERN_OVERLAYS = (
+    # (toggle, anchor key, overlay node id, label)
+    ("include_quality_checks", "quality", "dq", "Data quality checks"),
+    ("include_metrics", "metrics", "metrics", "Metrics + alerts"),
+    ("include_metadata", "metadata", "metadata", "Lineage/metadata"),
+)
+
+
+def pattern_spec(p: PipelineDef, anchors: Mapping[str, str]) -> dict:
+    """Diagram spec for a catalog pipeline, with an overlay for each anchored step."""
+    overlays = [(toggle, anchors[key], node_id, label) for toggle, key, node_id, label in PATTERN_OVERLAYS if key in anchors]
+    return {
+        "toggles": tuple(toggle for toggle, *_ in PATTERN_OVERLAYS),
+        "graph": {"rankdir": "LR"},
+        "nodes": [(step.id, step.id, BOX, None) for step in p.steps]
+        + [(node_id, label, NOTE, toggle) for toggle, _, node_id, label in overlays],
+        "edges": [(a, b, None, None) for a, b in p.edges]
+        + [(anchor, node_id, DASHED, toggle) for toggle, anchor, node_id, _ in overlays],
+    }
+
+
+_ARCHITECTURE = compile_spec(ARCHITECTURE_SPEC)
+_CICD_CYCLE = compile_spec(CICD_CYCLE_SPEC)
+_DOCKER_FLOW = compile_spec(DOCKER_FLOW_SPEC)
+_ENV_PROMOTION = compile_spec(ENV_PROMOTION_SPEC)
+
+
+@lru_cache(maxsize=None)
+def _pattern_template(pattern: str) -> DiagramTemplate:
+    catalog = default_catalog()
+    if pattern not in catalog.patterns():
+        pattern = catalog.patterns()[0]
+    entry = catalog.entry(pattern)
+    return compile_spec(pattern_spec(entry.pipeline, entry.anchors))
+
 
 def build_architecture_diagram(include_artifact_registry: bool = True) -> Digraph:
     """
@@ -8,49 +183,7 @@ def build_architecture_diagram(include_artifact_registry: bool = True) -> Digrap
 
     If include_artifact_registry=True, show optional container image build/push.
     """
-    g = Digraph()
-    g.attr(
-        rankdir="TB",
-        bgcolor="#f8fafc",
-        nodesep="0.2",
-        ranksep="0.25",
-        pad="0.08",
-        ratio="compress",
-        size="5.5,6.5!",
-        dpi="65",
-    )
-    g.attr(
-        "node",
-        style="filled",
-        fontname="Helvetica",
-        color="#0f5fa8",
-        fontcolor="#0b1f44",
-        fillcolor="#e6f0fb",
-        penwidth="1.4",
-        fontsize="15",
-        margin="0.06,0.04",
-    )
-    g.attr("edge", color="#5b7bc6", penwidth="1.0", fontsize="15")
-
-    g.node("GitHub", "GitHub\n(dev/test/prod)", shape="box", fillcolor="#e8f5e9")
-    g.node("CB", "Cloud Build\n(CI/CD)", shape="box", fillcolor="#e3f2fd")
-    g.node("GCS", "GCS Buckets\n(artifacts)", shape="box", fillcolor="#fff8e1")
-    g.node("Vertex", "Vertex Pipelines\n(KFP Components with ETL/ELT Steps)", shape="box", fillcolor="#ede7f6")
-    g.node("Sched", "Scheduler", shape="box", fillcolor="#fce4ec")
-    g.node("Obs", "Monitoring\n(alerts)", shape="box", fillcolor="#f3e5f5")
-
-    g.edge("GitHub", "CB", label="push/merge")
-    g.edge("CB", "GCS", label="upload artifacts")
-    g.edge("CB", "Vertex", label="deploy/update")
-    g.edge("Sched", "Vertex", label="runs on schedule")
-    g.edge("Vertex", "Obs", label="logs/metrics")
-
-    if include_artifact_registry:
-        g.node("AR", "Artifact Registry\n(images)", shape="box", fillcolor="#e0f7fa")
-        g.edge("CB", "AR", label="optional: build/push")
-        g.edge("Vertex", "AR", label="pull images")
-
-    return g
+    return _ARCHITECTURE.render(include_artifact_registry=include_artifact_registry)
 
 
 def build_cicd_cycle_diagram(
@@ -62,105 +195,11 @@ def build_cicd_cycle_diagram(
     Circular CI/CD loop intended for data scientists.
     Uses a 'cycle' with optional lanes for Docker, gates, and ops.
     """
-    g = Digraph(engine="circo")  # circular layout
-    g.attr(overlap="false")
-
-    # Core loop nodes
-    g.node("1", "1) GitHub\npush to branch", shape="box")
-    g.node("2", "2) Cloud Build\ntrigger fires", shape="box")
-    g.node("3", "3) Cloud Build\nruns cloudbuild.yaml", shape="box")
-    g.node("4", "4) Deploy Vertex\npipeline template/job", shape="box")
-    g.node("5", "5) Schedule\n(run cadence)", shape="box")
-    g.node("6", "6) Iterate\nchange code/config", shape="box")
-
-    # Core edges (cycle)
-    g.edge("1", "2")
-    g.edge("2", "3")
-    g.edge("3", "4")
-    g.edge("4", "5")
-    g.edge("5", "6")
-    g.edge("6", "1", label="next change")
-
-    if include_quality_gates:
-        g.node("G", "Quality gates\n(lint/test/validate)", shape="note")
-        g.edge("2", "G", style="dashed")
-        g.edge("G", "3", style="dashed")
-
-    if include_docker_lane:
-        g.node("D", "Optional Docker lane\nbuild/push images", shape="note")
-        g.edge("3", "D", style="dashed")
-        g.edge("D", "4", style="dashed")
-
-    if include_observability:
-        g.node("O", "Ops loop\nmonitor + alert + rollback", shape="note")
-        g.edge("4", "O", style="dashed")
-        g.edge("O", "6", style="dashed")
-
-    return g
-
-
-PATTERN_DEFINITIONS = {
-    "Incremental Load (Watermark)": {
-        "nodes": {
-            "watermark": "Read Watermark",
-            "extract": "Extract Delta",
-            "validate": "Validate",
-            "merge": "Merge Upsert",
-            "update": "Update Watermark",
-        },
-        "edges": [
-            ("watermark", "extract"),
-            ("extract", "validate"),
-            ("validate", "merge"),
-            ("merge", "update"),
-        ],
-        "anchors": {"quality": "validate", "metrics": "merge", "metadata": "update"},
-    },
-    "Backfill (Partitioned)": {
-        "nodes": {
-            "plan": "Plan Partitions",
-            "extract": "Extract Partition",
-            "transform": "Transform",
-            "load": "Load",
-            "publish": "Publish Metrics",
-        },
-        "edges": [
-            ("plan", "extract"),
-            ("extract", "transform"),
-            ("transform", "load"),
-            ("load", "publish"),
-        ],
-        "anchors": {"quality": "transform", "metrics": "publish", "metadata": "plan"},
-    },
-    "CDC Merge": {
-        "nodes": {
-            "read": "Read Change Feed",
-            "dedupe": "De-duplicate",
-            "merge": "Apply Merge",
-            "audit": "Write Audit Log",
-        },
-        "edges": [
-            ("read", "dedupe"),
-            ("dedupe", "merge"),
-            ("merge", "audit"),
-        ],
-        "anchors": {"quality": "dedupe", "metrics": "audit", "metadata": "merge"},
-    },
-    "Snapshot Diff": {
-        "nodes": {
-            "snapshot": "Extract Snapshot",
-            "compare": "Compare Snapshots",
-            "apply": "Apply Diffs",
-            "publish": "Publish Metrics",
-        },
-        "edges": [
-            ("snapshot", "compare"),
-            ("compare", "apply"),
-            ("apply", "publish"),
-        ],
-        "anchors": {"quality": "compare", "metrics": "publish", "metadata": "snapshot"},
-    },
-}
+    return _CICD_CYCLE.render(
+        include_docker_lane=include_docker_lane,
+        include_quality_gates=include_quality_gates,
+        include_observability=include_observability,
+    )
 
 
 def build_pattern_diagram(
@@ -169,61 +208,18 @@ def build_pattern_diagram(
     include_metrics: bool = True,
     include_metadata: bool = True,
 ) -> Digraph:
-    g = Digraph()
-    g.attr(rankdir="LR")
-
-    spec = PATTERN_DEFINITIONS.get(pattern)
-    if not spec:
-        first_key = next(iter(PATTERN_DEFINITIONS))
-        spec = PATTERN_DEFINITIONS[first_key]
-
-    for node_id, label in spec["nodes"].items():
-        g.node(node_id, label, shape="box")
-
-    for a, b in spec["edges"]:
-        g.edge(a, b)
-
-    anchors = spec["anchors"]
-    if include_quality_checks:
-        g.node("dq", "Data quality checks", shape="note")
-        g.edge(anchors["quality"], "dq", style="dashed")
-    if include_metrics:
-        g.node("metrics", "Metrics + alerts", shape="note")
-        g.edge(anchors["metrics"], "metrics", style="dashed")
-    if include_metadata:
-        g.node("metadata", "Lineage/metadata", shape="note")
-        g.edge(anchors["metadata"], "metadata", style="dashed")
-
-    return g
+    return _pattern_template(pattern).render(
+        include_quality_checks=include_quality_checks,
+        include_metrics=include_metrics,
+        include_metadata=include_metadata,
+    )
 
 
 def build_docker_flow_diagram(
     include_base_image: bool = True,
     include_build_cache: bool = True,
 ) -> Digraph:
-    g = Digraph()
-    g.attr(rankdir="LR")
-
-    g.node("repo", "Repo (components + Dockerfile)", shape="box")
-    g.node("build", "Cloud Build\nbuild image", shape="box")
-    g.node("ar", "Artifact Registry\nimage tag", shape="box")
-    g.node("template", "Pipeline template\n(image refs)", shape="box")
-    g.node("vertex", "Vertex Pipeline Job\n(run container)", shape="box")
-
-    g.edge("repo", "build")
-    g.edge("build", "ar")
-    g.edge("ar", "template")
-    g.edge("template", "vertex")
-
-    if include_base_image:
-        g.node("base", "Base image\n(Python/OS)", shape="note")
-        g.edge("base", "repo", style="dashed")
-
-    if include_build_cache:
-        g.node("cache", "Build cache", shape="note")
-        g.edge("cache", "build", style="dashed")
-
-    return g
+    return _DOCKER_FLOW.render(include_base_image=include_base_image, include_build_cache=include_build_cache)
 
 
 def build_env_promotion_diagram(
@@ -231,34 +227,8 @@ def build_env_promotion_diagram(
     include_project_split: bool = True,
     include_rebuild_per_env: bool = False,
 ) -> Digraph:
-    g = Digraph()
-    g.attr(rankdir="LR")
-
-    g.node("dev", "Dev\n(branch + bucket)", shape="box")
-    g.node("test", "Test\n(branch + bucket)", shape="box")
-    g.node("prod", "Prod\n(branch + bucket)", shape="box")
-
-    g.node("artifact", "Versioned artifacts\n(SHA + template)", shape="box")
-    g.edge("dev", "artifact")
-
-    if include_rebuild_per_env:
-        g.node("build_test", "Rebuild in test", shape="box")
-        g.node("build_prod", "Rebuild in prod", shape="box")
-        g.edge("artifact", "build_test")
-        g.edge("build_test", "test")
-        g.edge("test", "build_prod")
-        g.edge("build_prod", "prod")
-    else:
-        g.edge("artifact", "test")
-        g.edge("test", "prod")
-
-    if include_manual_approval:
-        g.node("approve", "Manual approval", shape="note")
-        g.edge("test", "approve", style="dashed")
-        g.edge("approve", "prod", style="dashed")
-
-    if include_project_split:
-        g.node("projects", "Separate projects\n(optional)", shape="note")
-        g.edge("dev", "projects", style="dashed")
-
-    return g
+    return _ENV_PROMOTION.render(
+        include_manual_approval=include_manual_approval,
+        include_project_split=include_project_split,
+        include_rebuild_per_env=include_rebuild_per_env,
+    )
@@ -1,23 +1,124 @@
-from graphviz import Digraph
-from src.models import PipelineDef, steps_index
+from typing import Dict, Optional, Tuple
 
+from graphviz import Digraph, ExecutableNotFound
+from src.models import PipelineDef
+from src.pipelines.diff import PipelineDiff
+from src.pipelines.timing import CriticalPath, StepMetrics
+from src.viz.layered import layered_svg
+from src.viz.render_cache import render_svg
 
-def build_graph(p: PipelineDef, annotated: bool) -> Digraph:
+# Above this many steps, ``engine="auto"`` skips Graphviz and uses the in-process layout.
+LAYERED_THRESHOLD = 2000
+
+DIFF_STYLES = {
+    "added": {"color": "#2e7d32", "fillcolor": "#e8f5e9", "style": "filled"},
+    "removed": {"color": "#c62828", "fillcolor": "#ffebee", "style": "filled,dashed", "fontcolor": "#c62828"},
+    "changed": {"color": "#ef6c00", "fillcolor": "#fff3e0", "style": "filled"},
+    "renamed": {"color": "#1565c0", "fillcolor": "#e3f2fd", "style": "filled"},
+}
+
+
+def build_graph(
+    p: PipelineDef,
+    annotated: bool,
+    node_attrs: Optional[Dict[str, Dict[str, str]]] = None,
+    edge_attrs: Optional[Dict[Tuple[str, str], Dict[str, str]]] = None,
+) -> Digraph:
+    """Draw ``p``; ``node_attrs``/``edge_attrs`` add per-step/per-edge Graphviz attributes (overlays)."""
     g = Digraph()
     g.attr(rankdir="LR")
 
-    idx = steps_index(p.steps)
+    idx = p.by_id
+    node_attrs = node_attrs or {}
+    edge_attrs = edge_attrs or {}
 
     for step in p.steps:
         if annotated and step.annotation:
             label = f"{step.id}\n({step.annotation})"
         else:
             label = step.id
-        g.node(step.id, label)
+        g.node(step.id, label, **node_attrs.get(step.id, {}))
 
     for a, b in p.edges:
-        # allow edges even if steps were misconfigured
+        # Skip dangling edges here; src.pipelines.validate reports them.
         if a in idx and b in idx:
-            g.edge(a, b)
+            g.edge(a, b, **edge_attrs.get((a, b), {}))
 
     return g
+
+
+def build_diff_graph(diff: PipelineDiff, annotated: bool) -> Digraph:
+    """Draw the union of both pipeline versions, colored by what changed."""
+    renames = dict(diff.renamed_steps)
+    removed_steps = set(diff.removed_steps)
+    steps = list(diff.new.steps) + [s for s in diff.old.steps if s.id in removed_steps]
+    removed_edges = [(renames.get(a, a), renames.get(b, b)) for a, b in diff.removed_edges]
+    union = PipelineDef(name=diff.new.name, steps=steps, edges=list(diff.new.edges) + removed_edges)
+
+    node_attrs: Dict[str, Dict[str, str]] = {}
+    for step_id in diff.added_steps:
+        node_attrs[step_id] = DIFF_STYLES["added"]
+    for step_id in diff.removed_steps:
+        node_attrs[step_id] = DIFF_STYLES["removed"]
+    for step_id in diff.changed_steps:
+        node_attrs[step_id] = DIFF_STYLES["changed"]
+    for old_id, new_id in diff.renamed_steps:
+        node_attrs[new_id] = dict(DIFF_STYLES["renamed"], xlabel=f"was {old_id}")
+
+    edge_attrs: Dict[Tuple[str, str], Dict[str, str]] = {}
+    for edge in diff.added_edges:
+        edge_attrs[edge] = {"color": DIFF_STYLES["added"]["color"], "penwidth": "2"}
+    for edge in removed_edges:
+        edge_attrs[edge] = {"color": DIFF_STYLES["removed"]["color"], "style": "dashed"}
+
+    return build_graph(union, annotated, node_attrs=node_attrs, edge_attrs=edge_attrs)
+
+
+def _heat_color(t: float) -> str:
+    """Pale yellow (t=0) to deep red (t=1)."""
+    t = min(max(t, 0.0), 1.0)
+    r, g, b = 255, int(245 - 180 * t), int(200 - 170 * t)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def timing_overlay(
+    metrics: Dict[str, StepMetrics], cp: Optional[CriticalPath] = None
+) -> Tuple[Dict[str, Dict[str, str]], Dict[Tuple[str, str], Dict[str, str]]]:
+    """Node/edge attributes coloring steps by duration heat and outlining the critical path."""
+    longest = max((m.duration_s for m in metrics.values()), default=0.0) or 1.0
+    node_attrs: Dict[str, Dict[str, str]] = {}
+    for step_id, m in metrics.items():
+        tooltip = f"{m.duration_s:.1f}s, ${m.cost:.2f} (avg of {m.runs} runs)"
+        if cp is not None and step_id in cp.earliest_start:
+            tooltip += f", slack {cp.slack(step_id):.1f}s"
+        node_attrs[step_id] = {
+            "style": "filled",
+            "fillcolor": _heat_color(m.duration_s / longest),
+            "xlabel": f"{m.duration_s:.0f}s",
+            "tooltip": tooltip,
+        }
+
+    edge_attrs: Dict[Tuple[str, str], Dict[str, str]] = {}
+    if cp is not None:
+        for step_id in cp.path:
+            node_attrs.setdefault(step_id, {}).update(penwidth="3", color="#b71c1c")
+        for edge in zip(cp.path, cp.path[1:]):
+            edge_attrs[edge] = {"penwidth": "3", "color": "#b71c1c"}
+    return node_attrs, edge_attrs
+
+
+def pipeline_svg(p: PipelineDef, annotated: bool, engine: str = "auto") -> bytes:
+    """Render ``p`` to SVG with Graphviz ``dot`` or the in-process ``layered`` engine.
+
+    ``dot`` falls back to ``layered`` when the Graphviz binary is not installed.
+    """
+    if engine == "auto":
+        engine = "layered" if len(p.steps) > LAYERED_THRESHOLD else "dot"
+    if engine == "dot":
+        try:
+            return render_svg(build_graph, p, annotated)
+        except ExecutableNotFound:
+            engine = "layered"
+    if engine == "layered":
+        return render_svg(layered_svg, p, annotated)
+    raise ValueError(f"Unknown layout engine: {engine!r}")
@@ -0,0 +1,190 @@
+"""Level-of-detail rendering for pipelines with sub-DAG / ParallelFor groups.
+
+Steps whose ``Step.group`` names another step belong to that group (see
+``kfp_spec``). By default every group is drawn as a single summary node with
+its step count; expanded groups are drawn as clusters of their children. Any
+scope (top level or expanded group) with more than ``sibling_threshold``
+children shows the first ones and folds the rest into a ``+N more`` node, and
+the threshold is halved until the view fits ``node_budget``.
+
+A ``LodRenderer`` caches the DOT lines of each group's own nodes, so expanding
+a group only formats that group's children; the rest of the view is reused
+and edges are remapped onto visible nodes through precomputed ancestor chains.
+``build_lod_graph`` wraps ``render`` as a render-cache builder, keyed on the
+renderer's ``content_hash`` (pipeline and view settings) and the expanded groups.
+"""
+import hashlib
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from graphviz import Digraph
+
+from src.models import PipelineDef
+
+DEFAULT_NODE_BUDGET = 150
+DEFAULT_SIBLING_THRESHOLD = 12
+
+_Item = Union[str, Tuple[str, str]]  # a DOT line, or ("group", step_id) placeholder
+
+
+class LodRenderer:
+    def __init__(
+        self,
+        p: PipelineDef,
+        annotated: bool = False,
+        node_budget: int = DEFAULT_NODE_BUDGET,
+        sibling_threshold: int = DEFAULT_SIBLING_THRESHOLD,
+    ):
+        self.p = p
+        self.annotated = annotated
+        self.node_budget = node_budget
+        self.sibling_threshold = sibling_threshold
+
+        by_id = p.by_id
+        self.children: Dict[Optional[str], List[str]] = {None: []}
+        self.parent: Dict[str, Optional[str]] = {}
+        for step in p.steps:
+            if step.id in self.parent:
+                continue
+            parent = step.group if step.group in by_id and step.group != step.id else None
+            self.parent[step.id] = parent
+            self.children.setdefault(parent, []).append(step.id)
+        self.groups: Set[str] = {g for g in self.children if g is not None}
+        # Groups take the first slots of each scope so sibling folding hides leaves first.
+        for scope, kids in self.children.items():
+            self.children[scope] = [c for c in kids if c in self.groups] + [c for c in kids if c not in self.groups]
+        self.slot: Dict[str, int] = {c: i for kids in self.children.values() for i, c in enumerate(kids)}
+
+        # Ancestor chains, outermost first. Group cycles are cut where they repeat.
+        self.ancestors: Dict[str, Tuple[str, ...]] = {}
+        for step_id in self.parent:
+            chain: List[str] = []
+            cur = self.parent[step_id]
+            while cur is not None and cur not in chain and cur != step_id:
+                chain.append(cur)
+                cur = self.parent[cur]
+            self.ancestors[step_id] = tuple(reversed(chain))
+
+        self.size: Dict[str, int] = {g: 0 for g in self.groups}
+        for chain in self.ancestors.values():
+            for g in chain:
+                self.size[g] += 1
+
+        self._fragments: Dict[Tuple[Optional[str], int], List[_Item]] = {}
+        self._scratch = Digraph()
+
+    @property
+    def content_hash(self) -> str:
+        """The pipeline's hash plus the view settings, so render-cache keys tell renderers apart."""
+        settings = f"{self.p.content_hash}|{self.annotated}|{self.node_budget}|{self.sibling_threshold}"
+        return hashlib.sha256(settings.encode("utf-8")).hexdigest()
+
+    def _line(self, kind: str, *args, **attrs) -> str:
+        getattr(self._scratch, kind)(*args, **attrs)
+        return self._scratch.body.pop()
+
+    def _fragment(self, scope: Optional[str], threshold: int) -> List[_Item]:
+        """DOT lines for the direct children of ``scope``; groups are left as placeholders."""
+        key = (scope, threshold)
+        cached = self._fragments.get(key)
+        if cached is not None:
+            return cached
+
+        by_id = self.p.by_id
+        kids = self.children.get(scope, [])
+        items: List[_Item] = []
+        for child in kids[:threshold]:
+            if child in self.groups:
+                items.append(("group", child))
+                continue
+            step = by_id[child]
+            label = f"{step.id}\n({step.annotation})" if self.annotated and step.annotation else step.id
+            items.append(self._line("node", child, label))
+        hidden = kids[threshold:]
+        if hidden:
+            steps = len(hidden) + sum(self.size.get(h, 0) for h in hidden)
+            items.append(
+                self._line("node", _overflow_id(scope), f"+{len(hidden)} more\n({steps} steps)", shape="box", style="dashed")
+            )
+        self._fragments[key] = items
+        return items
+
+    def effective_expanded(self, expanded: Iterable[str]) -> Set[str]:
+        """Expanded groups whose enclosing groups are all expanded too."""
+        requested = set(expanded) & self.groups
+        return {g for g in requested if all(a in requested for a in self.ancestors[g])}
+
+    def _visible_expanded(self, expanded: Set[str], threshold: int) -> Set[str]:
+        """Drop expanded groups that sit (or whose ancestors sit) in a folded ``+N more`` node."""
+        return {g for g in expanded if all(self.slot[a] < threshold for a in (*self.ancestors[g], g))}
+
+    def _visible_count(self, expanded: Set[str], threshold: int) -> int:
+        total = 0
+        for scope in [None, *expanded]:
+            kids = self.children.get(scope, [])
+            total += min(len(kids), threshold) + (1 if len(kids) > threshold else 0)
+        return total
+
+    def representative(self, step_id: str, expanded: Set[str], threshold: int) -> str:
+        """The visible node that stands in for ``step_id`` in this view."""
+        for ancestor in (*self.ancestors[step_id], step_id):
+            if self.slot[ancestor] >= threshold:
+                return _overflow_id(self.parent[ancestor])
+            if ancestor not in expanded:
+                return ancestor
+        return step_id
+
+    def render(self, expanded: Iterable[str] = ()) -> Digraph:
+        expanded = self.effective_expanded(expanded)
+        threshold = max(1, self.sibling_threshold)
+        while threshold > 1:
+            if self._visible_count(self._visible_expanded(expanded, threshold), threshold) <= self.node_budget:
+                break
+            threshold //= 2
+        expanded = self._visible_expanded(expanded, threshold)
+
+        g = Digraph()
+        g.attr(rankdir="LR", compound="true")
+        self._emit(g.body, None, expanded, threshold)
+
+        seen = set()
+        for a, b in self.p.edges:
+            if a not in self.parent or b not in self.parent:
+                continue
+            ra = self.representative(a, expanded, threshold)
+            rb = self.representative(b, expanded, threshold)
+            if ra != rb and (ra, rb) not in seen:
+                seen.add((ra, rb))
+                g.edge(ra, rb)
+        return g
+
+    def _emit(self, body: List[str], scope: Optional[str], expanded: Set[str], threshold: int) -> None:
+        for item in self._fragment(scope, threshold):
+            if isinstance(item, str):
+                body.append(item)
+                continue
+            group = item[1]
+            step = self.p.by_id[group]
+            if group in expanded:
+                body.append(f"\tsubgraph {_quote_cluster(group)} {{\n")
+                body.append(self._line("attr", label=f"{group} ({step.annotation or 'group'})", style="rounded"))
+                # The group step itself stays visible as the cluster's entry node.
+                body.append(self._line("node", group, group, shape="folder"))
+                self._emit(body, group, expanded, threshold)
+                body.append("\t}\n")
+            else:
+                label = f"{group}\n[{step.annotation or 'group'}: {self.size[group]} steps]"
+                body.append(self._line("node", group, label, shape="box3d"))
+
+
+def build_lod_graph(lod: LodRenderer, expanded: Sequence[str] = ()) -> Digraph:
+    """``lod.render(expanded)``; pass ``expanded`` sorted so equal views share a cache key."""
+    return lod.render(expanded)
+
+
+def _overflow_id(scope: Optional[str]) -> str:
+    return f"{scope}/…" if scope else "…"
+
+
+def _quote_cluster(group: str) -> str:
+    escaped = group.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"cluster_{escaped}"'
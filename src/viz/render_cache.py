@@ -0,0 +1,209 @@
+"""In-memory (and optional on-disk) cache of rendered diagram SVGs.
+
+Every diagram builder is a pure function of its toggle arguments, so the SVG
+produced by running Graphviz layout on its output can be reused across
+Streamlit reruns and sessions. Entries are keyed on the builder name plus a
+hash of its bound arguments (defaults applied) and of ``RENDERER_VERSION``,
+kept in an LRU and, when a disk directory is configured, written through to
+``<dir>/<key>.svg``. ``RENDERER_VERSION`` hashes the source of the diagram
+code, so a persistent disk cache never serves SVGs from an older builder.
+
+``show_diagram`` puts a cached SVG on the page. Without the ``dot`` binary
+(e.g. a deploy without ``packages.txt``) it hands the DOT source to
+``st.graphviz_chart`` instead, which lays it out in the browser.
+
+A pre-rendered bundle (see ``src.viz.bundle``) can be loaded into the cache;
+bundle entries are pinned and never evicted. A bundle built by a different
+``RENDERER_VERSION`` is ignored with a warning.
+"""
+import dataclasses
+import hashlib
+import inspect
+import json
+import os
+import threading
+import warnings
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+from graphviz import Digraph, ExecutableNotFound
+
+DEFAULT_MAX_ENTRIES = 256
+DISK_DIR_ENV = "KFP_VIZ_RENDER_CACHE_DIR"
+BUNDLE_DIR_ENV = "KFP_VIZ_BUNDLE_DIR"
+DEFAULT_BUNDLE_DIR = Path(__file__).resolve().parents[2] / "dist" / "diagrams"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+# Source that decides what a builder draws: the diagram modules and the built-in pipelines.
+RENDERER_SOURCES = (Path(__file__).resolve().parent, Path(__file__).resolve().parents[1] / "pipelines" / "definitions.py")
+
+
+def _renderer_version() -> str:
+    digest = hashlib.sha256()
+    for source in RENDERER_SOURCES:
+        for path in sorted(source.glob("*.py")) if source.is_dir() else [source]:
+            digest.update(path.name.encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+RENDERER_VERSION = _renderer_version()
+
+
+def key_token(value) -> str:
+    """Stable, compact stand-in for a builder argument.
+
+    Anything exposing ``content_hash`` (``PipelineDef``) is represented by that
+    hash instead of its full repr, so keys stay small for large pipelines and
+    change whenever the content does, whatever the pipeline is called.
+    """
+    content_hash = getattr(value, "content_hash", None)
+    if isinstance(content_hash, str):
+        return f"<{type(value).__name__} {content_hash}>"
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = ", ".join(f"{f.name}={key_token(getattr(value, f.name))}" for f in dataclasses.fields(value))
+        return f"{type(value).__name__}({fields})"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(map(key_token, value)) + "]"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{key_token(k)}: {key_token(v)}" for k, v in sorted(value.items(), key=repr)) + "}"
+    return repr(value)
+
+
+def cache_key(builder: Callable[..., Digraph], *args, **kwargs) -> str:
+    """Return ``<builder name>-<hash of renderer version and arguments>`` for a builder call."""
+    bound = inspect.signature(builder).bind(*args, **kwargs)
+    bound.apply_defaults()
+    args_repr = RENDERER_VERSION + key_token(sorted(bound.arguments.items()))
+    digest = hashlib.sha256(args_repr.encode("utf-8")).hexdigest()[:16]
+    return f"{builder.__name__}-{digest}"
+
+
+class RenderCache:
+    """Thread-safe LRU of SVG bytes, optionally backed by a disk directory."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        disk_dir: Optional[Union[str, Path]] = None,
+    ):
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._pinned: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pinned)
+
+    def get(self, key: str) -> Optional[bytes]:
+        svg = self._pinned.get(key)
+        if svg is not None:
+            self.hits += 1
+            return svg
+        with self._lock:
+            svg = self._entries.get(key)
+            if svg is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return svg
+        if self.disk_dir is not None:
+            path = self.disk_dir / f"{key}.svg"
+            if path.is_file():
+                svg = path.read_bytes()
+                self._store(key, svg)
+                with self._lock:
+                    self.hits += 1
+                return svg
+        return None
+
+    def put(self, key: str, svg: bytes) -> None:
+        self._store(key, svg)
+        if self.disk_dir is not None:
+            # Write-then-rename so concurrent readers never see a partial file.
+            path = self.disk_dir / f"{key}.svg"
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(svg)
+            os.replace(tmp, path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def load_bundle(self, bundle_dir: Union[str, Path]) -> int:
+        """Pin every SVG listed in a bundle manifest; return the number of keys loaded (0 for a stale bundle)."""
+        bundle_dir = Path(bundle_dir)
+        manifest = json.loads((bundle_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported diagram bundle version: {manifest.get('version')!r}")
+        if manifest.get("renderer") != RENDERER_VERSION:
+            warnings.warn(
+                f"Ignoring diagram bundle in {bundle_dir}: built by renderer {manifest.get('renderer')!r}, "
+                f"this is {RENDERER_VERSION!r}; rebuild it with python -m src.viz.bundle",
+                stacklevel=2,
+            )
+            return 0
+        blobs: Dict[str, bytes] = {}
+        pinned: Dict[str, bytes] = {}
+        for key, name in manifest["entries"].items():
+            if name not in blobs:
+                blobs[name] = (bundle_dir / name).read_bytes()
+            pinned[key] = blobs[name]
+        with self._lock:
+            self._pinned.update(pinned)
+        return len(pinned)
+
+    def render(self, builder: Callable[..., Digraph], *args, **kwargs) -> bytes:
+        """Return the SVG for ``builder(*args, **kwargs)``, laying it out only on a miss."""
+        key = cache_key(builder, *args, **kwargs)
+        svg = self.get(key)
+        if svg is not None:
+            return svg
+        with self._lock:
+            self.misses += 1
+        result = builder(*args, **kwargs)
+        # In-process layouts (see ``layered``) return SVG text instead of a Digraph.
+        if isinstance(result, str):
+            svg = result.encode("utf-8")
+        else:
+            svg = result.pipe(format="svg")
+        self.put(key, svg)
+        return svg
+
+    def _store(self, key: str, svg: bytes) -> None:
+        with self._lock:
+            self._entries[key] = svg
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+DEFAULT_CACHE = RenderCache(disk_dir=os.environ.get(DISK_DIR_ENV) or None)
+
+_bundle_dir = Path(os.environ.get(BUNDLE_DIR_ENV) or DEFAULT_BUNDLE_DIR)
+if (_bundle_dir / MANIFEST_NAME).is_file():
+    DEFAULT_CACHE.load_bundle(_bundle_dir)
+
+
+def render_svg(builder: Callable[..., Digraph], *args, **kwargs) -> bytes:
+    """Render a diagram builder through the process-wide cache."""
+    return DEFAULT_CACHE.render(builder, *args, **kwargs)
+
+
+def show_diagram(builder: Callable[..., Digraph], *args, use_container_width: bool = False, **kwargs) -> None:
+    """``st.image`` of ``render_svg(builder, ...)``, or ``st.graphviz_chart`` when Graphviz is not installed."""
+    import streamlit as st
+
+    try:
+        svg = render_svg(builder, *args, **kwargs)
+    except ExecutableNotFound:
+        st.graphviz_chart(builder(*args, **kwargs).source, use_container_width=use_container_width)
+        return
+    st.image(svg.decode("utf-8"), use_container_width=use_container_width)
@@ -0,0 +1,108 @@
+"""Declarative diagram specs compiled into immutable, toggle-filtered templates.
+
+A spec is a plain dict::
+
+    {
+        "toggles": ("include_x", "include_y"),
+        "engine": "dot",                       # optional
+        "graph": {...}, "node": {...}, "edge": {...},   # optional default attributes
+        "nodes": [(node_id, label, attrs, when), ...],
+        "edges": [(tail, head, attrs, when), ...],
+    }
+
+``when`` is ``None`` (always drawn), a toggle name (drawn when it is on),
+``"!name"`` (drawn when it is off) or a tuple of those, all of which must hold.
+
+``compile_spec`` renders every node and edge to its DOT statement once and
+records which toggles each statement requires and forbids as bitmasks. Applying
+a toggle vector is then a bitmask filter over those prebuilt statements (cached
+per mask); no attributes are quoted or formatted again.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+from graphviz import Digraph
+
+Condition = Union[None, str, Sequence[str]]
+
+
+def _masks(when: Condition, toggles: Sequence[str]) -> Tuple[int, int]:
+    if when is None:
+        return 0, 0
+    require = forbid = 0
+    for cond in (when,) if isinstance(when, str) else when:
+        negated = cond.startswith("!")
+        name = cond[1:] if negated else cond
+        try:
+            bit = 1 << toggles.index(name)
+        except ValueError:
+            raise ValueError(f"Unknown toggle {name!r} in condition {when!r}") from None
+        if negated:
+            forbid |= bit
+        else:
+            require |= bit
+    return require, forbid
+
+
+@dataclass(frozen=True)
+class DiagramTemplate:
+    toggles: Tuple[str, ...]
+    engine: Optional[str]
+    header: Tuple[str, ...]  # graph/node/edge default attribute statements
+    statements: Tuple[str, ...]
+    require: Tuple[int, ...]
+    forbid: Tuple[int, ...]
+    _bodies: Dict[int, Tuple[str, ...]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def mask(self, values: Mapping[str, bool]) -> int:
+        return sum(1 << i for i, name in enumerate(self.toggles) if values[name])
+
+    def body(self, mask: int) -> Tuple[str, ...]:
+        body = self._bodies.get(mask)
+        if body is None:
+            selected = (
+                stmt
+                for stmt, req, forb in zip(self.statements, self.require, self.forbid)
+                if req & ~mask == 0 and forb & mask == 0
+            )
+            body = self._bodies[mask] = self.header + tuple(selected)
+        return body
+
+    def render(self, **values: bool) -> Digraph:
+        """A fresh ``Digraph`` for the given toggle values (every toggle must be given)."""
+        return Digraph(engine=self.engine, body=list(self.body(self.mask(values))))
+
+
+def compile_spec(spec: Dict) -> DiagramTemplate:
+    toggles = tuple(spec.get("toggles", ()))
+    # Let graphviz do the quoting once, at compile time.
+    g = Digraph()
+    if spec.get("graph"):
+        g.attr(**spec["graph"])
+    for kind in ("node", "edge"):
+        if spec.get(kind):
+            g.attr(kind, **spec[kind])
+    header = tuple(g.body)
+
+    statements, require, forbid = [], [], []
+    for node_id, label, attrs, when in spec.get("nodes", ()):
+        g.node(node_id, label, **(attrs or {}))
+        statements.append(g.body[-1])
+        req, forb = _masks(when, toggles)
+        require.append(req)
+        forbid.append(forb)
+    for tail, head, attrs, when in spec.get("edges", ()):
+        g.edge(tail, head, **(attrs or {}))
+        statements.append(g.body[-1])
+        req, forb = _masks(when, toggles)
+        require.append(req)
+        forbid.append(forb)
+
+    return DiagramTemplate(
+        toggles=toggles,
+        engine=spec.get("engine"),
+        header=header,
+        statements=tuple(statements),
+        require=tuple(require),
+        forbid=tuple(forbid),
+    )
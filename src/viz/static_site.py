@@ -0,0 +1,246 @@
+"""Export the explainer as a static HTML site.
+
+Every Home.py sidebar section and every archived page is run once through
+Streamlit's ``AppTest`` harness, with widgets at their defaults, and the
+resulting element tree is converted to HTML: markdown is rendered, diagrams
+(already laid out to SVG by the render cache or bundle) become image assets::
+
+    python -m src.viz.static_site --out dist/site
+
+Assets are named by content hash (``assets/<name>.<hash>.<ext>``) so they can
+be cached forever; pages keep stable names. Every text file is precompressed
+next to itself as ``.gz`` and, when the ``brotli`` package is installed, ``.br``
+for servers that serve precompressed files (nginx ``gzip_static``, most CDNs).
+"""
+import argparse
+import base64
+import gzip
+import hashlib
+import html
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+import markdown as md_lib
+
+from src.sections import SECTIONS
+from src.utils.content import MARKDOWN_EXTENSIONS
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ARCHIVE_DIR = REPO_ROOT / "archive" / "pages_disabled"
+SITE_TITLE = "Vertex AI Pipelines Explainer"
+COMPRESSIBLE = {".html", ".css", ".svg", ".json", ".js"}
+CALLOUTS = {"info", "warning", "success", "error"}
+
+SITE_CSS = """
+body { margin: 0; display: flex; font-family: "Helvetica Neue", Helvetica, Arial, sans-serif; color: #0b1f44; }
+nav { width: 240px; flex-shrink: 0; padding: 24px 16px; background: #f0f2f6; min-height: 100vh; box-sizing: border-box; }
+nav h2 { font-size: 0.8rem; text-transform: uppercase; letter-spacing: 0.05em; color: #5a6478; }
+nav a { display: block; padding: 4px 0; color: #0b1f44; text-decoration: none; }
+nav a.current { font-weight: 700; }
+main { flex: 1; max-width: 1280px; padding: 40px 48px; }
+main img { max-width: 100%; height: auto; }
+.columns { display: flex; gap: 16px; }
+.columns > div { flex: 1; min-width: 0; }
+.caption { color: #5a6478; font-size: 0.9rem; }
+.callout { border-radius: 8px; padding: 12px 16px; margin: 12px 0; }
+.callout.info { background: #e8f0fe; } .callout.warning { background: #fff8e1; }
+.callout.success { background: #e8f5e9; } .callout.error { background: #fdecea; }
+pre { background: #f6f8fa; padding: 12px; border-radius: 8px; overflow-x: auto; }
+table { border-collapse: collapse; } th, td { border: 1px solid #d0d7de; padding: 4px 8px; }
+"""
+
+PAGE_TEMPLATE = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} · {site}</title>
+<link rel="stylesheet" href="{css}">
+</head>
+<body>
+<nav>{nav}</nav>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+class AssetWriter:
+    """Writes content-addressed assets once and remembers their site-relative paths."""
+
+    def __init__(self, out_dir: Path):
+        self.out_dir = out_dir
+        (out_dir / "assets").mkdir(parents=True, exist_ok=True)
+        self.written: Set[str] = set()
+
+    def add(self, stem: str, suffix: str, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        name = f"assets/{stem}.{digest}{suffix}"
+        if name not in self.written:
+            (self.out_dir / name).write_bytes(data)
+            self.written.add(name)
+        return name
+
+
+def _markdown(body: str) -> str:
+    return md_lib.markdown(body, extensions=list(MARKDOWN_EXTENSIONS))
+
+
+def _data_url_bytes(url: str) -> Tuple[str, bytes]:
+    header, _, payload = url.partition(",")
+    mime = header[len("data:"):].split(";")[0]
+    data = base64.b64decode(payload) if header.endswith(";base64") else unquote(payload).encode("utf-8")
+    return mime, data
+
+
+def _image_html(node, assets: AssetWriter) -> str:
+    parts = []
+    for img in node.proto.imgs:
+        if img.url.startswith("data:"):
+            mime, data = _data_url_bytes(img.url)
+            suffix = ".svg" if mime == "image/svg+xml" else "." + mime.split("/")[-1]
+            src = assets.add("diagram", suffix, data)
+        else:
+            src = img.url
+        caption = html.escape(img.caption)
+        parts.append(f'<figure><img src="{src}" alt="{caption or "diagram"}">'
+                     + (f"<figcaption>{caption}</figcaption>" if caption else "") + "</figure>")
+    return "".join(parts)
+
+
+def _node_html(node, assets: AssetWriter) -> str:
+    kind = node.type
+    if kind == "exception":
+        raise RuntimeError(node.proto.message)
+    if kind == "markdown":
+        return _markdown(node.proto.body)
+    if kind in ("title", "header", "subheader"):
+        tag = node.proto.tag or {"title": "h1", "header": "h2", "subheader": "h3"}[kind]
+        return f"<{tag}>{html.escape(node.proto.body)}</{tag}>"
+    if kind == "caption":
+        return f'<div class="caption">{_markdown(node.proto.body)}</div>'
+    if kind == "divider":
+        return "<hr>"
+    if kind == "code":
+        language = node.proto.language or "text"
+        return f'<pre><code class="language-{language}">{html.escape(node.proto.code_text)}</code></pre>'
+    if kind in CALLOUTS:
+        return f'<div class="callout {kind}">{_markdown(node.proto.body)}</div>'
+    if kind == "image":
+        return _image_html(node, assets)
+    if kind in ("table", "dataframe"):
+        return node.value.to_html(index=False, border=0)
+    if kind == "expander":
+        return f"<details><summary>{html.escape(node.proto.label)}</summary>{_children_html(node, assets)}</details>"
+    if kind == "tab":
+        return f"<section><h4>{html.escape(node.proto.label)}</h4>{_children_html(node, assets)}</section>"
+    if kind == "column":
+        return f"<div>{_children_html(node, assets)}</div>"
+    children = getattr(node, "children", None)
+    if isinstance(children, dict):
+        inner = _children_html(node, assets)
+        is_row = any(getattr(child, "type", None) == "column" for child in children.values())
+        return f'<div class="columns">{inner}</div>' if is_row else inner
+    # Widgets have no static equivalent; the export shows their default state.
+    return ""
+
+
+def _children_html(node, assets: AssetWriter) -> str:
+    return "\n".join(filter(None, (_node_html(child, assets) for child in node.children.values())))
+
+
+def _run_page(script: Path, section: Optional[str] = None):
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(script), default_timeout=120)
+    if section is not None:
+        app.session_state["section"] = section
+    app.run()
+    if app.exception:
+        raise RuntimeError(f"{script.name} ({section or 'default'}) failed: {app.exception[0].message}")
+    return app
+
+
+def _page_title(app, fallback: str) -> str:
+    titles = [node.proto.body for node in app.main.children.values() if getattr(node, "type", None) == "title"]
+    return titles[0] if titles else fallback
+
+
+def _pages() -> List[Tuple[str, str, Path, Optional[str]]]:
+    """``(file name, nav label, script, section)`` for every page of the site."""
+    pages = [
+        ("index.html" if module == "overview" else f"{module}.html", label, REPO_ROOT / "Home.py", label)
+        for label, module in SECTIONS.items()
+    ]
+    for script in sorted(ARCHIVE_DIR.glob("*.py")):
+        slug = script.stem.split("_", 1)[-1].lower()
+        pages.append((f"{slug}.html", slug.replace("_", " ").title(), script, None))
+    return pages
+
+
+def _nav(pages, current: str) -> str:
+    def link(name: str, label: str) -> str:
+        cls = ' class="current"' if name == current else ""
+        return f'<a href="{name}"{cls}>{html.escape(label)}</a>'
+
+    stage = "".join(link(name, label) for name, label, _, section in pages if section is not None)
+    other = "".join(link(name, label) for name, label, _, section in pages if section is None)
+    return f"<h2>Stage pages</h2>{stage}<h2>Explainer pages</h2>{other}"
+
+
+def precompress(out_dir: Path) -> int:
+    """Write ``.gz`` (and ``.br`` if available) next to every text file; return files written."""
+    written = 0
+    for path in sorted(out_dir.rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE:
+            continue
+        data = path.read_bytes()
+        encoded = [(".gz", gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            encoded.append((".br", brotli.compress(data, quality=11)))
+        for suffix, payload in encoded:
+            if len(payload) < len(data):
+                path.with_name(path.name + suffix).write_bytes(payload)
+                written += 1
+    return written
+
+
+def export_site(out_dir: Path) -> List[str]:
+    """Render every page into ``out_dir``; return the page file names."""
+    out_dir = Path(out_dir)
+    assets = AssetWriter(out_dir)
+    css = assets.add("site", ".css", SITE_CSS.encode("utf-8"))
+    pages = _pages()
+
+    for name, label, script, section in pages:
+        app = _run_page(script, section)
+        page = PAGE_TEMPLATE.format(
+            title=html.escape(_page_title(app, label) if section is None else label),
+            site=SITE_TITLE,
+            css=css,
+            nav=_nav(pages, name),
+            body=_children_html(app.main, assets),
+        )
+        (out_dir / name).write_text(page, encoding="utf-8")
+    precompress(out_dir)
+    return [name for name, *_ in pages]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Export the explainer as a static HTML site.")
+    parser.add_argument("--out", default="dist/site", help="site output directory")
+    args = parser.parse_args(argv)
+    pages = export_site(Path(args.out))
+    print(f"Wrote {len(pages)} pages to {args.out}" + ("" if brotli else " (gzip only; install brotli for .br)"))
+
+
+if __name__ == "__main__":
+    main()
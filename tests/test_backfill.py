@@ -0,0 +1,48 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from src.pipelines.backfill import _bounds, partition_starts, plan_backfill
+
+
+def _next_fit(sizes, max_bytes, max_items):
+    ends, start, total = [], 0, 0.0
+    for i, size in enumerate(sizes):
+        if i > start and ((max_bytes is not None and total + size > max_bytes) or (max_items and i - start == max_items)):
+            ends.append(i)
+            start, total = i, 0.0
+        total += size
+    return ends + [len(sizes)] if len(sizes) else []
+
+
+@pytest.mark.parametrize("max_bytes", [None, 1.0, 2.5, 100.0])
+@pytest.mark.parametrize("max_items", [None, 1, 4])
+def test_bounds_is_next_fit(max_bytes, max_items):
+    sizes = np.random.default_rng(0).random(500) * 2
+    assert _bounds(sizes, max_bytes, max_items).tolist() == _next_fit(sizes, max_bytes, max_items)
+
+
+def test_month_partitions_start_at_start_and_cover_the_end():
+    starts = partition_starts("2023-01-15", "2023-03-10", "month")
+    assert np.datetime_as_string(starts).tolist() == ["2023-01-15", "2023-02-01", "2023-03-01"]
+
+
+def test_hour_partitions_clamp_to_start():
+    starts = partition_starts(datetime.datetime(2023, 1, 1, 10, 30), datetime.datetime(2023, 1, 1, 12), "hour")
+    assert np.datetime_as_string(starts, unit="m").tolist() == ["2023-01-01T10:30", "2023-01-01T11:00"]
+
+
+def test_aligned_and_empty_ranges():
+    assert len(partition_starts("2023-01-01", "2024-01-01", "month")) == 12
+    assert len(partition_starts("2023-01-01", "2023-01-02", "hour")) == 24
+    assert len(partition_starts("2023-01-15", "2023-01-15", "month")) == 0
+    assert plan_backfill("2023-01-15", "2023-01-15", "month").records() == []
+
+
+def test_plan_respects_limits():
+    plan = plan_backfill("2023-01-01", "2024-01-01", "day", sizes=2**30, batch_bytes=10 * 2**30, concurrency=4)
+    assert plan.n_partitions == 365
+    assert plan.batch_bytes().max() <= 10 * 2**30
+    assert plan.n_batches == 37 and plan.n_waves == 10
+    assert plan.batch_labels()[0] == "2023-01-01 … 2023-01-10"
@@ -0,0 +1,42 @@
+import pytest
+
+from src.pipelines.catalog import PipelineCatalog, builtin_entries
+
+GOOD = """
+name: Nightly orders
+steps:
+  - {id: Extract, annotation: CustomJob}
+  - {id: Load, annotation: BigQuery MERGE}
+edges: [[Extract, Load]]
+"""
+
+
+def test_from_dir_skips_bad_files_with_a_warning(tmp_path):
+    (tmp_path / "good.catalog.yaml").write_text(GOOD)
+    (tmp_path / "broken.catalog.yaml").write_text("name: [unclosed\n")
+    (tmp_path / "nosteps.catalog.json").write_text('{"name": "No steps"}')
+    (tmp_path / "again.catalog.yaml").write_text(GOOD)
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    with pytest.warns(UserWarning, match="Skipping catalog file"):
+        catalog = PipelineCatalog.from_dir(tmp_path, builtin_entries())
+
+    assert "Nightly orders" in catalog
+    assert ("Nightly orders", "Load") in catalog.steps_with_annotation("bigquery merge")
+    skipped = {path.name: reason for path, reason in catalog.skipped}
+    assert set(skipped) == {"broken.catalog.yaml", "nosteps.catalog.json", "good.catalog.yaml"}
+    assert "Duplicate pipeline name" in skipped["good.catalog.yaml"]
+
+
+def test_search_without_matches_is_empty():
+    catalog = PipelineCatalog(builtin_entries())
+    assert catalog.search("no-such-pipeline-anywhere") == []
+    assert catalog.search("") == catalog.names()
+
+
+def test_from_dir_coerces_non_string_values(tmp_path):
+    (tmp_path / "numbers.catalog.yaml").write_text("name: Numbers\nsteps:\n  - {id: 1, annotation: 5, image: 2}\n")
+    catalog = PipelineCatalog.from_dir(tmp_path)
+    assert catalog.skipped == []
+    assert catalog.steps_with_annotation("5") == [("Numbers", "1")]
+    assert catalog.steps_with_image("2") == [("Numbers", "1")]
@@ -0,0 +1,19 @@
+from src.models import PipelineDef, Step
+from src.pipelines.diff import diff_pipelines, step_signature
+
+
+def test_signature_is_the_compared_fields():
+    step = Step("Load", "Write rows", annotation="BigQuery", image="gcr.io/x/load:1")
+    assert step_signature(step) == ("Write rows", "BigQuery", "gcr.io/x/load:1", None)
+    assert step_signature(step) == step_signature(Step("Other", "Write rows", annotation="BigQuery", image="gcr.io/x/load:1"))
+
+
+def test_rename_change_and_edges():
+    old = PipelineDef("p", [Step("Extract", "pull"), Step("Clean", "dedup"), Step("Load", "write", annotation="BQ")],
+                      [("Extract", "Clean"), ("Clean", "Load")])
+    new = PipelineDef("p", [Step("Extract", "pull"), Step("Dedup", "dedup"), Step("Load", "write", annotation="GCS")],
+                      [("Extract", "Dedup"), ("Dedup", "Load")])
+    diff = diff_pipelines(old, new)
+    assert diff.renamed_steps == [("Clean", "Dedup")]
+    assert diff.changed_steps == ["Load"]
+    assert (diff.added_steps, diff.removed_steps, diff.added_edges, diff.removed_edges) == ([], [], [], [])
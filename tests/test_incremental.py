@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from src.pipelines.incremental import STRATEGIES, UpsertTable, compare, simulate
+
+
+def test_upsert_is_last_write_wins_and_idempotent():
+    table = UpsertTable(4)
+    batch = {
+        "key": np.array([1, 1, 2]),
+        "event_time": np.array([5.0, 3.0, 1.0]),
+        "seq": np.array([0, 1, 2]),
+        "value": np.array([10.0, 20.0, 30.0]),
+    }
+    assert table.upsert(batch) == 2
+    assert table.value[[1, 2]].tolist() == [10.0, 30.0]
+    assert table.upsert(batch) == 0
+    assert len(table) == 2
+
+
+def test_strategies_end_with_the_same_table():
+    results = compare(60_000, keys=2_000, rate_per_s=50.0, late_fraction=0.05, max_late_s=900.0, replay_every=5, seed=1)
+    assert [r.strategy for r in results] == list(STRATEGIES)
+    first = results[0].table
+    for r in results[1:]:
+        assert np.array_equal(r.table.seq, first.seq)
+    by = {r.strategy: r for r in results}
+    assert by["arrival"].late_rows == 0 and by["arrival"].reprocessed_rows == 0
+    assert by["event_time"].late_rows > by["lookback"].late_rows > 0
+    assert all(r.events == 60_000 for r in results)
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError, match="Unknown watermark strategy"):
+        simulate(iter(()), "processing_time", keys=1)
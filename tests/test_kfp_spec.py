@@ -0,0 +1,102 @@
+import io
+
+import pytest
+
+from src.pipelines.kfp_spec import load_pipeline_spec
+
+SPEC = b"""
+pipelineInfo:
+  name: train-pipeline
+root:
+  dag:
+    tasks:
+      ingest:
+        componentRef: {name: comp-ingest}
+      loop:
+        componentRef: {name: comp-loop}
+        dependentTasks: [ingest]
+        parameterIterator: {itemInput: shard}
+      report:
+        componentRef: {name: comp-report}
+        dependentTasks: [loop]
+components:
+  comp-ingest:
+    executorLabel: exec-ingest
+    inputDefinitions: {parameters: {uri: {parameterType: STRING}}}
+  comp-train:
+    executorLabel: exec-train
+  comp-report:
+    executorLabel: exec-report
+  comp-loop:
+    dag:
+      tasks:
+        train:
+          componentRef: {name: comp-train}
+deploymentSpec:
+  executors:
+    exec-ingest:
+      container:
+        image: gcr.io/proj/ingest@sha256:abc
+        command: [python, -c, "print('ingest')"]
+    exec-train:
+      container: {image: gcr.io/proj/train:1.2}
+    exec-report:
+      importer: {artifactUri: {constant: gs://bucket/report}}
+"""
+
+
+def test_tasks_subdags_and_dependencies():
+    p = load_pipeline_spec(io.BytesIO(SPEC))
+    assert p.name == "train-pipeline"
+    steps = {s.id: s for s in p.steps}
+    assert set(steps) == {"ingest", "loop", "loop/train", "report"}
+    assert steps["loop"].annotation == "ParallelFor"
+    assert steps["loop/train"].group == "loop"
+    assert set(p.edges) == {("ingest", "loop"), ("loop", "loop/train"), ("loop/train", "report")}
+
+
+def test_executor_label_is_annotation_and_image_is_kept():
+    steps = {s.id: s for s in load_pipeline_spec(io.BytesIO(SPEC)).steps}
+    assert (steps["ingest"].annotation, steps["ingest"].image) == ("exec-ingest", "gcr.io/proj/ingest@sha256:abc")
+    assert (steps["loop/train"].annotation, steps["loop/train"].image) == ("exec-train", "gcr.io/proj/train:1.2")
+    assert (steps["report"].annotation, steps["report"].image) == ("exec-report", None)
+
+
+def test_self_referencing_subdag_raises():
+    spec = b"""
+root:
+  dag:
+    tasks:
+      outer: {componentRef: {name: comp-a}}
+components:
+  comp-a:
+    dag:
+      tasks:
+        inner: {componentRef: {name: comp-b}}
+  comp-b:
+    dag:
+      tasks:
+        back: {componentRef: {name: comp-a}}
+"""
+    with pytest.raises(ValueError, match="comp-a"):
+        load_pipeline_spec(io.BytesIO(spec))
+
+
+def test_same_subdag_used_twice_is_not_a_cycle():
+    spec = b"""
+root:
+  dag:
+    tasks:
+      first: {componentRef: {name: comp-sub}}
+      second: {componentRef: {name: comp-sub}, dependentTasks: [first]}
+components:
+  comp-sub:
+    dag:
+      tasks:
+        leaf: {componentRef: {name: comp-leaf}}
+  comp-leaf:
+    executorLabel: exec-leaf
+"""
+    p = load_pipeline_spec(io.BytesIO(spec))
+    assert {s.id for s in p.steps} == {"first", "first/leaf", "second", "second/leaf"}
+    assert ("first/leaf", "second") in p.edges
@@ -0,0 +1,25 @@
+from src.models import PipelineDef, Step
+from src.viz.lod import LodRenderer, build_lod_graph
+from src.viz.render_cache import cache_key
+
+
+def _grouped():
+    steps = [Step("loop"), Step("a", group="loop"), Step("b", group="loop"), Step("end")]
+    return PipelineDef(name="grouped", steps=steps, edges=[("a", "b"), ("b", "end")])
+
+
+def test_collapsed_group_is_one_node():
+    lod = LodRenderer(_grouped())
+    body = "".join(build_lod_graph(lod).body)
+    assert "loop ->" in body or '"loop" ->' in body
+    assert "a ->" not in body
+    expanded = "".join(build_lod_graph(lod, ["loop"]).body)
+    assert "cluster_loop" in expanded
+
+
+def test_cache_key_tells_views_and_renderers_apart():
+    p = _grouped()
+    key = cache_key(build_lod_graph, LodRenderer(p), ["loop"])
+    assert key == cache_key(build_lod_graph, LodRenderer(_grouped()), ["loop"])
+    assert key != cache_key(build_lod_graph, LodRenderer(p), [])
+    assert key != cache_key(build_lod_graph, LodRenderer(p, annotated=True), ["loop"])
@@ -0,0 +1,17 @@
+from src.models import PipelineDef, Step
+
+
+def test_step_coerces_and_interns_values():
+    step = Step("Load", annotation=5, image=1.4, group=None)
+    assert (step.annotation, step.image, step.group) == ("5", "1.4", None)
+    assert step.annotation is Step("Other", annotation="5").annotation
+    assert Step("Load", annotation="").annotation == ""
+
+
+def test_compact_keeps_equality_and_hash():
+    p = PipelineDef("p", [Step("a"), Step("b"), Step("c")], [("a", "b"), ("b", "c")])
+    compact = p.compact()
+    assert compact == p
+    assert compact.content_hash == p.content_hash
+    assert list(compact.edges) == [("a", "b"), ("b", "c")]
+    assert compact.index.topological_order() == p.index.topological_order()
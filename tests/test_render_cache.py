@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from benchmarks.synthetic import chain
+from src.viz import render_cache
+from src.viz.graphviz_dag import build_graph
+from src.viz.render_cache import RenderCache, cache_key
+
+
+def test_cache_key_depends_on_arguments_and_renderer_version(monkeypatch):
+    p = chain(3)
+    key = cache_key(build_graph, p, True)
+    assert key == cache_key(build_graph, chain(3), True)
+    assert key != cache_key(build_graph, p, False)
+    monkeypatch.setattr(render_cache, "RENDERER_VERSION", "0" * 12)
+    assert key != cache_key(build_graph, p, True)
+
+
+def test_disk_cache_misses_after_renderer_change(tmp_path, monkeypatch):
+    def builder(n: int) -> str:
+        return f"<svg>{n}</svg>"
+
+    RenderCache(disk_dir=tmp_path).render(builder, 1)
+    fresh = RenderCache(disk_dir=tmp_path)
+    fresh.render(builder, 1)
+    assert (fresh.hits, fresh.misses) == (1, 0)
+    monkeypatch.setattr(render_cache, "RENDERER_VERSION", "0" * 12)
+    fresh.clear()
+    fresh.render(builder, 1)
+    assert fresh.misses == 1
+
+
+def _write_bundle(bundle_dir, renderer):
+    (bundle_dir / "svg").mkdir(parents=True)
+    (bundle_dir / "svg" / "a.svg").write_bytes(b"<svg/>")
+    manifest = {"version": render_cache.MANIFEST_VERSION, "renderer": renderer, "entries": {"k": "svg/a.svg"}}
+    (bundle_dir / render_cache.MANIFEST_NAME).write_text(json.dumps(manifest))
+
+
+def test_load_bundle_ignores_other_renderer_versions(tmp_path):
+    _write_bundle(tmp_path / "current", render_cache.RENDERER_VERSION)
+    _write_bundle(tmp_path / "stale", "0" * 12)
+    cache = RenderCache()
+    with pytest.warns(UserWarning, match="Ignoring diagram bundle"):
+        assert cache.load_bundle(tmp_path / "stale") == 0
+    assert cache.get("k") is None
+    assert cache.load_bundle(tmp_path / "current") == 1
+    assert cache.get("k") == b"<svg/>"
+
+
+def test_pipeline_svg_falls_back_to_layered_without_dot(monkeypatch):
+    from src.viz.graphviz_dag import pipeline_svg
+
+    monkeypatch.setenv("PATH", "")
+    monkeypatch.setattr(render_cache, "DEFAULT_CACHE", RenderCache())
+    svg = pipeline_svg(chain(3), False, engine="dot").decode("utf-8")
+    assert svg.lstrip().startswith("<svg") and "step-2" in svg
@@ -0,0 +1,61 @@
+import io
+import shutil
+
+import numpy as np
+
+from src.ops import run_history
+from src.ops.run_history import QUANTILES, _grouped_quantiles, run_stats
+
+CSV = b"""pipeline,status,duration_s,end_time
+etl,SUCCEEDED,10,2024-01-01T00:00:00Z
+etl,FAILED,99,2024-01-01T01:00:00Z
+etl,SUCCEEDED,30,2024-01-01T02:00:00Z
+ml,SUCCEEDED,5,2024-01-01T03:00:00Z
+"""
+
+
+def _upload(data: bytes, name: str = "runs.csv") -> io.BytesIO:
+    upload = io.BytesIO(data)
+    upload.name = name
+    return upload
+
+
+def test_grouped_quantiles_match_numpy():
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 50, 20_000)
+    values = rng.exponential(60, 20_000)
+    got = _grouped_quantiles(codes, values, 52, QUANTILES)
+    for row, q in enumerate(QUANTILES):
+        expected = [np.quantile(values[codes == g], q) if (codes == g).any() else np.nan for g in range(52)]
+        np.testing.assert_allclose(got[row], expected)
+
+
+def test_run_stats(tmp_path):
+    stats = run_stats(_upload(CSV), cache_dir=tmp_path)
+    assert stats.names == ["etl", "ml"]
+    assert stats.runs.tolist() == [3, 1]
+    assert stats.p50_s.tolist() == [20.0, 5.0]
+    np.testing.assert_allclose(stats.failure_rate, [1 / 3, 0.0])
+
+
+def test_run_stats_fingerprints_once_and_stays_bounded(tmp_path, monkeypatch):
+    calls = []
+    fingerprint = run_history.fingerprint
+    monkeypatch.setattr(run_history, "fingerprint", lambda source: calls.append(source) or fingerprint(source))
+    monkeypatch.setattr(run_history, "STATS_CACHE_SIZE", 2)
+    monkeypatch.setattr(run_history, "_STATS_CACHE", type(run_history._STATS_CACHE)())
+    for i in range(4):
+        run_stats(_upload(CSV + f"ml,SUCCEEDED,{i},2024-01-02T00:00:00Z\n".encode()), cache_dir=tmp_path)
+    assert len(calls) == 4
+    assert len(run_history._STATS_CACHE) == 2
+
+
+def test_lost_cache_race_removes_temp_dir(tmp_path, monkeypatch):
+    def other_process_wins(src, dst):
+        shutil.copytree(src, dst)
+        raise OSError("Directory not empty")
+
+    monkeypatch.setattr(run_history.os, "replace", other_process_wins)
+    table = run_history.load_runs(_upload(CSV), cache_dir=tmp_path)
+    assert table.names == ["etl", "ml"]
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
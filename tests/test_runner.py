@@ -0,0 +1,83 @@
+import functools
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from src.models import PipelineDef, Step
+from src.pipelines.runner import CACHED, FAILED, SUCCEEDED, UPSTREAM_FAILED, RunCache, Task, run_pipeline
+from src.pipelines.timing import load_step_metrics
+
+
+def _pipeline(*edges):
+    ids = sorted({s for e in edges for s in e})
+    return PipelineDef(name="p", steps=[Step(i) for i in ids], edges=list(edges))
+
+
+def _slow_first_call(marker: Path, inputs):
+    calls = int(marker.read_text()) + 1 if marker.exists() else 1
+    marker.write_text(str(calls))
+    if calls == 1:
+        time.sleep(3)
+    return calls
+
+
+def test_retry_after_timeout_runs_again_on_a_single_worker(tmp_path):
+    marker = tmp_path / "calls"
+    task = Task(fn=functools.partial(_slow_first_call, marker), retries=2, timeout_s=0.5)
+    start = time.perf_counter()
+    result = run_pipeline(_pipeline(("a", "b")), {"a": task}, max_workers=1)
+    assert time.perf_counter() - start < 2.5
+    run = result.steps["a"]
+    assert (run.status, run.attempts, run.output) == (SUCCEEDED, 2, 2)
+    assert marker.read_text() == "2"
+    assert result.ok
+
+
+def test_failure_marks_downstream_upstream_failed():
+    def boom(inputs):
+        raise RuntimeError("no")
+
+    result = run_pipeline(_pipeline(("a", "b"), ("c", "d")), {"a": boom, "c": lambda inputs: 1, "d": lambda inputs: inputs["c"] + 1})
+    assert result.steps["a"].status == FAILED
+    assert result.steps["a"].error == "RuntimeError: no"
+    assert result.steps["b"].status == UPSTREAM_FAILED
+    assert result.steps["d"].output == 2
+    assert not result.ok
+
+
+def test_string_binding_is_split_as_a_command():
+    result = run_pipeline(_pipeline(("a", "b")), {"a": "echo hello world"})
+    assert result.steps["a"].output == "hello world"
+    with pytest.raises(ValueError):
+        Task(cmd="true")
+
+
+def test_history_skips_steps_that_did_not_run(tmp_path):
+    cache = RunCache()
+    p = _pipeline(("a", "b"))
+    bindings = {"a": lambda inputs: 1, "b": Task(fn=lambda inputs: 2, cache=False)}
+    run_pipeline(p, bindings, cache=cache)
+    result = run_pipeline(p, bindings, cache=cache)
+    assert result.steps["a"].status == CACHED
+    history = result.write_history(tmp_path / "runs.jsonl")
+    assert [json.loads(line)["step"] for line in history.read_text().splitlines()] == ["b"]
+
+    history.write_text(
+        "\n".join(json.dumps(r) for r in (
+            {"step": "a", "duration_s": 4.0, "status": "succeeded"},
+            {"step": "a", "duration_s": 0.0, "status": "cached"},
+            {"step": "a", "duration_s": 0.0, "status": "upstream_failed"},
+        ))
+    )
+    assert load_step_metrics(history)["a"].duration_s == 4.0
+
+
+def test_unbound_steps_are_left_out_of_history_and_metrics(tmp_path):
+    p = _pipeline(("start", "work"), ("work", "end"))
+    result = run_pipeline(p, {"work": lambda inputs: 1})
+    assert result.ok and result.steps["start"].status == SUCCEEDED
+    assert set(result.metrics()) == {"work"}
+    history = result.write_history(tmp_path / "runs.jsonl")
+    assert [json.loads(line)["step"] for line in history.read_text().splitlines()] == ["work"]
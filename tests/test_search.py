@@ -0,0 +1,35 @@
+import time
+
+from benchmarks.synthetic import chain, diamonds
+from src.pipelines.search import PathMatch, SearchIndex
+
+
+def test_query_limit_stops_early_on_long_chain():
+    index = SearchIndex([chain(2000)])
+    start = time.perf_counter()
+    matches = index.query("* ->> *", limit=500)
+    assert len(matches) == 500
+    assert time.perf_counter() - start < 5
+    assert len(set(matches)) == 500
+
+
+def test_query_limit_returns_prefix_of_full_result():
+    index = SearchIndex([diamonds(20)])
+    full = index.query("* ->> *")
+    assert index.query("* ->> *", limit=7) == full[:7]
+    assert index.query("* -> *", limit=0) == []
+
+
+def test_direct_and_reachable_paths():
+    index = SearchIndex([chain(4)])
+    first, second, last = (s.id for s in (index.pipelines[0].steps[i] for i in (0, 1, 3)))
+    assert index.query(f"{first} -> {second}") == [PathMatch(index.pipelines[0].name, (first, second))]
+    assert index.query(f"{first} -> {last}") == []
+    assert index.query(f"{first} ->> {last}") == [PathMatch(index.pipelines[0].name, (first, last))]
+
+
+def test_bare_wildcard_matches_every_step():
+    index = SearchIndex([chain(3), diamonds(4)])
+    assert len(index.steps("*")) == 7
+    assert index.steps(" * ")[0] == ("chain-3", "step-0")
+    assert index.pipelines_with("*") == ["chain-3", "diamonds-4"]
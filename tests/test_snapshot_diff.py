@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+from src.pipelines.snapshot_diff import diff_frames, diff_snapshots, synthetic_snapshots
+
+
+def test_diff_frames_classifies_changes():
+    old, new = synthetic_snapshots(3000, change_rate=0.3, seed=1)
+    result = diff_frames(old, new, "id")
+    merged = old.merge(new, on="id", how="outer", suffixes=("_old", "_new"), indicator=True)
+    assert len(result["inserts"]) == (merged["_merge"] == "right_only").sum()
+    assert len(result["deletes"]) == (merged["_merge"] == "left_only").sum()
+    assert len(result["updates"]) == (
+        (merged["_merge"] == "both") & (merged["amount_old"] != merged["amount_new"])
+    ).sum()
+
+
+def test_diff_frames_rejects_duplicate_keys():
+    old = pd.DataFrame({"id": [1, 2, 2], "v": [1, 2, 3]})
+    with pytest.raises(ValueError, match="Duplicate key"):
+        diff_frames(old, old.drop_duplicates("id"), "id")
+
+
+def test_csv_chunks_share_the_first_chunk_dtypes(tmp_path):
+    # "amount" is float in each file's first chunk and integral afterwards; rows B and C swap chunks.
+    old = pd.DataFrame({"id": ["A", "B", "C", "D"], "amount": ["2.5", "3", "4", "5"]})
+    new = old.iloc[[0, 2, 1, 3]]
+    old.to_csv(tmp_path / "old.csv", index=False)
+    new.to_csv(tmp_path / "new.csv", index=False)
+    d = diff_snapshots(tmp_path / "old.csv", tmp_path / "new.csv", "id", tmp_path / "out", partitions=4, workers=1, chunk_rows=2)
+    assert (d.inserts, d.updates, d.deletes) == (0, 0, 0)
+
+
+def test_parquet_snapshots_round_trip(tmp_path):
+    old, new = synthetic_snapshots(5000, change_rate=0.06, seed=2)
+    old.to_parquet(tmp_path / "old.parquet", index=False)
+    new.to_parquet(tmp_path / "new.parquet", index=False)
+    d = diff_snapshots(tmp_path / "old.parquet", tmp_path / "new.parquet", "id", tmp_path / "out", partitions=8, workers=1)
+    expected = diff_frames(old, new, "id")
+    assert (d.inserts, d.updates, d.deletes) == tuple(len(expected[k]) for k in ("inserts", "updates", "deletes"))
+    assert sorted(d.read("updates")["id"]) == sorted(expected["updates"]["id"])
+
+
+def test_csv_snapshots_share_one_schema(tmp_path):
+    # "v" has a null only in the old snapshot: float64 there, int64 if the new file were inferred alone.
+    (tmp_path / "old.csv").write_text("id,v\nA,1\nB,\nC,3\n")
+    (tmp_path / "new.csv").write_text("id,v\nA,1\nC,3\n")
+    d = diff_snapshots(tmp_path / "old.csv", tmp_path / "new.csv", "id", tmp_path / "out", partitions=2, workers=1)
+    assert (d.inserts, d.updates, d.deletes) == (0, 0, 1)
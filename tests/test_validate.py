@@ -0,0 +1,28 @@
+from benchmarks.synthetic import chain
+from src.models import PipelineDef, Step
+from src.pipelines.validate import validate_pipeline
+
+
+def _codes(p):
+    return sorted(d.code for d in validate_pipeline(p).diagnostics)
+
+
+def test_clean_pipeline_has_no_diagnostics():
+    assert validate_pipeline(chain(50)).diagnostics == []
+
+
+def test_structural_problems_are_reported():
+    steps = [Step("a"), Step("b"), Step("c"), Step("d"), Step("a"), Step("lonely")]
+    edges = [("a", "b"), ("a", "b"), ("b", "ghost"), ("c", "d"), ("d", "c")]
+    p = PipelineDef("broken", steps, edges)
+    assert _codes(p) == ["cycle", "dangling-edge", "duplicate-edge", "duplicate-step", "orphan", "unreachable"]
+    report = validate_pipeline(p)
+    assert {d.code for d in report.errors} == {"cycle", "dangling-edge", "duplicate-step"}
+    cycle = next(d for d in report.errors if d.code == "cycle")
+    assert sorted(cycle.steps) == ["c", "d"]
+
+
+def test_long_cycle_does_not_recurse():
+    p = chain(20_000)
+    cyclic = PipelineDef("loop", p.steps, list(p.edges) + [(p.steps[-1].id, p.steps[0].id)])
+    assert [d.code for d in validate_pipeline(cyclic).errors] == ["cycle"]